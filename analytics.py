@@ -3,14 +3,18 @@ from ttkbootstrap.tableview import Tableview
 from ttkbootstrap.dialogs import Messagebox
 from ttkbootstrap.widgets import DateEntry
 from datetime import datetime
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
 import pandas as pd
+import analytics_cache
+import chart_renderer
 import db
+import task_stats
 
 
-def open_analytics(username, root):
+def open_analytics(username, root, user_id=None):
     """Open the full analytics dashboard window."""
+    if user_id is None:
+        user_id = db.get_user_id(username)
     win = ttk.Toplevel(root)
     win.title("Analytics Dashboard")
     win.geometry("950x650")
@@ -45,7 +49,8 @@ def open_analytics(username, root):
         master=table_frame,
         coldata=["Task Name", "Category", "Status", "Start", "Due"],
         rowdata=[],
-        paginated=False,
+        paginated=True,   # only one page of rows becomes Treeview items
+        pagesize=50,
         searchable=True,
         bootstyle="info",
         autofit=True,
@@ -57,28 +62,12 @@ def open_analytics(username, root):
     chart_frame = ttk.Frame(win)
     chart_frame.pack(fill="x", padx=20, pady=(0, 15))
 
-    chart_canvas = None
+    # one canvas for the window; filter changes update its bars in place
+    chart = chart_renderer.ChartSlot(chart_frame, figsize=(7.5, 3.5))
+    shown_key = None  # (data version, start, end) currently on screen
 
     def load_data():
-        nonlocal chart_canvas
-        table.delete_rows()  #  fixed: clear existing rows properly
-
-        conn = db.connect()
-        cursor = conn.cursor()
-        query = "SELECT title, category, status, start_date, due_date FROM tasks WHERE username=?"
-        cursor.execute(query, (username,))
-        rows = cursor.fetchall()
-        conn.close()
-
-        if not rows:
-            Messagebox.show_info("No data to display.")
-            return
-
-        df = pd.DataFrame(rows, columns=["Task Name", "Category", "Status", "Start", "Due"])
-
-        # Convert to datetime safely
-        for col in ["Start", "Due"]:
-            df[col] = pd.to_datetime(df[col], errors="coerce")
+        nonlocal shown_key
 
         # Apply date filters
         try:
@@ -88,81 +77,159 @@ def open_analytics(username, root):
             Messagebox.show_error("Invalid date format.")
             return
 
-        if s_date is not None:
-            df = df[df["Start"] >= s_date]
-        if e_date is not None:
-            df = df[df["Due"] <= e_date]
-
-        #  Add filtered data to table
-        for row in df.values.tolist():
-            table.insert_row(row)
+        version = analytics_cache.data_version(user_id)
+        if version is not None and shown_key == (version, s_date, e_date):
+            return  # same data, same filter: already on screen
+
+        # only the tasks inside the date range are read (filtered in SQL);
+        # typed frame: dates parsed once, Category/Status as Categoricals
+        df = analytics_cache.cached(
+            "analytics_frame", user_id, version,
+            lambda: load_tasks_frame(user_id, ["Title", "Category", "Status", "Start", "Due"],
+                                     start_from=s_date, due_until=e_date),
+            s_date, e_date
+        )
+        table.delete_rows()  #  fixed: clear existing rows properly
+        if df.empty and s_date is None and e_date is None:
+            Messagebox.show_info("No data to display.")
+            return
 
-        #  Chart section 
-        if chart_canvas:
-            chart_canvas.get_tk_widget().destroy()
+        rows, status_counts = analytics_cache.cached(
+            "analytics_table", user_id, version, lambda: table_view(df), s_date, e_date
+        )
 
-        fig = Figure(figsize=(7.5, 3.5), dpi=100)
-        ax = fig.add_subplot(111)
+        #  Add filtered data to table (rendered once, one page at a time)
+        for row in rows:
+            table.insert_row("end", row)
+        table.load_table_data()
 
-        status_counts = df["Status"].value_counts()
-        ax.bar(status_counts.index, status_counts.values)
-        ax.set_title("Task Distribution by Status", fontsize=10)
-        ax.set_ylabel("Count")
+        #  Chart section 
+        def draw(slot):
+            ax = slot.subplot("status", 111)
+            slot.bar("status", ax, [label for label, _ in status_counts],
+                     [count for _, count in status_counts])
+            ax.set_title("Task Distribution by Status", fontsize=10)
+            ax.set_ylabel("Count")
 
-        chart_canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-        chart_canvas.draw()
-        chart_canvas.get_tk_widget().pack(fill="x", expand=True)
+        chart.render(None if version is None else (version, s_date, e_date), draw)
+        chart.show(chart_frame, fill="x", expand=True)
+        shown_key = (version, s_date, e_date)
 
     # Initial data load
     load_data()
 
 
 #  Helper Functions 
+# typed task columns: (sql column, DataFrame column, kind)
+TASK_FRAME_COLUMNS = [
+    ("id", "ID", "int"),
+    ("user_id", "UserID", "int"),
+    ("username", "Username", "category"),
+    ("title", "Title", "text"),
+    ("start_date", "Start", "date"),
+    ("due_date", "Due", "date"),
+    ("status", "Status", "category"),
+    ("description", "Description", "text"),
+    ("priority", "Priority", "category"),
+    ("category", "Category", "category"),
+    ("estimated_minutes", "EstimatedMinutes", "int"),
+]
+
+# columns the statistics need (text columns stay in SQLite unless asked for)
+ANALYTICS_COLUMNS = ["Start", "Due", "Status", "Priority", "Category", "EstimatedMinutes"]
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def parse_dates(values):
+    """ISO 'YYYY-MM-DD' strings (optionally followed by a time) -> datetime64, NaT if invalid."""
+    return pd.to_datetime(pd.Series(values, dtype=object), format=DATE_FORMAT, exact=False, errors="coerce")
+
+
+def _typed_column(values, kind):
+    if kind == "int":
+        # None -> NaN -> 0 without a Python-level loop
+        return np.nan_to_num(np.array(values, dtype=float)).astype(np.int64)
+    if kind == "date":
+        return parse_dates(values).to_numpy()
+    if kind == "category":
+        return pd.Categorical(values)
+    return np.array(values, dtype=object)
+
+
+def _typed_frame(rows, names):
+    kinds = {name: kind for _, name, kind in TASK_FRAME_COLUMNS}
+    # one C-level copy into a 2-D object array, then typed column slices
+    # (much cheaper than zip(*rows) for a million tuples)
+    table = np.array(rows, dtype=object).reshape(len(rows), len(names))
+    return pd.DataFrame({name: _typed_column(table[:, i], kinds[name]) for i, name in enumerate(names)})
+
+
+def load_tasks_frame(user_id, columns=ANALYTICS_COLUMNS, start_from=None, due_until=None):
+    """
+    Read one user's tasks straight into a typed DataFrame: int64 ids and
+    minutes, datetime64 Start/Due parsed once with a fixed ISO format and
+    Status/Priority/Category as Categoricals. Only `columns` are selected.
+    start_from / due_until ('YYYY-MM-DD' or date, inclusive) are applied in
+    SQL on the ISO-stored dates, so only tasks in range are read.
+    """
+    sql_names = {name: col for col, name, _ in TASK_FRAME_COLUMNS}
+    start_from = db.normalize_date(start_from) if start_from else None
+    due_until = db.normalize_date(due_until) if due_until else None
+    sql, params = task_stats.tasks_range_sql(
+        user_id, [sql_names[name] for name in columns], start_from, due_until,
+        narrower=task_stats.narrower_bound(user_id, start_from, due_until))
+    with db.connect() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return _typed_frame(rows, columns)
+
+
 def build_tasks_dataframe(rows):
     """
-    Convert task rows to a clean pandas DataFrame.
+    Convert task rows to a typed pandas DataFrame (see load_tasks_frame).
     Accepts either the older (title, start, due, status) rows or the full rows.
     """
-    if not rows:
-        return pd.DataFrame(columns=["Title", "Start", "Due", "Status"])
-
-    first = rows[0]
-    if len(first) == 4:
-        df = pd.DataFrame(rows, columns=["Title", "Start", "Due", "Status"])
-    else:
-        df = pd.DataFrame(rows, columns=[
-            "ID", "UserID", "Username", "Title", "Start", "Due",
-            "Status", "Description", "Priority", "Category", "EstimatedMinutes"
-        ])
-        df = df.rename(columns={"Title": "Title", "Start": "Start", "Due": "Due", "Status": "Status"})
-
-    # Convert date columns safely
-    for col in ["Start", "Due"]:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce")
-    return df
+    names = ["Title", "Start", "Due", "Status"]
+    if rows and len(rows[0]) != 4:
+        names = [name for _, name, _ in TASK_FRAME_COLUMNS]
+    return _typed_frame(rows, names)
+
+
+def table_view(df):
+    """
+    Rows of the open_analytics table (dates as 'YYYY-MM-DD' strings) and
+    [(status, count), ...] for a frame from load_tasks_frame.
+    """
+    shown = df.astype({"Category": object, "Status": object}).assign(
+        Start=df["Start"].dt.strftime("%Y-%m-%d"), Due=df["Due"].dt.strftime("%Y-%m-%d")
+    ).fillna("")
+    status_counts = df["Status"].value_counts()
+    status_counts = status_counts[status_counts > 0]  # Categoricals count unused labels as 0
+    return shown.values.tolist(), [(str(label), int(count)) for label, count in status_counts.items()]
 
 
 def compute_stats(df):
-    """Compute overall task statistics safely."""
-    stats = {
-        "total": len(df),
-        "completed": int((df["Status"].astype(str).str.lower() == "completed").sum()) if "Status" in df.columns else 0,
-        "in_progress": int((df["Status"].astype(str).str.lower() == "in progress").sum()) if "Status" in df.columns else 0,
-        "overdue": int((df["Status"].astype(str).str.lower() == "overdue").sum()) if "Status" in df.columns else 0
-    }
-
-    # Compute monthly counts safely
+    """
+    Overall task statistics in one vectorized pass per column.
+    Status is counted per distinct value (per category code for a
+    Categorical) and only those few labels are normalized.
+    """
+    stats = {"total": len(df), "completed": 0, "in_progress": 0, "overdue": 0}
+    if "Status" in df.columns:
+        counts = df["Status"].value_counts()
+        labels = pd.Index(counts.index.astype(str)).str.strip().str.lower()
+        counts = counts.groupby(labels).sum()
+        stats["completed"] = int(counts.get("completed", 0))
+        stats["in_progress"] = int(counts.get("in progress", 0))
+        stats["overdue"] = int(counts.get("overdue", 0))
+
+    stats["monthly_counts"] = pd.Series([], dtype=int)
     if "Start" in df.columns:
-        try:
-            df["Start"] = pd.to_datetime(df["Start"], errors="coerce")
-            if df["Start"].notna().any():
-                stats["monthly_counts"] = df.groupby(df["Start"].dt.to_period("M")).size()
-            else:
-                stats["monthly_counts"] = pd.Series([], dtype=int)
-        except Exception:
-            stats["monthly_counts"] = pd.Series([], dtype=int)
-    else:
-        stats["monthly_counts"] = pd.Series([], dtype=int)
-
+        start = df["Start"]
+        if not pd.api.types.is_datetime64_any_dtype(start):
+            start = parse_dates(start)
+        months = start.dropna().to_numpy().astype("datetime64[M]")
+        if len(months):
+            uniq, counts = np.unique(months, return_counts=True)
+            stats["monthly_counts"] = pd.Series(counts, index=pd.DatetimeIndex(uniq).to_period("M"))
     return stats
@@ -0,0 +1,63 @@
+"""
+Memoized analytics results.
+Entries are keyed on the user's task data version (db.get_data_version),
+which every task write bumps, so an unchanged dataset is served from
+memory and any change simply misses. Old versions age out of the LRU.
+Focus totals are keyed on the separate focus version (db.get_focus_version)
+instead, so timer flushes do not invalidate task results.
+"""
+import db
+from lru import LRUCache
+
+#  SETTINGS
+ANALYTICS_CACHE_SIZE = 32
+
+results = LRUCache(ANALYTICS_CACHE_SIZE)
+
+_MISSING = object()
+
+
+def data_version(user_id):
+    return db.get_data_version(user_id)
+
+
+def focus_version(user_id):
+    return db.get_focus_version(user_id)
+
+
+def cached(kind, user_id, version, compute, *key):
+    """
+    Return the memoized compute() for (kind, user_id, version, *key),
+    computing and storing it on a miss. version=None (unknown) bypasses
+    the cache.
+    """
+    if version is None:
+        return compute()
+    cache_key = (kind, user_id, version) + key
+    value = results.get(cache_key, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        results.put(cache_key, value)
+    return value
+
+
+def lookup(kind, user_id, version, *key):
+    """Memoized value or None (for results that must be built on the Tk thread)."""
+    if version is None:
+        return None
+    return results.get((kind, user_id, version) + key)
+
+
+def store(kind, user_id, version, value, *key):
+    if version is not None:
+        results.put((kind, user_id, version) + key, value)
+    return value
+
+
+def forget_user(user_id):
+    """Drop every cached result of one user (e.g. after deleting the account)."""
+    results.discard(lambda key: key[1] == user_id)
+
+
+def cache_stats():
+    return results.stats()
@@ -0,0 +1,252 @@
+"""
+Avatar thumbnails.
+Resized (and optionally greyscaled) avatars are kept decoded in an LRU
+keyed by (filename, size, greyscale). Misses are served, in order, from
+- the atlas for that size: every avatar pre-scaled into one PNG per
+  ATLAS_SIZES entry plus a JSON index (build_atlases), so a whole avatar
+  grid costs one file read and one decode;
+- a per-thumbnail PNG in THUMB_DIR whose name carries the source mtime;
+- the full-size source, resampled (and written as such a PNG).
+Everything here is PIL only (no Tk), so it is safe off the main thread.
+
+    python avatar_cache.py --build-atlas   # (re)build the atlases
+"""
+import glob
+import json
+import math
+import os
+import sys
+import threading
+
+from PIL import Image, ImageOps
+
+from lru import LRUCache
+
+#  SETTINGS
+AVATAR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "avatars")
+THUMB_DIR = os.path.join(AVATAR_DIR, ".thumbs")
+THUMB_CACHE_SIZE = 64
+ATLAS_SIZES = (28, 72, 96, 120)   # topbar, Rewards grid, Settings grid, Rewards preview
+ATLAS_INDEX = "atlas.json"        # in THUMB_DIR, next to atlas_<size>.png
+
+# (filename, (w, h), greyscale) -> (source mtime_ns, PIL image)
+thumbnails = LRUCache(THUMB_CACHE_SIZE)
+
+_counts = {"atlas_hits": 0, "disk_hits": 0, "renders": 0}
+_counts_lock = threading.Lock()
+
+
+def _count(key):
+    with _counts_lock:
+        _counts[key] += 1
+
+
+def _thumb_name(filename, size, greyscale):
+    stem = os.path.splitext(filename)[0]
+    return f"{stem}_{size[0]}x{size[1]}{'_grey' if greyscale else ''}"
+
+
+def _render(source, size, greyscale):
+    img = Image.open(source).convert("RGBA")
+    img = img.resize(size, Image.LANCZOS)
+    if greyscale:
+        img = ImageOps.grayscale(img).convert("RGBA")
+    return img
+
+
+def _read_thumb(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with Image.open(path) as img:
+            img.load()
+            return img.convert("RGBA") if img.mode != "RGBA" else img.copy()
+    except Exception as e:
+        print(f"[avatar_cache] unreadable thumbnail {path}: {e}")
+        return None
+
+
+def _write_thumb(path, img, stale_pattern):
+    try:
+        os.makedirs(THUMB_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        img.save(tmp, format="PNG")
+        os.replace(tmp, path)
+        # thumbnails of older versions of the same source
+        for old in glob.glob(stale_pattern):
+            if old != path:
+                os.remove(old)
+    except Exception as e:
+        print(f"[avatar_cache] could not write {path}: {e}")
+
+
+#  ATLASES
+_atlas = {"index": None, "sheets": {}}   # parsed atlas.json, size -> decoded atlas image
+_atlas_lock = threading.Lock()
+
+
+def _source_stamp(filename):
+    st = os.stat(os.path.join(AVATAR_DIR, filename))
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _atlas_index():
+    with _atlas_lock:
+        if _atlas["index"] is None:
+            try:
+                with open(os.path.join(THUMB_DIR, ATLAS_INDEX), "r") as f:
+                    _atlas["index"] = json.load(f)
+            except (OSError, ValueError):
+                _atlas["index"] = {}
+        return _atlas["index"]
+
+
+def _atlas_sheet(side, entry):
+    with _atlas_lock:
+        sheet = _atlas["sheets"].get(side)
+        if sheet is None:
+            with Image.open(os.path.join(THUMB_DIR, entry["file"])) as img:
+                sheet = _atlas["sheets"][side] = img.convert("RGBA")
+        return sheet
+
+
+def _from_atlas(filename, size, stamp):
+    """The avatar cut from its size's atlas, or None if there is no current atlas cell."""
+    if size[0] != size[1]:
+        return None
+    index = _atlas_index()
+    entry = index.get("atlases", {}).get(str(size[0]))
+    if not entry or filename not in entry["cells"] or index.get("sources", {}).get(filename) != stamp:
+        return None
+    try:
+        sheet = _atlas_sheet(size[0], entry)
+    except Exception as e:
+        print(f"[avatar_cache] unreadable atlas {entry['file']}: {e}")
+        return None
+    x, y = entry["cells"][filename]
+    return sheet.crop((x, y, x + size[0], y + size[1]))
+
+
+def _avatar_files():
+    # every avatar in AVATAR_DIR, which covers dashboard.AVATAR_UNLOCKS
+    return sorted(f for f in os.listdir(AVATAR_DIR) if f.lower().endswith(".png"))
+
+
+def build_atlases(filenames=None, sizes=ATLAS_SIZES):
+    """
+    Pack `filenames` (default: all avatars) into one atlas PNG per size
+    and write the index. Returns the number of atlases written.
+    """
+    filenames = sorted(filenames or _avatar_files())
+    columns = max(1, math.ceil(math.sqrt(len(filenames))))
+    rows = max(1, math.ceil(len(filenames) / columns))
+    index = {"sources": {}, "atlases": {}}
+    try:
+        os.makedirs(THUMB_DIR, exist_ok=True)
+        sources = {}
+        for name in filenames:
+            index["sources"][name] = _source_stamp(name)
+            with Image.open(os.path.join(AVATAR_DIR, name)) as img:
+                sources[name] = img.convert("RGBA")
+        for side in sizes:
+            sheet = Image.new("RGBA", (columns * side, rows * side))
+            cells = {}
+            for i, name in enumerate(filenames):
+                x, y = (i % columns) * side, (i // columns) * side
+                sheet.paste(sources[name].resize((side, side), Image.LANCZOS), (x, y))
+                cells[name] = [x, y]
+            file = f"atlas_{side}.png"
+            tmp = os.path.join(THUMB_DIR, f"{file}.{os.getpid()}.tmp")
+            sheet.save(tmp, format="PNG")
+            os.replace(tmp, os.path.join(THUMB_DIR, file))
+            index["atlases"][str(side)] = {"file": file, "cells": cells}
+        # index last: a half-written build is never referenced
+        path = os.path.join(THUMB_DIR, ATLAS_INDEX)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"[avatar_cache] build_atlases error: {e}")
+        return 0
+    with _atlas_lock:
+        _atlas["index"], _atlas["sheets"] = index, {}
+    thumbnails.clear()
+    print(f"[avatar_cache] {len(sizes)} atlas(es) of {len(filenames)} avatar(s) written to {THUMB_DIR}")
+    return len(sizes)
+
+
+def atlases_current(sizes=ATLAS_SIZES):
+    """True if there is an atlas for every size and no avatar was added or changed since."""
+    index = _atlas_index()
+    try:
+        sources = {name: _source_stamp(name) for name in _avatar_files()}
+    except OSError:
+        return False
+    return (index.get("sources") == sources
+            and all(str(side) in index.get("atlases", {}) for side in sizes))
+
+
+def ensure_atlases():
+    """Rebuild the atlases if they are missing or stale; True if current afterwards."""
+    return atlases_current() or bool(build_atlases())
+
+
+def get_thumbnail(filename, size=(64, 64), greyscale=False):
+    """
+    Resized RGBA PIL image of avatars/<filename>, or None if the file is
+    missing or unreadable. Memory first, then the atlas, the on-disk
+    thumbnail, and only then the full-size source.
+    """
+    size = tuple(size)
+    source = os.path.join(AVATAR_DIR, filename)
+    try:
+        stamp = _source_stamp(filename)
+    except OSError:
+        return None
+    mtime = stamp[1]
+
+    key = (filename, size, bool(greyscale))
+    cached = thumbnails.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    name = _thumb_name(filename, size, greyscale)
+    path = os.path.join(THUMB_DIR, f"{name}@{mtime}.png")
+    img = _from_atlas(filename, size, stamp)
+    if img is not None:
+        _count("atlas_hits")
+        if greyscale:
+            img = ImageOps.grayscale(img).convert("RGBA")
+    else:
+        img = _read_thumb(path)
+        if img is not None:
+            _count("disk_hits")
+        else:
+            try:
+                img = _render(source, size, greyscale)
+            except Exception as e:
+                print(f"[avatar_cache] could not load {filename}: {e}")
+                return None
+            _count("renders")
+            _write_thumb(path, img, os.path.join(THUMB_DIR, glob.escape(name) + "@*.png"))
+    thumbnails.put(key, (mtime, img))
+    return img
+
+
+def preload(filenames, sizes, greyscale=(False,)):
+    """Fill the cache for every filename x size x greyscale; returns how many are available."""
+    return sum(get_thumbnail(f, s, g) is not None
+               for f in filenames for s in sizes for g in greyscale)
+
+
+def cache_stats():
+    with _counts_lock:
+        return {**thumbnails.stats(), **_counts}
+
+
+if __name__ == "__main__":
+    if "--build-atlas" in sys.argv:
+        build_atlases()
+    else:
+        print(__doc__)
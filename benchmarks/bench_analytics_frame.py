@@ -0,0 +1,104 @@
+"""
+Analytics DataFrame for one user with 1M tasks: the old object-dtype
+build_tasks_dataframe + compute_stats vs. the typed loader
+(analytics.load_tasks_frame) + vectorized compute_stats.
+Reports wall time and DataFrame memory (deep).
+
+    python benchmarks/bench_analytics_frame.py [rows]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+import analytics  # noqa: E402
+import db  # noqa: E402
+import db_pool  # noqa: E402
+
+STATUSES = ["In Progress", "Completed", "Overdue"]
+PRIORITIES = ["Low", "Medium", "High"]
+CATEGORIES = ["Work", "Study", "Personal", "Other"]
+
+
+def populate(rows):
+    db.initialize_database()
+    db.insert_user("bench", "x")
+    uid = db.get_user_id("bench")
+    with db.connect() as conn:
+        batch = []
+        for i in range(rows):
+            month, day = 1 + i % 12, 1 + i % 28
+            batch.append((uid, "bench", f"task {i}", f"2024-{month:02}-{day:02}", f"2024-{month:02}-{day:02}",
+                          random.choice(STATUSES), random.choice(PRIORITIES), random.choice(CATEGORIES),
+                          random.randint(0, 120)))
+            if len(batch) == 50_000:
+                conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date, status, "
+                                 "priority, category, estimated_minutes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                batch.clear()
+        if batch:
+            conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date, status, "
+                             "priority, category, estimated_minutes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+    return uid
+
+
+# the pre-typed implementation, kept here as the baseline
+def legacy_dataframe(rows):
+    df = pd.DataFrame(rows, columns=[
+        "ID", "UserID", "Username", "Title", "Start", "Due",
+        "Status", "Description", "Priority", "Category", "EstimatedMinutes"
+    ])
+    df = df.rename(columns={"Title": "Title", "Start": "Start", "Due": "Due", "Status": "Status"})
+    for col in ["Start", "Due"]:
+        df[col] = pd.to_datetime(df[col], errors="coerce")
+    return df
+
+
+def legacy_stats(df):
+    stats = {
+        "total": len(df),
+        "completed": int((df["Status"].astype(str).str.lower() == "completed").sum()),
+        "in_progress": int((df["Status"].astype(str).str.lower() == "in progress").sum()),
+        "overdue": int((df["Status"].astype(str).str.lower() == "overdue").sum()),
+    }
+    df["Start"] = pd.to_datetime(df["Start"], errors="coerce")
+    stats["monthly_counts"] = df.groupby(df["Start"].dt.to_period("M")).size()
+    return stats
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_NAME = os.path.join(tmp, "bench.db")
+        print(f"populating {rows} tasks for one user...")
+        uid = populate(rows)
+
+        print("old: full rows -> object DataFrame")
+        df_old = timed("load + build_tasks_dataframe", lambda: legacy_dataframe(db.get_tasks_full_for_user(uid)))
+        old_stats = timed("compute_stats", lambda: legacy_stats(df_old))
+        old_mb = df_old.memory_usage(deep=True).sum() / 2**20
+
+        print("new: typed loader")
+        df_new = timed("load_tasks_frame", lambda: analytics.load_tasks_frame(uid))
+        new_stats = timed("compute_stats", lambda: analytics.compute_stats(df_new))
+        new_mb = df_new.memory_usage(deep=True).sum() / 2**20
+
+        print(f"  memory: {old_mb:.1f} MB -> {new_mb:.1f} MB")
+        same = all(old_stats[k] == new_stats[k] for k in ("total", "completed", "in_progress", "overdue"))
+        print(f"  same counts: {same and old_stats['monthly_counts'].equals(new_stats['monthly_counts'])}")
+        db_pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Analytics tab chart latency: the old path (new Figure + canvas + full
+draw on every visit) vs. chart_renderer (one canvas, artists updated in
+place, blitted when the layout holds).
+Uses FigureCanvasTkAgg when a display is available, otherwise the Agg
+canvas underneath it (same rendering, no Tk photo transfer).
+
+    python benchmarks/bench_chart_render.py [visits]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+import chart_renderer  # noqa: E402
+import dashboard  # noqa: E402
+
+
+def make_stats(seed):
+    rng = random.Random(seed)
+    first = date(2024, 1, 1)
+    due = [((first + timedelta(days=d)).isoformat(), rng.randint(1, 9)) for d in range(0, 365, 3)]
+    return {
+        "completed": rng.randint(200, 260), "in_progress": rng.randint(80, 120), "overdue": rng.randint(10, 30),
+        "monthly_counts": [(f"2024-{m:02}", rng.randint(30, 45)) for m in range(1, 13)],
+        "due_counts": due,
+    }
+
+
+def old_figure(stats):
+    # the previous dashboard._analytics_figure, built from scratch per visit
+    fig = Figure(figsize=(10, 4), dpi=100)
+    ax1, ax2, ax3 = fig.add_subplot(131), fig.add_subplot(132), fig.add_subplot(133)
+    ax1.bar([m for m, _ in stats["monthly_counts"]], [c for _, c in stats["monthly_counts"]])
+    ax1.set_title("Tasks per Month", fontsize=9)
+    ax1.tick_params(axis="x", rotation=45)
+    ax2.pie([stats["completed"], stats["in_progress"], stats["overdue"]],
+            labels=["Completed", "In Progress", "Overdue"], autopct="%1.1f%%", startangle=90)
+    ax2.set_title("Task Distribution", fontsize=9)
+    days = [datetime.strptime(d, "%Y-%m-%d") for d, _ in stats["due_counts"]]
+    totals, running = [], 0
+    for _, c in stats["due_counts"]:
+        running += c
+        totals.append(running)
+    ax3.plot(days, totals, marker="o")
+    ax3.set_title("Task Timeline", fontsize=9)
+    ax3.tick_params(axis="x", rotation=30)
+    return fig
+
+
+def timed(label, fn, runs):
+    start = time.perf_counter()
+    for i in range(runs):
+        fn(i)
+    print(f"  {label:<45} {(time.perf_counter() - start) / runs * 1000:9.1f} ms")
+
+
+def main():
+    visits = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    variants = [make_stats(seed) for seed in range(4)]
+
+    try:
+        import tkinter as tk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        root = tk.Tk()
+    except Exception:
+        root = None
+    if root is not None:
+        print("FigureCanvasTkAgg:")
+        canvas_class = FigureCanvasTkAgg
+
+        def settle():
+            root.update()
+    else:
+        print("no display, Agg canvas:")
+        canvas_class = FigureCanvasAgg
+
+        def settle():
+            pass
+
+    def old_visit(i):
+        fig = old_figure(variants[i % len(variants)])
+        canvas = canvas_class(fig, master=root) if root is not None else canvas_class(fig)
+        canvas.draw()
+        if root is not None:
+            canvas.get_tk_widget().pack()
+            settle()
+            canvas.get_tk_widget().destroy()
+
+    slot = chart_renderer.ChartSlot(root, (10, 4), canvas_class=canvas_class)
+    if root is not None:
+        slot.widget.pack()
+
+    def new_visit(i, changed=True):
+        stats = variants[i % len(variants)]
+        slot.render(("data", i % len(variants)) if changed else ("data", 0),
+                    lambda s: dashboard._draw_analytics(s, stats))
+        settle()
+
+    new_visit(0)
+    timed("old: new Figure + canvas + draw", old_visit, visits)
+    timed("renderer: data changed (update in place)", new_visit, visits)
+    timed("renderer: data unchanged", lambda i: new_visit(i, changed=False), visits)
+    print(f"  renderer full draws: {slot.full_draws}, blits: {slot.blits}")
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Focus session storage: one write per timer tick vs. focus_sessions.
+FocusRecorder (buffered, one upsert batch per pause / FLUSH_INTERVAL_S),
+over simulated focus days on a fake clock. Then the Overview/Analytics
+focus_totals query on a table of many sessions.
+
+    python benchmarks/bench_focus_sessions.py [hours] [sessions]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db  # noqa: E402
+import focus_sessions  # noqa: E402
+import task_stats  # noqa: E402
+from focus_timer import TimerEngine  # noqa: E402
+
+USERS = 50
+
+
+def populate(sessions):
+    db.migrate_schema_if_needed()
+    with db.connect() as conn:
+        conn.executemany("INSERT INTO users (id, username, password) VALUES (?, ?, 'x')",
+                         [(i, f"user{i}") for i in range(1, USERS + 1)])
+    rows = []
+    for i in range(sessions):
+        day = f"2024-{random.randint(1, 12):02}-{random.randint(1, 28):02}"
+        start = f"{day} {random.randint(8, 18):02}:{random.randint(0, 59):02}:00.{i % 1000:03}"
+        rows.append((random.randint(1, USERS), None, start, start, random.randint(60, 3600)))
+    db.save_focus_sessions(rows)
+
+
+def fake_timer():
+    clock = [0.0]
+    timer = TimerEngine(clock=lambda: clock[0], schedule=lambda ms, cb: 1, cancel=lambda i: None)
+    return timer, clock
+
+
+def per_tick(hours):
+    # what a write-through timer does: one transaction per second of focus
+    for second in range(hours * 3600):
+        with db.connect() as conn:
+            conn.execute("UPDATE focus_sessions SET seconds = ? WHERE user_id = 1 AND start = '2024-01-01 09:00:00.000'",
+                         (second,))
+    return hours * 3600
+
+
+def recorded(hours):
+    timer, clock = fake_timer()
+    writes = []
+    recorder = focus_sessions.FocusRecorder(
+        save=lambda rows: writes.append(len(rows)) or db.save_focus_sessions(rows),
+        now=lambda: datetime(2024, 1, 2, 9) + timedelta(seconds=clock[0]))
+    recorder.bind(timer, 1)
+    # 50-minute sessions with 10-minute breaks
+    for _ in range(hours):
+        timer.start()
+        for _ in range(50 * 60):
+            clock[0] += 1
+            timer._tick(timer._generation)
+        timer.pause()
+        clock[0] += 600
+    recorder.close(timer)   # waits for the DB worker, earlier batches included
+    return len(writes)
+
+
+def timed(label, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<44} {(time.perf_counter() - start) * 1000:9.1f} ms   ({result} transactions)")
+
+
+def main():
+    hours = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_NAME = os.path.join(tmp, "bench.db")
+        print(f"populating {sessions} focus sessions for {USERS} users...")
+        populate(sessions)
+        db.save_focus_sessions([(1, None, "2024-01-01 09:00:00.000", "2024-01-01 09:00:00.000", 0)])
+
+        print(f"\n{hours} h of focus:")
+        timed("write per tick", per_tick, hours)
+        timed("FocusRecorder (batched)", recorded, hours)
+
+        print("\nfocus_totals:")
+        runs = 200
+        start = time.perf_counter()
+        for i in range(runs):
+            task_stats.focus_totals(i % USERS + 1, "2024-06-30")
+        print(f"{'indexed SUM per user':<44} {(time.perf_counter() - start) / runs * 1000:9.3f} ms/query")
+        start = time.perf_counter()
+        for i in range(runs // 10):
+            with db.connect() as conn:
+                conn.execute("SELECT SUM(seconds) FROM focus_sessions NOT INDEXED WHERE user_id = ?",
+                             (i % USERS + 1,)).fetchone()
+        print(f"{'same SUM, full scan':<44} {(time.perf_counter() - start) / (runs // 10) * 1000:9.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Focus timer over a simulated hour: the old loop (time.time(), fixed
+after(1000) re-armed after each tick) vs. focus_timer.TimerEngine
+(monotonic clock, ticks aligned to the next whole second).
+Runs on a fake clock and a fake after() that fires every callback
+LATENCY_MS late, so no Tk is needed. Reports how far the label lags the
+real elapsed time and how many seconds it skipped (both while
+visible, before the clock step), label updates made while the window
+was iconified (the middle third of the run), and what setting the wall
+clock back does to each.
+
+    python benchmarks/bench_focus_timer.py [seconds] [latency_ms]
+"""
+import heapq
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focus_timer import TimerEngine, format_seconds  # noqa: E402
+
+CLOCK_STEP = -3600      # wall clock set back an hour (NTP / DST) at half time
+
+
+class FakeLoop:
+    def __init__(self, latency_ms):
+        self.now = 0.0
+        self.latency = latency_ms / 1000
+        self.queue = []
+        self.seq = itertools.count()
+
+    def after(self, ms, callback):
+        job = (self.now + ms / 1000 + self.latency, next(self.seq), callback)
+        heapq.heappush(self.queue, job)
+        return job[1]
+
+    def cancel(self, job_id):
+        self.queue = [job for job in self.queue if job[1] != job_id]
+        heapq.heapify(self.queue)
+
+    def run_until(self, end):
+        while self.queue and self.queue[0][0] <= end:
+            self.now, _, callback = heapq.heappop(self.queue)
+            callback()
+        self.now = end
+
+
+class FakeLabel:
+    def __init__(self, loop, hidden):
+        self.loop = loop
+        self.hidden = hidden    # (from, until): window iconified
+        self.text = "00:00:00"
+        self.shown = []         # (time, seconds on the label)
+        self.hidden_updates = 0
+
+    def visible(self):
+        return not self.hidden[0] <= self.loop.now < self.hidden[1]
+
+    def config(self, text):
+        if not self.visible():
+            self.hidden_updates += 1
+        self.text = text
+        h, m, s = map(int, text.split(":"))
+        self.shown.append((self.loop.now, h * 3600 + m * 60 + s))
+
+    def winfo_viewable(self):
+        return self.visible()
+
+
+def _hidden(seconds):
+    return (seconds / 3, seconds * 2 / 3)
+
+
+def run_old(seconds, latency_ms, wall_step):
+    # the former dashboard loop, wall clock included
+    loop = FakeLoop(latency_ms)
+    label = FakeLabel(loop, _hidden(seconds))
+    state = {"start": 0.0, "step": 0.0}
+
+    def wall():
+        return loop.now + state["step"]
+
+    def update_timer():
+        elapsed = wall() - state["start"]
+        label.config(text=format_seconds(max(elapsed, 0)))
+        loop.after(1000, update_timer)
+
+    loop.after(1000, update_timer)
+    loop.run_until(seconds / 2)
+    state["step"] = wall_step
+    loop.run_until(seconds + 0.5)
+    return label
+
+
+def run_new(seconds, latency_ms):
+    loop = FakeLoop(latency_ms)
+    label = FakeLabel(loop, _hidden(seconds))
+    timer = TimerEngine(clock=lambda: loop.now, schedule=loop.after, cancel=loop.cancel)
+    timer.label = label     # attach() without a Tk root
+    timer.start()
+    loop.run_until(label.hidden[1])
+    timer._on_map()         # window mapped again
+    loop.run_until(seconds + 0.5)
+    return label
+
+
+def report(name, label, seconds):
+    # lag and skips while visible, before the wall-clock step
+    hidden = label.hidden
+    lags, skipped, prev = [], 0, None
+    for at, value in label.shown:
+        if at >= seconds / 2:
+            break
+        if hidden[0] <= at < hidden[1]:
+            prev = None
+            continue
+        lags.append(at - value)
+        if prev is not None and prev[0] < hidden[0] <= at:
+            prev = None     # first update after the window was shown again
+        if prev is not None and value > prev[1] + 1:
+            skipped += value - prev[1] - 1
+        prev = (at, value)
+    print(f"{name}")
+    print(f"  label updates          {len(label.shown):8d}   (while hidden: {label.hidden_updates})")
+    print(f"  max lag behind clock   {max(lags) * 1000:8.0f} ms")
+    print(f"  seconds skipped        {skipped:8d}")
+    print(f"  shown at the end       {label.text}   (real {format_seconds(seconds)})")
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 15
+    print(f"{seconds} s simulated, after() {latency_ms:.0f} ms late, wall clock "
+          f"stepped {CLOCK_STEP:+d} s at {seconds // 2} s\n")
+    report("old: time.time() + after(1000)", run_old(seconds, latency_ms, CLOCK_STEP), seconds)
+    report("new: TimerEngine", run_new(seconds, latency_ms), seconds)
+
+
+if __name__ == "__main__":
+    main()
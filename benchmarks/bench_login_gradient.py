@@ -0,0 +1,104 @@
+"""
+Login background at 1080p and 4K: the old draw_gradient (one Canvas line
+per pixel row, recreated on every <Configure>) vs. gradient.py (one
+cached image item, debounced).
+Draws on a real Canvas when a display is available; otherwise times the
+image build and the per-row colour loop without Tk.
+
+    python benchmarks/bench_login_gradient.py [runs]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gradient  # noqa: E402
+
+TOP, BOTTOM = (80, 120, 250), (165, 95, 200)
+SIZES = {"1080p": (1920, 1080), "4K": (3840, 2160)}
+
+
+def old_rows(h):
+    # colours of the old draw_gradient, one per row
+    steps = max(h, 2)
+    colors = []
+    for i in range(steps):
+        r = int(TOP[0] + (BOTTOM[0] - TOP[0]) * (i / steps))
+        g = int(TOP[1] + (BOTTOM[1] - TOP[1]) * (i / steps))
+        b = int(TOP[2] + (BOTTOM[2] - TOP[2]) * (i / steps))
+        colors.append(f"#{r:02x}{g:02x}{b:02x}")
+    return colors
+
+
+def old_draw(canvas, w, h):
+    canvas.delete("gradient")
+    for i, color in enumerate(old_rows(h)):
+        canvas.create_line(0, i, w, i, fill=color, tags="gradient")
+    canvas.lower("gradient")
+
+
+def timed(label, fn, runs):
+    start = time.perf_counter()
+    for i in range(runs):
+        fn(i)
+    ms = (time.perf_counter() - start) / runs * 1000
+    print(f"  {label:<45} {ms:9.1f} ms")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        root = None
+
+    for name, (w, h) in SIZES.items():
+        print(f"{name} ({w}x{h}):")
+        if root is None:
+            print("  no display: Canvas items not created")
+            timed("old: per-row colours (Tk calls excluded)", lambda i: old_rows(h), runs)
+            print(f"  {'old: canvas items':<45} {max(h, 2):9d}")
+
+            def build(i):
+                gradient.images.clear()
+                gradient.gradient_image(w, h, TOP, BOTTOM)
+            timed("new: gradient image, cold", build, runs)
+            timed("new: gradient image, cached", lambda i: gradient.gradient_image(w, h, TOP, BOTTOM), runs)
+            print(f"  {'new: canvas items':<45} {1:9d}")
+            continue
+
+        canvas = tk.Canvas(root, width=w, height=h)
+        canvas.pack()
+        timed("old: delete + one line per row", lambda i: (old_draw(canvas, w, h), root.update()), runs)
+        print(f"  {'old: canvas items':<45} {len(canvas.find_withtag('gradient')):9d}")
+        canvas.delete("all")
+
+        background = gradient.GradientBackground(canvas, TOP, BOTTOM)
+
+        def new_draw(i):
+            # alternate buckets so every run really draws
+            background.draw(w - (i % 2) * gradient.GRADIENT_BUCKET, h)
+            root.update()
+        timed("new: one image item", new_draw, runs)
+        print(f"  {'new: canvas items':<45} {len(canvas.find_all()):9d}")
+
+        # a drag-resize: 60 <Configure> events, one redraw after it settles
+        background.draws = 0
+        start = time.perf_counter()
+        for step in range(60):
+            background.resize(w - step * 4, h - step * 2)
+            root.update()
+        time.sleep(gradient.GRADIENT_DEBOUNCE_MS / 1000 + 0.05)
+        root.update()
+        print(f"  {'new: drag resize, 60 events -> redraws':<45} {background.draws:9d}"
+              f"   ({(time.perf_counter() - start) * 1000:.0f} ms incl. debounce wait)")
+        canvas.destroy()
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Dashboard navigation: the old behaviour (clear the content frame and run
+the page's show_* again on every click) vs. PageManager (pages built once,
+swapped with grid_remove and refreshed only when their data changed).
+Counts widgets created and time per click over a tour of all pages.
+Needs a display; without one it only says so.
+
+    python benchmarks/bench_page_navigation.py [rounds] [tasks]
+"""
+import os
+import sys
+import tempfile
+import time
+import tkinter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db  # noqa: E402
+
+PAGES = ("overview", "tasks", "analytics", "rewards", "settings")
+
+_created = [0]
+_setup = tkinter.BaseWidget._setup
+
+
+def _counting_setup(self, *args, **kwargs):
+    _created[0] += 1
+    return _setup(self, *args, **kwargs)
+
+
+def populate(tasks):
+    db.migrate_schema_if_needed()
+    with db.connect() as conn:
+        conn.execute("INSERT INTO users (id, username, password) VALUES (1, 'bench', 'x')")
+        conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date) "
+                         "VALUES (1, 'bench', ?, '2024-01-01', '2024-02-01')",
+                         [(f"task {i}",) for i in range(tasks)])
+
+
+def settle(root, quiet_ms=150):
+    # pump Tk until the async loads (_run_db) stopped creating widgets
+    last, quiet_since = _created[0], time.perf_counter()
+    while (time.perf_counter() - quiet_since) * 1000 < quiet_ms:
+        root.update()
+        if _created[0] != last:
+            last, quiet_since = _created[0], time.perf_counter()
+        time.sleep(0.005)
+
+
+def tour(label, root, click, rounds):
+    _created[0] = 0
+    clicks, spent = 0, 0.0
+    for _ in range(rounds):
+        for page in PAGES:
+            start = time.perf_counter()
+            click(page)
+            root.update_idletasks()
+            spent += time.perf_counter() - start
+            clicks += 1
+            settle(root)
+    print(f"{label:<34} {spent / clicks * 1000:8.1f} ms/click {_created[0] / clicks:8.1f} widgets/click")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    try:
+        import ttkbootstrap as ttk
+        root = ttk.Window()
+    except Exception as e:
+        print(f"no display: {e}")
+        return
+
+    import dashboard
+    from page_manager import PageManager
+
+    tkinter.BaseWidget._setup = _counting_setup
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_NAME = os.path.join(tmp, "bench.db")
+        populate(tasks)
+
+        old_frame = ttk.Frame(root)
+        old_frame.pack(fill="both", expand=True)
+        builders = {
+            "overview": dashboard.show_welcome, "tasks": dashboard.show_tasks,
+            "analytics": dashboard.show_analytic, "rewards": dashboard.show_rewards,
+            "settings": dashboard.show_settings,
+        }
+        tour("old: clear + show_* per click", root,
+             lambda page: builders[page](1, "bench", old_frame), rounds)
+        old_frame.destroy()
+
+        content = ttk.Frame(root)
+        content.pack(fill="both", expand=True)
+        pages = dashboard._register_pages(PageManager(content), 1, "bench")
+        tour("new: PageManager.show", root, pages.show, rounds)
+        print(f"  builds={pages.builds} refreshes={pages.refreshes}")
+
+    tkinter.BaseWidget._setup = _setup
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Cold-start cost of the app modules, measured in fresh interpreters:
+`python -X importtime` for `import main` (lazy pandas / matplotlib) vs.
+`import main, analytics` (what main used to load eagerly), plus the time
+until the first Tk window exists when a display is available.
+
+    python benchmarks/bench_startup_imports.py [runs]
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_WINDOW = """
+import json, time
+start = time.perf_counter()
+{imports}
+imported = time.perf_counter() - start
+window = None
+try:
+    import ttkbootstrap as ttk
+    root = ttk.Window(title="Work Tracker", themename="flatly")
+    root.update()
+    window = time.perf_counter() - start
+    root.destroy()
+except Exception:
+    pass
+print(json.dumps({{"import": imported, "window": window}}))
+"""
+
+
+def importtime(imports):
+    """{module: cumulative microseconds} from -X importtime for `imports`."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", imports],
+                            cwd=ROOT, capture_output=True, text=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def first_window(imports):
+    result = subprocess.run([sys.executable, "-c", FIRST_WINDOW.format(imports=imports)],
+                            cwd=ROOT, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, imports in [("eager (import main, analytics)", "import main, analytics"),
+                           ("lazy (import main)", "import main")]:
+        print(f"{label}:")
+        timings = [first_window(imports) for _ in range(runs)]
+        best_import = min(t["import"] for t in timings)
+        print(f"  {'imports (best of %d)' % runs:<45} {best_import * 1000:9.1f} ms")
+        windows = [t["window"] for t in timings if t["window"] is not None]
+        if windows:
+            print(f"  {'time to first window (best of %d)' % runs:<45} {min(windows) * 1000:9.1f} ms")
+        else:
+            print(f"  {'time to first window':<45} {'no display':>12}")
+
+        modules = importtime(imports)
+        for name in ("pandas", "matplotlib", "numpy", "ttkbootstrap", "dashboard"):
+            if name in modules:
+                print(f"  {'-X importtime ' + name:<45} {modules[name] / 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Lookup latency on a 1M-row tasks table: username TEXT filter vs. user_id.
+
+    python benchmarks/bench_task_lookup.py [rows] [users]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db  # noqa: E402
+
+
+def populate(rows, users):
+    db.migrate_schema_if_needed()
+    with db.connect() as conn:
+        conn.executemany("INSERT INTO users (id, username, password) VALUES (?, ?, 'x')",
+                         [(i, f"user{i}") for i in range(1, users + 1)])
+        batch = []
+        for i in range(rows):
+            uid = random.randint(1, users)
+            batch.append((uid, f"user{uid}", f"task {i}", "2024-01-01", "2024-02-01"))
+            if len(batch) == 50_000:
+                conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date) "
+                                 "VALUES (?, ?, ?, ?, ?)", batch)
+                batch.clear()
+        if batch:
+            conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date) "
+                             "VALUES (?, ?, ?, ?, ?)", batch)
+
+
+def timed(label, fn, keys):
+    start = time.perf_counter()
+    for key in keys:
+        fn(key)
+    per_call = (time.perf_counter() - start) / len(keys) * 1000
+    print(f"{label:<40} {per_call:8.3f} ms/lookup")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_NAME = os.path.join(tmp, "bench.db")
+        print(f"populating {rows} tasks for {users} users...")
+        populate(rows, users)
+        ids = random.sample(range(1, users + 1), min(200, users))
+
+        def by_username_unindexed(uid):
+            # the pre-migration query: TEXT column, no index
+            with db.connect() as conn:
+                conn.execute("SELECT title, start_date, due_date, status FROM tasks "
+                             "WHERE username = ? ORDER BY id DESC", (f"user{uid}",)).fetchall()
+
+        timed("username filter (no index)", by_username_unindexed, ids[:10])
+        with db.connect() as conn:
+            conn.execute("CREATE INDEX bench_username_id ON tasks (username, id)")
+        timed("username filter (username, id) index", by_username_unindexed, ids)
+        with db.connect() as conn:
+            conn.execute("DROP INDEX bench_username_id")
+        timed("db.get_tasks_for_user (user_id index)", db.get_tasks_for_user, ids)
+        timed("db.get_tasks shim (username -> id)", lambda uid: db.get_tasks(f"user{uid}"), ids)
+        print(db.connection_stats())
+
+
+if __name__ == "__main__":
+    main()
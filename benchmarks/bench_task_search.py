@@ -0,0 +1,77 @@
+"""
+Search latency on one user's 100k tasks: tasks.search_tasks (FTS5 +
+indexed filters) vs. the LIKE scan it replaces.
+
+    python benchmarks/bench_task_search.py [rows]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db  # noqa: E402
+import tasks  # noqa: E402
+
+WORDS = ("report meeting invoice design review deploy budget email client draft "
+         "research exam essay groceries gym refactor backup release notes plan").split()
+STATUSES = ["In Progress", "Completed", "Overdue"]
+PRIORITIES = ["Low", "Medium", "High"]
+CATEGORIES = ["Work", "Study", "Personal", "Other"]
+
+
+def populate(rows):
+    db.initialize_database()
+    db.insert_user("bench", "x")
+    uid = db.get_user_id("bench")
+    batch = []
+    for i in range(rows):
+        day = 1 + i % 28
+        batch.append((uid, "bench", f"{random.choice(WORDS)} {random.choice(WORDS)} {i}",
+                      f"2024-{1 + i % 12:02}-{day:02}", f"2024-{1 + i % 12:02}-{day:02}",
+                      random.choice(STATUSES), " ".join(random.choices(WORDS, k=12)),
+                      random.choice(PRIORITIES), random.choice(CATEGORIES)))
+    with db.connect() as conn:
+        conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date, status, "
+                         "description, priority, category) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+    return uid
+
+
+def timed(label, fn, runs=20):
+    fn()
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    per_call = (time.perf_counter() - start) / runs * 1000
+    print(f"{label:<45} {per_call:8.3f} ms/query")
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_NAME = os.path.join(tmp, "bench.db")
+        print(f"populating {rows} tasks for one user...")
+        uid = populate(rows)
+        print(f"FTS5 enabled: {db.FTS_ENABLED}")
+
+        def like_scan():
+            with db.connect() as conn:
+                return conn.execute("SELECT * FROM tasks WHERE user_id = ? AND "
+                                    "(title LIKE ? OR description LIKE ?) ORDER BY id DESC LIMIT 50",
+                                    (uid, "%invoice%budget%", "%invoice%budget%")).fetchall()
+
+        timed("LIKE scan (title/description)", like_scan)
+        timed("search_tasks text", lambda: tasks.search_tasks(uid, "invoice budget"))
+        timed("search_tasks rare text", lambda: tasks.search_tasks(uid, "99999"))
+        timed("search_tasks status + priority", lambda: tasks.search_tasks(uid, status="Overdue", priority="High"))
+        timed("search_tasks date range", lambda: tasks.search_tasks(uid, date_from="2024-03-01",
+                                                                     date_to="2024-03-07"))
+        timed("search_tasks text + filters + sort", lambda: tasks.search_tasks(
+            uid, "report", status=["In Progress", "Overdue"], category="Work", sort="due_date"))
+
+
+if __name__ == "__main__":
+    main()
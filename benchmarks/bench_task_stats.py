@@ -0,0 +1,82 @@
+"""
+Overview / Analytics statistics for one user with 100k and 1M tasks:
+task_stats (task_daily_rollup) vs. pulling every row into Python / pandas.
+
+    python benchmarks/bench_task_stats.py [rows ...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics  # noqa: E402
+import db  # noqa: E402
+import db_pool  # noqa: E402
+import task_stats  # noqa: E402
+
+STATUSES = ["In Progress", "Completed", "Overdue"]
+
+
+def populate(rows):
+    db.initialize_database()
+    db.insert_user("bench", "x")
+    uid = db.get_user_id("bench")
+    with db.connect() as conn:
+        batch = []
+        for i in range(rows):
+            month, day = 1 + i % 12, 1 + i % 28
+            batch.append((uid, "bench", f"task {i}", f"2024-{month:02}-{day:02}",
+                          f"2024-{month:02}-{day:02}", random.choice(STATUSES), random.randint(0, 120)))
+            if len(batch) == 50_000:
+                conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date, "
+                                 "status, estimated_minutes) VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+                batch.clear()
+        if batch:
+            conn.executemany("INSERT INTO tasks (user_id, username, title, start_date, due_date, "
+                             "status, estimated_minutes) VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+    return uid
+
+
+def timed(label, fn, runs=3):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    print(f"  {label:<45} {(time.perf_counter() - start) / runs * 1000:9.1f} ms")
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or [100_000, 1_000_000]
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db.DB_NAME = os.path.join(tmp, "bench.db")
+            print(f"{rows} tasks for one user:")
+            start = time.perf_counter()
+            uid = populate(rows)
+            # includes the FTS and task_daily_rollup triggers on every insert
+            print(f"  {'insert (with triggers)':<45} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+            def welcome_rows():
+                # the old show_welcome: fetch every row, count statuses in a loop
+                counts = {}
+                for r in db.get_tasks_full_for_user(uid):
+                    status = str(r[6]).strip().lower()
+                    counts[status] = counts.get(status, 0) + 1
+                return counts
+
+            def analytics_pandas():
+                df = analytics.build_tasks_dataframe(db.get_tasks_full_for_user(uid))
+                return analytics.compute_stats(df)
+
+            timed("Overview: rows + Python loop", welcome_rows)
+            timed("Overview: task_stats.task_summary", lambda: task_stats.task_summary(uid))
+            timed("Analytics: rows + DataFrame + compute_stats", analytics_pandas)
+            timed("Analytics: task_stats.analytics_stats", lambda: task_stats.analytics_stats(uid))
+            # pooled connections must not outlive the temporary directory
+            db_pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Edit-to-repaint latency of the Tasks table at 10k rows:
+full rebuild (old show_tasks behaviour) vs. TaskTable row-level update.
+Needs a display.
+
+    python benchmarks/bench_task_table.py [rows]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ttkbootstrap as ttk  # noqa: E402
+
+from task_table import TaskTable  # noqa: E402
+
+
+def make_rows(n):
+    return [(i, 1, "bench", f"task {i}", "2024-01-01", "2024-02-01", "In Progress",
+             None, "Medium", "Work", 30) for i in range(n, 0, -1)]
+
+
+def timed(label, root, fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        root.update_idletasks()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32} {best * 1000:9.2f} ms")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rows = make_rows(n)
+    root = ttk.Window()
+    frame = ttk.Frame(root)
+    frame.pack(fill="both", expand=True)
+    state = {"table": None}
+
+    def rebuild():
+        for w in frame.winfo_children():
+            w.destroy()
+        state["table"] = TaskTable(frame, rows)
+        state["table"].pack(fill="both", expand=True)
+
+    print(f"{n} rows")
+    timed("full rebuild", root, rebuild, repeat=3)
+
+    table = state["table"]
+    edited = list(rows[n // 2])
+
+    def edit_one():
+        edited[6] = "Completed" if edited[6] != "Completed" else "In Progress"
+        table.update(tuple(edited))
+
+    next_id = [n + 1]
+
+    def add_one():
+        table.insert((next_id[0],) + rows[0][1:])
+        next_id[0] += 1
+
+    def delete_one():
+        next_id[0] -= 1
+        table.remove(next_id[0])
+
+    timed("update one row", root, edit_one)
+    timed("insert one row", root, add_one)
+    timed("remove one row", root, delete_one)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
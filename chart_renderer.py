@@ -0,0 +1,212 @@
+"""
+Persistent matplotlib charts.
+A ChartSlot owns one Figure and one canvas for as long as its master widget
+lives. New data is written into the existing artists (bar heights, pie
+wedges, line data). If the axes layout (limits, bar labels) is unchanged,
+only those artists are redrawn over the cached background and blitted;
+otherwise a full draw is scheduled with draw_idle.
+"""
+import math
+
+from matplotlib.dates import date2num
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+def nice_ceiling(value):
+    """Smallest 1/2/5 x 10^k >= value * 1.1, so small data changes keep the y limit."""
+    value = max(float(value) * 1.1, 1.0)
+    exp = 10 ** math.floor(math.log10(value))
+    for step in (1, 2, 5, 10):
+        if step * exp >= value:
+            return step * exp
+    return 10 * exp
+
+
+class ChartSlot:
+    """
+    One chart area: a Figure, its canvas and the artists drawn on it.
+    Drawing goes through render(key, draw); draw(slot) calls the
+    bar/pie/line helpers, which create artists the first time and update
+    them in place afterwards.
+    """
+
+    def __init__(self, master, figsize, dpi=100, canvas_class=FigureCanvasTkAgg):
+        self.master = master
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = canvas_class(self.figure, master=master) if master is not None else canvas_class(self.figure)
+        get_widget = getattr(self.canvas, "get_tk_widget", None)
+        self.widget = get_widget() if get_widget else None
+        if self.widget is not None:
+            self.widget.keep_on_clear = True  # dashboard.clear_frame hides it instead
+        self.axes = {}
+        self.charts = {}        # name -> artists of one bar/pie/line chart
+        self.data_key = None
+        self._background = None
+        self._relayout = False
+        self.full_draws = 0
+        self.blits = 0
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    #  Widget
+    def alive(self):
+        return self.widget is None or bool(self.widget.winfo_exists())
+
+    def show(self, container, **pack):
+        """Pack the canvas into `container` (a descendant of the slot's master)."""
+        if self.widget is None:
+            return
+        self.widget.pack(in_=container, **pack)
+        self.widget.lift(container)  # the container was created later and would cover it
+
+    def hide(self):
+        if self.widget is not None and self.widget.winfo_exists():
+            self.widget.pack_forget()
+
+    #  Rendering
+    def render(self, key, draw):
+        """
+        Bring the chart up to date for `key`. Nothing happens if `key` is
+        already shown (key=None always redraws). Returns True if it redrew.
+        """
+        if key is not None and key == self.data_key:
+            return False
+        self._relayout = False
+        draw(self)
+        self.data_key = key
+        if self._relayout or self._background is None:
+            self.full_draws += 1
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+        return True
+
+    def subplot(self, name, position, title=None):
+        ax = self.axes.get(name)
+        if ax is None:
+            ax = self.axes[name] = self.figure.add_subplot(position)
+            if title:
+                ax.set_title(title, fontsize=9)
+            self._relayout = True
+        return ax
+
+    def _animated(self):
+        for artists in self.charts.values():
+            yield from artists["animated"]
+
+    def _on_draw(self, event):
+        # full draws skip animated artists: keep that as the blit background
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._animated():
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+
+    def _blit(self):
+        self.blits += 1
+        self.canvas.restore_region(self._background)
+        for artist in self._animated():
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def _set_ylim(self, ax, top):
+        top = nice_ceiling(top)
+        if ax.get_ylim() != (0, top):
+            ax.set_ylim(0, top)
+            self._relayout = True
+
+    #  Chart types
+    def bar(self, name, ax, labels, values):
+        """Bar chart; heights change in place while the labels stay the same."""
+        labels = [str(label) for label in labels]
+        chart = self.charts.get(name)
+        if chart is None or chart["labels"] != labels:
+            if chart is not None:
+                for artist in chart["animated"]:
+                    artist.remove()
+                ax.set_xticks([])
+            positions = range(len(labels))
+            bars = list(ax.bar(positions, [0] * len(labels)))
+            for patch in bars:
+                patch.set_animated(True)
+            ax.set_xticks(list(positions), labels)
+            self.charts[name] = chart = {"labels": labels, "animated": bars}
+            self._relayout = True
+        for patch, value in zip(chart["animated"], values):
+            patch.set_height(value)
+        self._set_ylim(ax, max(values, default=0))
+
+    def pie(self, name, ax, labels, values, startangle=90, autopct="%1.1f%%"):
+        """Pie chart with a fixed set of labels; wedge angles and percentages change in place."""
+        chart = self.charts.get(name)
+        if chart is None:
+            wedges, texts, pcts = ax.pie([1] * len(labels), labels=labels, autopct=autopct,
+                                         startangle=startangle)
+            chart = self.charts[name] = {"wedges": wedges, "texts": texts, "pcts": pcts,
+                                         "animated": [*wedges, *texts, *pcts]}
+            for artist in chart["animated"]:
+                artist.set_animated(True)
+            self._relayout = True
+
+        total = float(sum(values))
+        theta1 = startangle / 360.0
+        for wedge, text, pct, value in zip(chart["wedges"], chart["texts"], chart["pcts"], values):
+            frac = value / total if total else 0.0
+            theta2 = theta1 + frac
+            wedge.set_theta1(360 * theta1)
+            wedge.set_theta2(360 * theta2)
+            # same placement as Axes.pie (labeldistance 1.1, pctdistance 0.6)
+            mid = math.pi * (theta1 + theta2)
+            x, y = math.cos(mid), math.sin(mid)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment("left" if x > 0 else "right")
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text(autopct % (100 * frac))
+            for artist in (wedge, text, pct):
+                artist.set_visible(bool(total))
+            theta1 = theta2
+
+    def line(self, name, ax, xs, ys, empty_text="No data", dates=False, **style):
+        """Line chart; the data is replaced in place and the axes rescaled."""
+        chart = self.charts.get(name)
+        if chart is None:
+            if dates:
+                ax.xaxis_date()
+            line, = ax.plot([], [], **style)
+            line.set_animated(True)
+            note = ax.text(0.5, 0.5, empty_text, ha="center", va="center", color="#888",
+                           transform=ax.transAxes, visible=False)
+            chart = self.charts[name] = {"line": line, "note": note, "animated": [line]}
+            self._relayout = True
+        line, note = chart["line"], chart["note"]
+        if note.get_visible() != (not xs):
+            note.set_visible(not xs)
+            self._relayout = True
+        line.set_data(date2num(xs) if dates else xs, ys)
+        if not xs:
+            return
+        xlim = ax.get_xlim()
+        ax.relim()
+        ax.autoscale_view(scaley=False)
+        if ax.get_xlim() != xlim:
+            self._relayout = True
+        self._set_ylim(ax, max(ys))
+
+
+class ChartRenderer:
+    """Named chart slots; a slot is recreated only when its master is gone or replaced."""
+
+    def __init__(self):
+        self.slots = {}
+
+    def slot(self, name, master, figsize, dpi=100):
+        slot = self.slots.get(name)
+        if slot is None or slot.master is not master or not slot.alive():
+            slot = self.slots[name] = ChartSlot(master, figsize, dpi)
+        return slot
+
+    def forget(self, name):
+        self.slots.pop(name, None)
+
+
+renderer = ChartRenderer()
@@ -1,36 +1,36 @@
 import tkinter as tk
 import ttkbootstrap as ttk
-from ttkbootstrap.tableview import Tableview
 from ttkbootstrap.dialogs import Messagebox
 from ttkbootstrap.widgets import DateEntry
 from ttkbootstrap import Style
 from datetime import datetime
-import time
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import os
 
 # Pillow for image handling
-from PIL import Image, ImageTk, ImageOps
+from PIL import ImageTk
 
 import db
+import db_executor
+import focus_sessions
 import auth
 import tasks
-import analytics
+import analytics_cache
+import avatar_cache
+import lazy_imports
+import task_stats
+import ui_scheduler
+from focus_timer import timer
+from page_manager import PageManager
+from task_table import TaskTable, PagedTaskView, row_task_id
+
+# matplotlib loads on first use (Analytics), not with the first window
+chart_renderer = lazy_imports.lazy("chart_renderer")
+
+# a second click on the same nav button within this window is ignored
+NAV_THROTTLE_MS = 400
 
 #  DYNAMIC AVATAR PATH 
-AVATAR_DIR = os.path.join(os.path.dirname(__file__), "avatars")
-
-#  GLOBAL TIMER STATE 
-TIMER_STATE = {
-    "running": False,
-    "seconds": 0.0,
-    "label": None,
-    "after_id": None,
-    "root": None,
-    "start_time": None,
-    "base_seconds": 0.0,
-}
+AVATAR_DIR = avatar_cache.AVATAR_DIR
 
 # Avatar unlock mapping (filename -> required level)
 AVATAR_UNLOCKS = [
@@ -59,8 +59,6 @@ def open_dashboard(user, root):
     root.minsize(1000, 600)
     root.unbind("<Return>")
 
-    TIMER_STATE["root"] = root
-
     container = ttk.Frame(root)
     container.pack(fill="both", expand=True)
     container.columnconfigure(1, weight=1)
@@ -74,15 +72,17 @@ def open_dashboard(user, root):
     right_area = ttk.Frame(topbar)
     right_area.grid(row=0, column=1, sticky="e")
 
-    # get equipped avatar (small)
-    reward = db.get_reward_data(user_id)
-    avatar_filename = reward.get("avatar", "female_1.png")
-    avatar_img_small = _load_avatar_thumbnail(avatar_filename, size=(28, 28))
+    # equipped avatar (small), filled in once the DB worker returns
+    avatar_lbl = ttk.Label(right_area)
+    avatar_lbl.pack(side="left", padx=(0, 6))
+
+    def avatar_loaded(reward):
+        avatar_img_small = _load_avatar_thumbnail(reward.get("avatar", "female_1.png"), size=(28, 28))
+        if avatar_img_small:
+            avatar_lbl.configure(image=avatar_img_small)
+            avatar_lbl.image = avatar_img_small
 
-    if avatar_img_small:
-        avatar_lbl = ttk.Label(right_area, image=avatar_img_small)
-        avatar_lbl.image = avatar_img_small
-        avatar_lbl.pack(side="left", padx=(0, 6))
+    _run_db(right_area, db.get_reward_data, user_id, on_done=avatar_loaded)
 
     ttk.Button(right_area, text="🚪 Logout", command=lambda: logout_action(root)).pack(side="left", padx=8)
     ttk.Label(right_area, text=username[0].upper(), width=3, anchor="center",
@@ -111,15 +111,15 @@ def open_dashboard(user, root):
         return btn
 
     #  Navigation Buttons 
-    nav_btn("🏠", "Overview", lambda: show_welcome(user_id, username, content))
-    nav_btn("📝", "Tasks", lambda: show_tasks(user_id, username, content))
-    nav_btn("📊", "Analytics", lambda: show_analytic(username, content))
-    nav_btn("🏆", "Rewards", lambda: show_rewards(user_id, username, content))
-    nav_btn("⚙️", "Settings", lambda: show_settings(user_id, username, content))
+    nav_btn("🏠", "Overview", lambda: _navigate(content, "overview"))
+    nav_btn("📝", "Tasks", lambda: _navigate(content, "tasks"))
+    nav_btn("📊", "Analytics", lambda: _navigate(content, "analytics"))
+    nav_btn("🏆", "Rewards", lambda: _navigate(content, "rewards"))
+    nav_btn("⚙️", "Settings", lambda: _navigate(content, "settings"))
 
     # Admin tab only for admin user
     if username == "admin":
-        nav_btn("🛠", "Admin Panel", lambda: show_admin_panel(user_id, username, content))
+        nav_btn("🛠", "Admin Panel", lambda: _navigate(content, "admin"))
 
     # --- Timer ---
     timer_frame = ttk.Frame(sidebar, padding=(10, 15))
@@ -128,28 +128,97 @@ def open_dashboard(user, root):
     timer_label = ttk.Label(timer_frame, text="00:00:00", font=("Consolas", 18, "bold"))
     timer_label.pack(pady=5)
 
-    TIMER_STATE["label"] = timer_label
-    refresh_timer_label()
+    timer.attach(root, timer_label)
+    focus_sessions.recorder.bind(timer, user_id)
 
     btns = ttk.Frame(timer_frame)
     btns.pack(pady=5)
-    ttk.Button(btns, text="▶", width=3, command=start_timer, bootstyle="success-outline").pack(side="left", padx=2)
-    ttk.Button(btns, text="⏸", width=3, command=pause_timer, bootstyle="warning-outline").pack(side="left", padx=2)
-    ttk.Button(btns, text="🔁", width=3, command=reset_timer, bootstyle="secondary-outline").pack(side="left", padx=2)
+    ttk.Button(btns, text="▶", width=3, command=timer.start, bootstyle="success-outline").pack(side="left", padx=2)
+    ttk.Button(btns, text="⏸", width=3, command=timer.pause, bootstyle="warning-outline").pack(side="left", padx=2)
+    ttk.Button(btns, text="🔁", width=3, command=timer.reset, bootstyle="secondary-outline").pack(side="left", padx=2)
 
     # --- Content ---
+    # every page is built once and kept; navigation swaps the visible one
     content = ttk.Frame(layout, padding=20)
     content.grid(row=0, column=1, sticky="nsew")
-    content.columnconfigure(0, weight=1)
-    content.rowconfigure(2, weight=1)
+    # page keys are read on the DB worker too, so a click never waits on SQLite
+    content.pages = _register_pages(PageManager(content, run_async=db_executor.run_async),
+                                    user_id, username)
+    content.pages.show("overview")
 
-    show_welcome(user_id, username, content)
+
+def _task_data_key(user_id):
+    # focus flushes only move the focus version, so the Tasks page (keyed on
+    # data_version alone) is not reloaded by a running timer
+    return (analytics_cache.data_version(user_id), analytics_cache.focus_version(user_id),
+            datetime.now().strftime("%Y-%m-%d"))
+
+def _reward_key(user_id):
+    reward = db.get_reward_data(user_id)
+    return (reward.get("exp"), reward.get("level"), reward.get("avatar"))
+
+def _register_pages(pages, user_id, username):
+    """
+    Dashboard pages and the data each one shows; a page is refreshed on
+    navigation only when its key changed since it was last shown.
+    """
+    pages.register("overview", lambda f: show_welcome(user_id, username, f),
+                   version=lambda: _task_data_key(user_id))
+    pages.register("tasks", lambda f: show_tasks(user_id, username, f),
+                   version=lambda: analytics_cache.data_version(user_id))
+    pages.register("analytics", lambda f: show_analytic(user_id, username, f),
+                   version=lambda: _task_data_key(user_id))
+    pages.register("rewards", lambda f: show_rewards(user_id, username, f),
+                   version=lambda: _reward_key(user_id))
+    pages.register("settings", lambda f: show_settings(user_id, username, f),
+                   version=lambda: _reward_key(user_id))
+    if username == "admin":
+        # its tabs load their data on demand
+        pages.register("admin", lambda f: show_admin_panel(user_id, username, f))
+    return pages
 
 
 #  Helper Functions 
 def clear_frame(f):
     for w in f.winfo_children():
-        w.destroy()
+        if getattr(w, "keep_on_clear", False):
+            w.pack_forget()  # persistent chart canvas (chart_renderer), shown again later
+        else:
+            w.destroy()
+    # new page: results of async loads started for the old one are dropped
+    f.page_generation = getattr(f, "page_generation", 0) + 1
+
+def _navigate(content, page):
+    """
+    Switch pages through the UI scheduler: clicks within one frame show
+    only the last page, and a repeated click on the page just shown is dropped.
+    """
+    ui_scheduler.scheduler_for(content).request(
+        "navigate", content.pages.show, page,
+        priority=ui_scheduler.PRIORITY_HIGH, throttle_ms=NAV_THROTTLE_MS, owner=content)
+
+def _run_db(frame, fn, *args, on_done, **kwargs):
+    """
+    Run fn(*args, **kwargs) on the DB worker thread and call on_done(result)
+    on the Tk thread, unless `frame` has been cleared for another page since.
+    """
+    generation = getattr(frame, "page_generation", 0)
+
+    def deliver(result):
+        if getattr(frame, "page_generation", 0) == generation:
+            on_done(result)
+
+    def failed(error):
+        print(f"[Dashboard] {getattr(fn, '__name__', fn)} failed: {error}")
+        if getattr(frame, "page_generation", 0) == generation:
+            Messagebox.show_error("Could not load data from the database.")
+
+    return db_executor.run_async(frame, fn, *args, on_done=deliver, on_error=failed, **kwargs)
+
+def loading_label(parent, text="Loading..."):
+    lbl = ttk.Label(parent, text=text, foreground="#888")
+    lbl.pack(anchor="w", pady=10)
+    return lbl
 
 def card(parent, title, value, icon=None):
     f = ttk.Frame(parent, padding=12)
@@ -159,20 +228,38 @@ def card(parent, title, value, icon=None):
     if icon:
         ttk.Label(f, text=icon, font=("Segoe UI Emoji", 16)).pack(anchor="e")
 
+def _format_focus(seconds):
+    minutes = int(seconds) // 60
+    return f"{minutes // 60}h {minutes % 60:02}m" if minutes >= 60 else f"{minutes}m"
+
+def _apply_task_change(frame, row=None, removed_id=None):
+    """
+    Push one added/edited/deleted task into the page's task table instead of
+    rebuilding it. Does nothing if the Tasks page is no longer shown.
+    """
+    table = getattr(frame, "table", None)
+    if not isinstance(table, (TaskTable, PagedTaskView)) or not table.view.winfo_exists():
+        return
+    if removed_id is not None:
+        table.remove(removed_id)
+    if row is not None:
+        table.update(row)
+
+def preload_avatar(filename, size=(64,64), greyscale=False):
+    """
+    Decode an avatar without touching Tk (safe off the main thread), so a
+    later _load_avatar_thumbnail only has to wrap it in a PhotoImage.
+    """
+    return avatar_cache.get_thumbnail(filename, size, greyscale) is not None
+
 def _load_avatar_thumbnail(filename, size=(64,64), greyscale=False):
     """
-    Load avatar image from AVATAR_DIR and return a PhotoImage.
+    Avatar thumbnail from avatar_cache as a PhotoImage.
     If image missing, returns None.
     """
     try:
-        path = os.path.join(AVATAR_DIR, filename)
-        if not os.path.exists(path):
-            return None
-        img = Image.open(path).convert("RGBA")
-        img = img.resize(size, Image.LANCZOS)
-        if greyscale:
-            img = ImageOps.grayscale(img).convert("RGBA")
-        return ImageTk.PhotoImage(img)
+        img = avatar_cache.get_thumbnail(filename, size, greyscale)
+        return ImageTk.PhotoImage(img) if img is not None else None
     except Exception:
         return None
 
@@ -264,8 +351,21 @@ def open_add_task_modal(user_id, username, parent_frame):
         except Exception:
             estimated_minutes = 0
 
+        def done(row):
+            if row:
+                Messagebox.show_info("Task created successfully!")
+                modal.destroy()
+                _apply_task_change(parent_frame, row=row)
+            else:
+                create_btn.configure(state="normal")
+                Messagebox.show_error("Failed to create task. Please try again.")
+
+        create_btn.configure(state="disabled")
         # Use tasks.add_new_task signature that accepts extended fields.
-        success = tasks.add_new_task(
+        _run_db(
+            modal,
+            tasks.create_task,
+            on_done=done,
             user_id=user_id,
             username=username,
             title=title,
@@ -278,15 +378,9 @@ def open_add_task_modal(user_id, username, parent_frame):
             estimated_minutes=estimated_minutes
         )
 
-        if success:
-            Messagebox.show_info("Task created successfully!")
-            modal.destroy()
-            show_tasks(user_id, username, parent_frame)
-        else:
-            Messagebox.show_error("Failed to create task. Please try again.")
-
     ttk.Button(btn_frame, text="Cancel", command=cancel, bootstyle="secondary-outline").grid(row=0, column=0, sticky="ew", padx=(0, 6))
-    ttk.Button(btn_frame, text="Create Task", command=create_task, bootstyle="primary").grid(row=0, column=1, sticky="ew", padx=(6, 0))
+    create_btn = ttk.Button(btn_frame, text="Create Task", command=create_task, bootstyle="primary")
+    create_btn.grid(row=0, column=1, sticky="ew", padx=(6, 0))
 
 
 #  Delete Task Function 
@@ -302,21 +396,12 @@ def delete_task_action(user_id, username, parent_frame):
         Messagebox.show_error("Please select a task to delete.")
         return
 
-    selected_item = table.view.item(selected[0])["values"]
-    if not selected_item:
+    task_id = row_task_id(table.view, selected[0])
+    values = table.view.item(selected[0])["values"]
+    if task_id is None or len(values) < 2:
         Messagebox.show_error("Invalid task data.")
         return
-
-    # Support both old 4-column rows and new 6-column rows
-    if len(selected_item) >= 6:
-        title = selected_item[0]
-        start_date = selected_item[3]
-    elif len(selected_item) >= 4:
-        title = selected_item[0]
-        start_date = selected_item[1]
-    else:
-        Messagebox.show_error("Invalid task data format.")
-        return
+    title = values[1]
 
     # Confirm deletion
     confirm = Messagebox.okcancel(
@@ -327,14 +412,15 @@ def delete_task_action(user_id, username, parent_frame):
     if not confirm:
         return
 
+    def done(success):
+        if success:
+            Messagebox.show_info("Task deleted successfully!")
+            _apply_task_change(parent_frame, removed_id=task_id)
+        else:
+            Messagebox.show_error("Failed to delete task. Please try again.")
+
     # Perform deletion
-    success = tasks.safe_delete_task(username, title)
-    
-    if success:
-        Messagebox.show_info("Task deleted successfully!")
-        show_tasks(user_id, username, parent_frame)
-    else:
-        Messagebox.show_error("Failed to delete task. Please try again.")
+    _run_db(parent_frame, tasks.delete_task_by_id, task_id, user_id=user_id, on_done=done)
 
 
 #  Edit Task Modal (updated to handle extended fields when available) 
@@ -349,48 +435,25 @@ def open_edit_task_modal(user_id, username, parent_frame):
         Messagebox.show_error("Please select a task to edit.")
         return
 
-    selected_item = table.view.item(selected[0])["values"]
-    if not selected_item:
+    task_id = row_task_id(table.view, selected[0])
+    if task_id is None:
         Messagebox.show_error("Invalid task data.")
         return
 
-    # Support both old 4-column rows and new 6-column rows:
-    # old: [title, start_date, due_date, status]
-    # new: [title, category, est_minutes, start_date, due_date, status]
-    if len(selected_item) >= 6:
-        title_old = selected_item[0]
-        category_old = selected_item[1]
-        estimated_old = selected_item[2]
-        start_old = selected_item[3]
-        due_old = selected_item[4]
-        status_old = selected_item[5]
-    elif len(selected_item) >= 4:
-        title_old, start_old, due_old, status_old = selected_item[:4]
-        category_old = None
-        estimated_old = None
-    else:
-        Messagebox.show_error("Invalid task data format.")
-        return
+    def opened(full_row):
+        if not full_row:
+            Messagebox.show_error("Invalid task data.")
+            return
+        _build_edit_task_modal(user_id, username, parent_frame, task_id, full_row)
 
-    # Try to fetch the full row (if available) to get description/priority/category/estimated_minutes
-    full_rows = tasks.get_tasks_full_rows(username)
-    full_row = None
-    for r in full_rows:
-        try:
-            # r = (id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes)
-            if r[3] == title_old and str(r[4]) == str(start_old):
-                full_row = r
-                break
-        except Exception:
-            continue
-    if not full_row:
-        for r in full_rows:
-            try:
-                if r[3] == title_old:
-                    full_row = r
-                    break
-            except Exception:
-                continue
+    _run_db(parent_frame, tasks.get_task, user_id, task_id, on_done=opened)
+
+
+def _build_edit_task_modal(user_id, username, parent_frame, task_id, full_row):
+    # full_row = (id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes)
+    title_old, start_old, due_old, status_old = full_row[3], full_row[4], full_row[5], full_row[6]
+    category_old = full_row[9]
+    estimated_old = full_row[10]
 
     modal = tk.Toplevel()
     modal.title("Edit Task")
@@ -515,13 +578,12 @@ def open_edit_task_modal(user_id, username, parent_frame):
         # Remember previous status to award EXP only when transitioning to Completed
         prev_status = status_old
 
-        # Call tasks.update_task in the dashboard-style pattern:
-        # (user_id, username, title_old, new_title, new_start, new_due, new_status, ...)
-        try:
-            success = tasks.update_task(
+        completed_now = prev_status != "Completed" and new_status == "Completed"
+
+        def work():
+            ok = tasks.update_task_by_id(
+                task_id,
                 user_id,
-                username,
-                title_old,
                 new_title,
                 new_start,
                 new_due,
@@ -531,24 +593,17 @@ def open_edit_task_modal(user_id, username, parent_frame):
                 category=new_category,
                 estimated_minutes=estimated_minutes
             )
-        except Exception:
-            # fallback: call in positional signature that some older tasks.update_task might expect
-            try:
-                success = tasks.update_task(
-                    title_old,  # not ideal but try anything
-                    username,
-                    new_title,
-                    new_start,
-                    new_due,
-                    new_status
-                )
-            except Exception:
-                success = False
+            # If newly marked completed and previously wasn't, award EXP
+            exp = db.add_exp(user_id, 10) if ok and completed_now else None
+            return ok, exp, (tasks.get_task(user_id, task_id) if ok else None)
+
+        save_btn.configure(state="disabled")
+        _run_db(modal, work, on_done=saved)
 
+    def saved(result):
+        success, res, row = result
         if success:
-            # If newly marked completed and previously wasn't, award EXP
-            if prev_status != "Completed" and new_status == "Completed":
-                res = db.add_exp(user_id, 10)
+            if res is not None:
                 if res.get("success"):
                     if res.get("leveled_up"):
                         Messagebox.show_info(f"Task completed! +10 EXP — Level up! Now Level {res.get('level')}")
@@ -558,11 +613,13 @@ def open_edit_task_modal(user_id, username, parent_frame):
                 Messagebox.show_info("Task updated successfully!")
 
             modal.destroy()
-            show_tasks(user_id, username, parent_frame)
+            _apply_task_change(parent_frame, row=row)
         else:
+            save_btn.configure(state="normal")
             Messagebox.show_error("Failed to update task.")
 
-    ttk.Button(btn_frame, text="💾 Save Changes", command=save_changes, bootstyle="primary").grid(row=0, column=1, sticky="ew")
+    save_btn = ttk.Button(btn_frame, text="💾 Save Changes", command=save_changes, bootstyle="primary")
+    save_btn.grid(row=0, column=1, sticky="ew")
     ttk.Button(btn_frame, text="Cancel", command=lambda: modal.destroy(), bootstyle="secondary-outline").grid(row=0, column=0, sticky="ew", padx=(0, 6))
 
 
@@ -581,22 +638,12 @@ def show_tasks(user_id, username, frame):
                command=lambda: delete_task_action(user_id, username, frame),
                bootstyle="danger-outline").pack(side="right", padx=(0, 4))
 
-    # Try to get full rows (with category and estimated time)
-    try:
-        rows_full = tasks.get_tasks_full_rows(username)
-        if rows_full and len(rows_full[0]) >= 11:
-            # (id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes)
-            rows = [[r[3], r[9], r[10], r[4], r[5], r[6]] for r in rows_full]
-            columns = ["Title", "Category", "Est. Time (min)", "Start Date", "Due Date", "Status"]
-        else:
-            raise Exception("Fallback to basic rows")
-    except Exception:
-        rows = tasks.get_tasks_rows(username)
-        columns = ["Title", "Start Date", "Due Date", "Status"]
-
-    table = Tableview(master=frame, coldata=columns, rowdata=rows, paginated=False, searchable=True)
+    # one SQL page at a time; add/edit/delete then patch single rows
+    table = PagedTaskView(frame, user_id)
     table.pack(fill="both", expand=True, pady=(5, 0))
     frame.table = table
+    # page kept by PageManager: tasks changed elsewhere only need the current page re-queried
+    frame.refresh = table.reload
 
 
 #  Admin Panel 
@@ -618,21 +665,12 @@ def show_admin_panel(user_id, username, frame):
 
     # User list
     ttk.Label(exp_tab, text="Select User").grid(row=0, column=0, sticky="w", pady=(6, 2))
+    # filled in by users_loaded() once the DB worker returns
     users = []
-    try:
-        with db.connect() as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT id, username FROM users ORDER BY username")
-            users = cur.fetchall()
-    except Exception as e:
-        print(f"[Admin] error fetching users: {e}")
-
-    usernames_list = [u[1] for u in users] if users else []
     user_var = tk.StringVar()
-    user_combo = ttk.Combobox(exp_tab, values=usernames_list, textvariable=user_var, state="readonly")
+    user_combo = ttk.Combobox(exp_tab, values=[], textvariable=user_var, state="readonly")
     user_combo.grid(row=1, column=0, sticky="ew", padx=(0, 12))
-    if usernames_list:
-        user_combo.set(usernames_list[0])
+    user_combo.set("Loading...")
 
     # Display selected user's exp and level
     info_frame = ttk.Frame(exp_tab)
@@ -659,12 +697,13 @@ def show_admin_panel(user_id, username, frame):
             exp_label.config(text="EXP: —")
             level_label.config(text="Level: —")
             return
-        r = db.get_reward_data(uid)
-        exp_label.config(text=f"EXP: {r.get('exp', 0)}")
-        level_label.config(text=f"Level: {r.get('level', 1)}")
+        def show(r):
+            exp_label.config(text=f"EXP: {r.get('exp', 0)}")
+            level_label.config(text=f"Level: {r.get('level', 1)}")
+
+        _run_db(frame, db.get_reward_data, uid, on_done=show)
 
     user_combo.bind("<<ComboboxSelected>>", refresh_selected_user_info)
-    refresh_selected_user_info()
 
     # Amount entry
     ttk.Label(exp_tab, text="Amount (EXP)").grid(row=2, column=0, sticky="w", pady=(12, 0))
@@ -690,12 +729,15 @@ def show_admin_panel(user_id, username, frame):
         if uid is None:
             Messagebox.show_error("User not found.")
             return
-        res = db.add_exp(uid, amt)
-        if res.get("success"):
-            Messagebox.show_info(f"Added {amt} EXP to {sel}. New EXP: {res.get('exp')}")
+        def done(res):
+            if res.get("success"):
+                Messagebox.show_info(f"Added {amt} EXP to {sel}. New EXP: {res.get('exp')}")
+            else:
+                Messagebox.show_error("Failed to add EXP.")
             refresh_selected_user_info()
-        else:
-            Messagebox.show_error("Failed to add EXP.")
+
+        exp_label.config(text="EXP: saving...")
+        _run_db(frame, db.add_exp, uid, amt, on_done=done)
 
     def admin_subtract_exp():
         sel = user_var.get()
@@ -711,12 +753,15 @@ def show_admin_panel(user_id, username, frame):
         if uid is None:
             Messagebox.show_error("User not found.")
             return
-        res = db.add_exp(uid, -abs(amt))
-        if res.get("success"):
-            Messagebox.show_info(f"Subtracted {amt} EXP from {sel}. New EXP: {res.get('exp')}")
+        def done(res):
+            if res.get("success"):
+                Messagebox.show_info(f"Subtracted {amt} EXP from {sel}. New EXP: {res.get('exp')}")
+            else:
+                Messagebox.show_error("Failed to subtract EXP.")
             refresh_selected_user_info()
-        else:
-            Messagebox.show_error("Failed to subtract EXP.")
+
+        exp_label.config(text="EXP: saving...")
+        _run_db(frame, db.add_exp, uid, -abs(amt), on_done=done)
 
     def admin_set_exp():
         sel = user_var.get()
@@ -735,12 +780,15 @@ def show_admin_panel(user_id, username, frame):
         if uid is None:
             Messagebox.show_error("User not found.")
             return
-        ok = db.set_exp(uid, amt)
-        if ok:
-            Messagebox.show_info(f"Set {sel}'s EXP to {amt}.")
+        def done(ok):
+            if ok:
+                Messagebox.show_info(f"Set {sel}'s EXP to {amt}.")
+            else:
+                Messagebox.show_error("Failed to set EXP.")
             refresh_selected_user_info()
-        else:
-            Messagebox.show_error("Failed to set EXP.")
+
+        exp_label.config(text="EXP: saving...")
+        _run_db(frame, db.set_exp, uid, amt, on_done=done)
 
     ttk.Button(btns, text="Add EXP", command=admin_add_exp, bootstyle="success-outline").pack(side="left", padx=(0,6))
     ttk.Button(btns, text="Subtract EXP", command=admin_subtract_exp, bootstyle="warning-outline").pack(side="left", padx=(0,6))
@@ -758,38 +806,23 @@ def show_admin_panel(user_id, username, frame):
     
     ttk.Label(user_task_frame, text="Select User:").pack(side="left", padx=(0, 8))
     task_user_var = tk.StringVar()
-    task_user_combo = ttk.Combobox(user_task_frame, values=usernames_list, textvariable=task_user_var, state="readonly", width=20)
+    task_user_combo = ttk.Combobox(user_task_frame, values=[], textvariable=task_user_var, state="readonly", width=20)
     task_user_combo.pack(side="left", padx=(0, 12))
-    if usernames_list:
-        task_user_combo.set(usernames_list[0])
     
+    def selected_task_user_id():
+        return next((u[0] for u in users if u[1] == task_user_var.get()), None)
+
     def refresh_admin_tasks():
         selected_user = task_user_var.get()
-        if not selected_user:
+        selected_uid = selected_task_user_id()
+        if not selected_user or selected_uid is None:
             return
         
         # Clear existing table
-        for widget in task_display_frame.winfo_children():
-            widget.destroy()
+        clear_frame(task_display_frame)
         
-        # Get tasks for selected user
-        try:
-            rows_full = tasks.get_tasks_full_rows(selected_user)
-            if rows_full and len(rows_full[0]) >= 11:
-                rows = [[r[3], r[9], r[10], r[4], r[5], r[6]] for r in rows_full]
-                columns = ["Title", "Category", "Est. Time (min)", "Start Date", "Due Date", "Status"]
-            else:
-                rows = tasks.get_tasks_rows(selected_user)
-                columns = ["Title", "Start Date", "Due Date", "Status"]
-        except Exception:
-            rows = tasks.get_tasks_rows(selected_user)
-            columns = ["Title", "Start Date", "Due Date", "Status"]
-        
-        if not rows:
-            ttk.Label(task_display_frame, text=f"No tasks found for {selected_user}", foreground="#888").pack(pady=20)
-            return
-        
-        table = Tableview(master=task_display_frame, coldata=columns, rowdata=rows, paginated=False, searchable=True, height=15)
+        # Paged tasks for selected user
+        table = PagedTaskView(task_display_frame, selected_uid, height=15)
         table.pack(fill="both", expand=True)
         task_display_frame.table = table
     
@@ -812,19 +845,13 @@ def show_admin_panel(user_id, username, frame):
             Messagebox.show_error("Please select a task to delete.")
             return
         
-        selected_item = table.view.item(selected[0])["values"]
-        if not selected_item:
+        selected_uid = selected_task_user_id()
+        task_id = row_task_id(table.view, selected[0])
+        values = table.view.item(selected[0])["values"]
+        if task_id is None or len(values) < 2:
             Messagebox.show_error("Invalid task data.")
             return
-        
-        # Support both formats
-        if len(selected_item) >= 6:
-            title = selected_item[0]
-        elif len(selected_item) >= 4:
-            title = selected_item[0]
-        else:
-            Messagebox.show_error("Invalid task data format.")
-            return
+        title = values[1]
         
         # Confirm deletion
         confirm = Messagebox.okcancel(
@@ -835,14 +862,15 @@ def show_admin_panel(user_id, username, frame):
         if not confirm:
             return
         
-        # Perform deletion
-        success = tasks.safe_delete_task(selected_user, title)
+        def done(success):
+            if success:
+                Messagebox.show_info(f"Task deleted successfully for {selected_user}!")
+                _apply_task_change(task_display_frame, removed_id=task_id)
+            else:
+                Messagebox.show_error("Failed to delete task.")
         
-        if success:
-            Messagebox.show_info(f"Task deleted successfully for {selected_user}!")
-            refresh_admin_tasks()
-        else:
-            Messagebox.show_error("Failed to delete task.")
+        # Perform deletion
+        _run_db(frame, tasks.delete_task_by_id, task_id, user_id=selected_uid, on_done=done)
     
     ttk.Button(user_task_frame, text="🗑️ Delete Selected Task", command=admin_delete_task, bootstyle="danger").pack(side="left")
     
@@ -881,77 +909,99 @@ def show_admin_panel(user_id, username, frame):
         if not confirm:
             return
         
-        result = tasks.auto_delete_overdue(days)
-        if result.get("success"):
-            deleted_count = result.get("deleted", 0)
-            Messagebox.show_info(f"Auto-cleanup complete!\n\nDeleted {deleted_count} overdue task(s).")
-            refresh_admin_tasks()
-        else:
-            Messagebox.show_error(f"Auto-cleanup failed: {result.get('error', 'Unknown error')}")
+        def done(result):
+            if result.get("success"):
+                deleted_count = result.get("deleted", 0)
+                Messagebox.show_info(f"Auto-cleanup complete!\n\nDeleted {deleted_count} overdue task(s).")
+                refresh_admin_tasks()
+            else:
+                Messagebox.show_error(f"Auto-cleanup failed: {result.get('error', 'Unknown error')}")
+        
+        _run_db(frame, tasks.auto_delete_overdue, days, on_done=done)
     
     ttk.Button(cleanup_frame, text="🧹 Run Cleanup", command=run_auto_cleanup, bootstyle="warning").pack(side="left")
     
+    def users_loaded(rows):
+        users[:] = rows
+        usernames_list = [u[1] for u in users]
+        user_combo.configure(values=usernames_list)
+        task_user_combo.configure(values=usernames_list)
+        user_combo.set(usernames_list[0] if usernames_list else "")
+        task_user_combo.set(usernames_list[0] if usernames_list else "")
+        refresh_selected_user_info()
+        refresh_admin_tasks()
+
     # Initial load
-    refresh_admin_tasks()
+    _run_db(frame, db.get_all_users, on_done=users_loaded)
 
 
 #  Rewards Page
 def show_rewards(user_id, username, frame):
     clear_frame(frame)
     ttk.Label(frame, text="Rewards", font=("Segoe UI", 18, "bold")).pack(anchor="w", pady=(0, 10))
+    placeholder = loading_label(frame, "Loading rewards...")
+
+    def build(reward):
+        placeholder.destroy()
+        exp = reward.get("exp", 0)
+        level = reward.get("level", 1)
+        avatar = reward.get("avatar", "female_1.png")
+
+        # level text and progress
+        ttk.Label(frame, text=f"Level {level} • {exp} EXP", font=("Segoe UI", 11)).pack(anchor="w", pady=(0, 6))
+        progress_val = (exp % 100) / 100 * 100
+        ttk.Progressbar(frame, value=progress_val, maximum=100).pack(fill="x", pady=(0, 12))
+
+        # Equipped avatar large
+        av_img = _load_avatar_thumbnail(avatar, size=(120, 120))
+        av_frame = ttk.Frame(frame)
+        av_frame.pack(fill="x", pady=(6, 12))
+        if av_img:
+            lbl = ttk.Label(av_frame, image=av_img)
+            lbl.image = av_img
+            lbl.pack(side="left", padx=(0, 12))
+        ttk.Label(av_frame, text=f"Equipped: {avatar}", font=("Segoe UI", 11)).pack(anchor="w", side="left")
+
+        # Thumbnails
+        thumbs_frame = ttk.Frame(frame)
+        thumbs_frame.pack(fill="x", pady=(8, 0))
+        for fname, req_level in AVATAR_UNLOCKS:
+            unlocked = level >= req_level
+            img = _load_avatar_thumbnail(fname, size=(72, 72), greyscale=not unlocked)
+            frm = ttk.Frame(thumbs_frame, padding=6)
+            frm.pack(side="left", padx=6)
+            if img:
+                lbl = ttk.Label(frm, image=img)
+                lbl.image = img
+                lbl.pack()
+            ttk.Label(frm, text=f"Lvl {req_level}", font=("Segoe UI", 8)).pack()
+            if unlocked:
+                btn = ttk.Button(frm, text="Equip", command=lambda f=fname: _equip_avatar(user_id, f, frame))
+                btn.pack(pady=(6,0))
+            else:
+                ttk.Label(frm, text="Locked", font=("Segoe UI", 8), foreground="#888").pack(pady=(6,0))
 
-    reward = db.get_reward_data(user_id)
-    exp = reward.get("exp", 0)
-    level = reward.get("level", 1)
-    avatar = reward.get("avatar", "female_1.png")
-
-    # level text and progress
-    ttk.Label(frame, text=f"Level {level} • {exp} EXP", font=("Segoe UI", 11)).pack(anchor="w", pady=(0, 6))
-    progress_val = (exp % 100) / 100 * 100
-    ttk.Progressbar(frame, value=progress_val, maximum=100).pack(fill="x", pady=(0, 12))
-
-    # Equipped avatar large
-    av_img = _load_avatar_thumbnail(avatar, size=(120, 120))
-    av_frame = ttk.Frame(frame)
-    av_frame.pack(fill="x", pady=(6, 12))
-    if av_img:
-        lbl = ttk.Label(av_frame, image=av_img)
-        lbl.image = av_img
-        lbl.pack(side="left", padx=(0, 12))
-    ttk.Label(av_frame, text=f"Equipped: {avatar}", font=("Segoe UI", 11)).pack(anchor="w", side="left")
-
-    # Thumbnails
-    thumbs_frame = ttk.Frame(frame)
-    thumbs_frame.pack(fill="x", pady=(8, 0))
-    for fname, req_level in AVATAR_UNLOCKS:
-        unlocked = level >= req_level
-        img = _load_avatar_thumbnail(fname, size=(72, 72), greyscale=not unlocked)
-        frm = ttk.Frame(thumbs_frame, padding=6)
-        frm.pack(side="left", padx=6)
-        if img:
-            lbl = ttk.Label(frm, image=img)
-            lbl.image = img
-            lbl.pack()
-        ttk.Label(frm, text=f"Lvl {req_level}", font=("Segoe UI", 8)).pack()
-        if unlocked:
-            btn = ttk.Button(frm, text="Equip", command=lambda f=fname: _equip_avatar(user_id, f, frame))
-            btn.pack(pady=(6,0))
-        else:
-            ttk.Label(frm, text="Locked", font=("Segoe UI", 8), foreground="#888").pack(pady=(6,0))
+    _run_db(frame, db.get_reward_data, user_id, on_done=build)
 
 
 def _equip_avatar(user_id, avatar_filename, parent_frame=None):
-    ok = db.set_avatar(user_id, avatar_filename)
-    if ok:
-        Messagebox.show_info(f"Equipped {avatar_filename}")
-        if parent_frame:
-            try:
-                for w in parent_frame.winfo_children():
-                    w.destroy()
-            except Exception:
-                pass
-    else:
-        Messagebox.show_error("Failed to equip avatar.")
+    def done(ok):
+        if ok:
+            Messagebox.show_info(f"Equipped {avatar_filename}")
+            pages = getattr(getattr(parent_frame, "master", None), "pages", None)
+            if pages:
+                pages.refresh()  # rebuild the page showing the Equip button
+            elif parent_frame:
+                try:
+                    for w in parent_frame.winfo_children():
+                        w.destroy()
+                except Exception:
+                    pass
+        else:
+            Messagebox.show_error("Failed to equip avatar.")
+
+    widget = parent_frame if parent_frame is not None else tk._default_root
+    _run_db(widget, db.set_avatar, user_id, avatar_filename, on_done=done)
 
 
 #  Settings 
@@ -964,35 +1014,39 @@ def show_settings(user_id, username, frame):
     ttk.Separator(frame, orient="horizontal").pack(fill="x", pady=10)
     ttk.Label(frame, text="Avatar Customization", font=("Segoe UI", 12, "bold")).pack(anchor="w", pady=(8,6))
 
-    reward = db.get_reward_data(user_id)
-    level = reward.get("level", 1)
-    current_avatar = reward.get("avatar", "female_1.png")
-
     grid = ttk.Frame(frame)
     grid.pack(fill="x", pady=(6, 0))
-
-    for idx, (fname, req) in enumerate(AVATAR_UNLOCKS):
-        col = idx % 6
-        row = idx // 6
-        card_frame = ttk.Frame(grid, padding=8, relief="flat")
-        card_frame.grid(row=row, column=col, padx=6, pady=6)
-        unlocked = level >= req
-        img = _load_avatar_thumbnail(fname, size=(96, 96), greyscale=not unlocked)
-        if img:
-            lbl = ttk.Label(card_frame, image=img)
-            lbl.image = img
-            lbl.pack()
-
-        ttk.Label(card_frame, text=fname, font=("Segoe UI", 9)).pack()
-        ttk.Label(card_frame, text=f"Unlocks at Lvl {req}", font=("Segoe UI", 8), foreground="#666").pack()
-
-        if unlocked:
-            if fname == current_avatar:
-                ttk.Label(card_frame, text="Equipped", font=("Segoe UI", 9, "bold")).pack(pady=(4,0))
+    placeholder = loading_label(grid, "Loading avatars...")
+
+    def build_avatars(reward):
+        placeholder.destroy()
+        level = reward.get("level", 1)
+        current_avatar = reward.get("avatar", "female_1.png")
+
+        for idx, (fname, req) in enumerate(AVATAR_UNLOCKS):
+            col = idx % 6
+            row = idx // 6
+            card_frame = ttk.Frame(grid, padding=8, relief="flat")
+            card_frame.grid(row=row, column=col, padx=6, pady=6)
+            unlocked = level >= req
+            img = _load_avatar_thumbnail(fname, size=(96, 96), greyscale=not unlocked)
+            if img:
+                lbl = ttk.Label(card_frame, image=img)
+                lbl.image = img
+                lbl.pack()
+
+            ttk.Label(card_frame, text=fname, font=("Segoe UI", 9)).pack()
+            ttk.Label(card_frame, text=f"Unlocks at Lvl {req}", font=("Segoe UI", 8), foreground="#666").pack()
+
+            if unlocked:
+                if fname == current_avatar:
+                    ttk.Label(card_frame, text="Equipped", font=("Segoe UI", 9, "bold")).pack(pady=(4,0))
+                else:
+                    ttk.Button(card_frame, text="Equip", command=lambda f=fname: _equip_avatar(user_id, f, frame)).pack(pady=(6,0))
             else:
-                ttk.Button(card_frame, text="Equip", command=lambda f=fname: _on_equip_click(user_id, f, frame)).pack(pady=(6,0))
-        else:
-            ttk.Label(card_frame, text="Locked", foreground="#999").pack(pady=(6,0))
+                ttk.Label(card_frame, text="Locked", foreground="#999").pack(pady=(6,0))
+
+    _run_db(frame, db.get_reward_data, user_id, on_done=build_avatars)
 
     # -------------------------
     # Dark Mode / Theme Toggle
@@ -1017,7 +1071,7 @@ def show_settings(user_id, username, frame):
         try:
             # ttkbootstrap: constructing Style with the theme will apply it to the running Tk root.
             # Prefer using the current dashboard root if available so existing widgets refresh.
-            root = TIMER_STATE.get("root") or tk._default_root
+            root = timer.root or tk._default_root
             # Creating a Style instance should apply the theme; pass master if constructor supports it.
             try:
                 # common usage
@@ -1080,109 +1134,82 @@ def show_settings(user_id, username, frame):
 
 
 #  Analytics 
-def show_analytic(username, frame):
+def _draw_analytics(slot, stats):
+    """Fill the Analytics chart slot; later calls update the same artists."""
+    monthly_counts = stats["monthly_counts"]
+    ax1 = slot.subplot("monthly", 131, "Tasks per Month")
+    slot.bar("monthly", ax1, [m for m, _ in monthly_counts], [c for _, c in monthly_counts])
+    ax1.tick_params(axis="x", rotation=45)
+
+    ax2 = slot.subplot("distribution", 132, "Task Distribution")
+    slot.pie("distribution", ax2, ["Completed", "In Progress", "Overdue"],
+             [stats["completed"], stats["in_progress"], stats["overdue"]])
+
+    # cumulative tasks by due date (one point per day, not per task)
+    due_counts = stats["due_counts"]
+    days = [datetime.strptime(d, "%Y-%m-%d") for d, _ in due_counts]
+    running, totals = 0, []
+    for _, c in due_counts:
+        running += c
+        totals.append(running)
+    ax3 = slot.subplot("timeline", 133, "Task Timeline")
+    slot.line("timeline", ax3, days, totals, empty_text="No due date data", dates=True, marker="o")
+    ax3.tick_params(axis="x", rotation=30)
+
+def show_analytic(user_id, username, frame):
     clear_frame(frame)
     ttk.Label(frame, text="Analytics", font=("Segoe UI", 18, "bold")).pack(anchor="w", pady=(0, 10))
     ttk.Label(frame, text=f"Comprehensive productivity insights for {username}.",
               font=("Segoe UI", 10), foreground="#6c757d").pack(anchor="w", pady=(0, 15))
 
-    rows = tasks.get_tasks_rows(username)
-    if not rows:
-        ttk.Label(frame, text="No tasks found to analyze.", foreground="#888").pack(anchor="w", pady=10)
-        return
-
-    df = analytics.build_tasks_dataframe(rows)
-    stats = analytics.compute_stats(df)
-
-    stats_frame = ttk.Frame(frame)
-    stats_frame.pack(fill="x", pady=8)
-    card(stats_frame, "Total Tasks", stats["total"], "📋")
-    card(stats_frame, "Completed", stats["completed"], "✅")
-    card(stats_frame, "In Progress", stats["in_progress"], "🔁")
-    card(stats_frame, "Overdue", stats["overdue"], "⚠️")
-
-    monthly_counts = stats["monthly_counts"]
-
-    fig = Figure(figsize=(10, 4), dpi=100)
-    ax1 = fig.add_subplot(131)
-    ax2 = fig.add_subplot(132)
-    ax3 = fig.add_subplot(133)
-
-    ax1.bar(monthly_counts.index.astype(str), monthly_counts.values)
-    ax1.set_title("Tasks per Month", fontsize=9)
-    ax1.tick_params(axis="x", rotation=45)
-
-    labels = ["Completed", "In Progress", "Overdue"]
-    values = [stats["completed"], stats["in_progress"], stats["overdue"]]
-    ax2.pie(values, labels=labels, autopct="%1.1f%%", startangle=90)
-    ax2.set_title("Task Distribution", fontsize=9)
+    # data-bound part, reloaded by PageManager when the tasks changed
+    body = ttk.Frame(frame)
+    body.pack(fill="both", expand=True)
+    frame.refresh = lambda: _load_analytics(user_id, frame, body)
+    frame.refresh()
+
+def _load_analytics(user_id, frame, body):
+    clear_frame(body)
+    placeholder = loading_label(body, "Loading analytics...")
+
+    def load():
+        # counts and chart series, memoized until the user's tasks change
+        version = analytics_cache.data_version(user_id)
+        today = datetime.now().strftime("%Y-%m-%d")
+        stats = analytics_cache.cached("analytics_stats", user_id, version,
+                                       lambda: task_stats.analytics_stats(user_id, today), today)
+        # focus totals follow the focus version, so a timer flush leaves the
+        # task stats and the chart alone
+        focus = analytics_cache.cached("focus_totals", user_id, analytics_cache.focus_version(user_id),
+                                       lambda: task_stats.focus_totals(user_id, today), today)
+        return version, today, stats, focus
+
+    def build(result):
+        version, today, stats, focus = result
+        placeholder.destroy()
+        if not stats["total"]:
+            ttk.Label(body, text="No tasks found to analyze.", foreground="#888").pack(anchor="w", pady=10)
+            return
 
-    if not df["Due"].isna().all():
-        df_sorted = df.sort_values("Due")
-        ax3.plot(df_sorted["Due"], range(1, len(df_sorted) + 1), marker="o")
-        ax3.set_title("Task Timeline", fontsize=9)
-        ax3.tick_params(axis="x", rotation=30)
-    else:
-        ax3.text(0.5, 0.5, "No due date data", ha="center", va="center", color="#888")
-
-    chart_frame = ttk.Frame(frame)
-    chart_frame.pack(fill="both", expand=True, pady=(10, 20))
-    canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill="both", expand=True)
-
-
-#  Timer Logic 
-def refresh_timer_label():
-    if TIMER_STATE["label"]:
-        sec = int(TIMER_STATE["seconds"])
-        h = sec // 3600
-        m = (sec % 3600) // 60
-        s = sec % 60
-        TIMER_STATE["label"].config(text=f"{h:02}:{m:02}:{s:02}")
-
-def update_timer():
-    if TIMER_STATE["running"]:
-        current_time = time.time()
-        elapsed = current_time - TIMER_STATE.get("start_time", current_time)
-        TIMER_STATE["seconds"] = TIMER_STATE.get("base_seconds", 0) + elapsed
-        refresh_timer_label()
-    if TIMER_STATE.get("root"):
-        TIMER_STATE["after_id"] = TIMER_STATE["root"].after(1000, update_timer)
-
-def start_timer():
-    if not TIMER_STATE["running"]:
-        TIMER_STATE["running"] = True
-        TIMER_STATE["start_time"] = time.time()
-        TIMER_STATE["base_seconds"] = TIMER_STATE.get("seconds", 0)
-        if not TIMER_STATE.get("after_id"):
-            TIMER_STATE["after_id"] = TIMER_STATE["root"].after(1000, update_timer)
-
-def pause_timer():
-    if TIMER_STATE["running"]:
-        TIMER_STATE["running"] = False
-        TIMER_STATE["base_seconds"] = TIMER_STATE.get("seconds", 0)
-        TIMER_STATE["start_time"] = None
-    if TIMER_STATE.get("after_id") and TIMER_STATE.get("root"):
-        try:
-            TIMER_STATE["root"].after_cancel(TIMER_STATE["after_id"])
-        except Exception:
-            pass
-        TIMER_STATE["after_id"] = None
+        stats_frame = ttk.Frame(body)
+        stats_frame.pack(fill="x", pady=8)
+        card(stats_frame, "Total Tasks", stats["total"], "📋")
+        card(stats_frame, "Completed", stats["completed"], "✅")
+        card(stats_frame, "In Progress", stats["in_progress"], "🔁")
+        card(stats_frame, "Overdue", stats["overdue"], "⚠️")
+        card(stats_frame, "Est. Time", f"{stats['est_minutes'] / 60:.1f}h", "⏱")
+        card(stats_frame, "Focus (7 days)", _format_focus(focus["week"]), "🎯")
 
-def reset_timer():
-    if TIMER_STATE.get("after_id") and TIMER_STATE.get("root"):
-        try:
-            TIMER_STATE["root"].after_cancel(TIMER_STATE["after_id"])
-        except Exception:
-            pass
-        TIMER_STATE["after_id"] = None
+        # one canvas for the Analytics page (owned by the page frame, so it
+        # survives body reloads); only redrawn when the data changed
+        chart_frame = ttk.Frame(body)
+        chart_frame.pack(fill="both", expand=True, pady=(10, 20))
+        slot = chart_renderer.renderer.slot("analytics", frame, figsize=(10, 4))
+        slot.render(None if version is None else (user_id, version, today),
+                    lambda s: _draw_analytics(s, stats))
+        slot.show(chart_frame, fill="both", expand=True)
 
-    TIMER_STATE["running"] = False
-    TIMER_STATE["seconds"] = 0
-    TIMER_STATE["base_seconds"] = 0
-    TIMER_STATE["start_time"] = None
-    refresh_timer_label()
+    _run_db(body, load, on_done=build)
 
 
 #  Overview 
@@ -1192,43 +1219,35 @@ def show_welcome(user_id, username, frame):
     ttk.Label(frame, text="Your productivity overview for today.", font=("Segoe UI", 10),
               foreground="#6c757d").pack(anchor="w", pady=(4, 10))
 
-    tasks_rows = tasks.get_tasks_rows(username)
-    completed = in_progress = overdue = 0
+    # data-bound part, reloaded by PageManager when the tasks changed
+    body = ttk.Frame(frame)
+    body.pack(fill="both", expand=True)
+    frame.refresh = lambda: _load_welcome_stats(user_id, body)
+    frame.refresh()
+
+def _load_welcome_stats(user_id, body):
+    clear_frame(body)
+    placeholder = loading_label(body, "Loading overview...")
 
-    if tasks_rows:
-        for t in tasks_rows:
-            status = str(t[3]).strip().lower() if len(t) > 3 else ""
-            if status == "completed":
-                completed += 1
-            elif status == "in progress":
-                in_progress += 1
-            elif status == "overdue":
-                overdue += 1
+    def build(stats):
+        placeholder.destroy()
 
-    focus_time = completed * 60
+        stats_frame = ttk.Frame(body)
+        stats_frame.pack(fill="x", pady=(18, 12))
+        card(stats_frame, "Completed", stats["completed"], icon="✅")
+        card(stats_frame, "In Progress", stats["in_progress"], icon="🔁")
+        card(stats_frame, "Overdue", stats["overdue"], icon="⚠️")
+        card(stats_frame, "Focus Today", _format_focus(stats["focus"]["today"]), icon="⏱")
 
-    stats_frame = ttk.Frame(frame)
-    stats_frame.pack(fill="x", pady=(18, 12))
-    card(stats_frame, "Completed", completed, icon="✅")
-    card(stats_frame, "In Progress", in_progress, icon="🔁")
-    card(stats_frame, "Overdue", overdue, icon="⚠️")
-    card(stats_frame, "Focus Time", f"{focus_time}m", icon="⏱")
+    # one GROUP BY over the rollup, one indexed SUM over focus_sessions
+    _run_db(body, task_stats.overview_stats, user_id, on_done=build)
 
 
 #  Logout 
 def logout_action(root):
-    # Stop timer if running
-    if TIMER_STATE.get("after_id") and TIMER_STATE.get("root"):
-        try:
-            TIMER_STATE["root"].after_cancel(TIMER_STATE["after_id"])
-        except Exception:
-            pass
-        TIMER_STATE["after_id"] = None
-
-    TIMER_STATE["running"] = False
-    TIMER_STATE["seconds"] = 0
-    TIMER_STATE["base_seconds"] = 0
-    TIMER_STATE["start_time"] = None
+    # Stop timer if running; its session is stored first
+    focus_sessions.recorder.close(timer)
+    timer.reset()
 
     # Confirm logout
     confirm = Messagebox.okcancel("Are you sure you want to logout?", "Logout Confirmation")
@@ -1,6 +1,10 @@
 import sqlite3
 import json
 import os
+import re
+from datetime import date, datetime
+
+import db_pool
 
 DB_NAME = "worktracker.db"
 SESSION_FILE = "session.json"
@@ -8,8 +12,16 @@ SESSION_FILE = "session.json"
 #  DATABASE CONNECTION 
 
 def connect():
-    conn = sqlite3.connect(DB_NAME, timeout=5)
-    return conn
+    """
+    Borrow a pooled connection for DB_NAME.
+    Use as `with connect() as conn:` - commits on success, rolls back on error
+    and returns the connection to the per-thread pool.
+    """
+    return db_pool.PooledConnection(DB_NAME)
+
+def connection_stats():
+    """Return how many connections were opened vs. reused from the pool."""
+    return db_pool.stats()
 
 def create_user_table():
     with connect() as conn:
@@ -81,6 +93,401 @@ def migrate_schema_if_needed():
                 except Exception as e:
                     print(f"[DB] migrate_schema_if_needed error adding {col_name}: {e}")
 
+    run_data_migrations()
+    create_task_indexes()
+    create_task_search_index()
+    create_task_rollup()
+    create_data_versions()
+    create_focus_sessions_table()
+
+# (name, columns) - every task query filters on one of these prefixes
+TASK_INDEXES = [
+    ("idx_tasks_user_id", "user_id, id"),
+    ("idx_tasks_user_title_start", "user_id, title, start_date"),
+    ("idx_tasks_due_status", "due_date, status"),
+    # also covers task_stats.task_summary (GROUP BY status with due/minute totals)
+    ("idx_tasks_user_status_due_est", "user_id, status, due_date, estimated_minutes"),
+    ("idx_tasks_user_due", "user_id, due_date"),
+    ("idx_tasks_user_start", "user_id, start_date"),
+]
+
+# superseded by the indexes above
+DROPPED_INDEXES = ["idx_tasks_username_id", "idx_tasks_username_title_start",
+                   "idx_tasks_user_status_due"]
+
+def backfill_task_user_ids():
+    # Older rows may only carry the username; copy the matching users.id over
+    with connect() as conn:
+        cur = conn.execute("""
+            UPDATE tasks
+            SET user_id = (SELECT u.id FROM users u WHERE u.username = tasks.username)
+            WHERE user_id IS NULL
+              AND username IN (SELECT username FROM users)
+        """)
+        if cur.rowcount > 0:
+            print(f"[DB] Migrated: backfilled user_id on {cur.rowcount} task(s).")
+
+#  DATE STORAGE
+# Task dates are stored as ISO 'YYYY-MM-DD' text so range predicates
+# (start_date >= ? AND due_date <= ?) compare correctly as strings and
+# can use the (user_id, start_date) / (user_id, due_date) indexes.
+DATE_FORMAT = "%Y-%m-%d"
+# other spellings accepted on input and fixed by the migration
+DATE_INPUT_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S",
+                      "%Y/%m/%d", "%m/%d/%Y", "%d.%m.%Y"]
+
+def normalize_date(value):
+    """
+    ISO 'YYYY-MM-DD' for a date/datetime or a date string in one of
+    DATE_INPUT_FORMATS. Empty values stay as they are; anything
+    unparsable is returned unchanged.
+    """
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    if not isinstance(value, str) or not value.strip():
+        return value
+    text = value.strip()
+    for fmt in [DATE_FORMAT] + DATE_INPUT_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime(DATE_FORMAT)
+        except ValueError:
+            continue
+    return value
+
+def normalize_task_dates():
+    """One-off migration: rewrite non-ISO start/due dates in place."""
+    iso = "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+    with connect() as conn:
+        rows = conn.execute(f"""
+            SELECT id, start_date, due_date FROM tasks
+            WHERE (start_date != '' AND start_date NOT GLOB {iso})
+               OR (due_date != '' AND due_date NOT GLOB {iso})
+        """).fetchall()
+        fixed = 0
+        for task_id, start, due in rows:
+            new_start, new_due = normalize_date(start), normalize_date(due)
+            if (new_start, new_due) != (start, due):
+                conn.execute("UPDATE tasks SET start_date = ?, due_date = ? WHERE id = ?",
+                             (new_start, new_due, task_id))
+                fixed += 1
+    if fixed:
+        print(f"[DB] Migrated: normalized dates on {fixed} task(s).")
+
+#  ONE-TIME DATA MIGRATIONS
+# Fixes that only need to run once per database file (their queries scan
+# tasks). PRAGMA user_version counts how many of them the file has had;
+# only append to this list, never reorder it.
+DATA_MIGRATIONS = [backfill_task_user_ids, normalize_task_dates]
+
+def run_data_migrations():
+    """Run the DATA_MIGRATIONS this database hasn't had yet; returns how many ran."""
+    with connect() as conn:
+        done = conn.execute("PRAGMA user_version").fetchone()[0]
+    for version, migration in enumerate(DATA_MIGRATIONS[done:], start=done + 1):
+        migration()
+        with connect() as conn:
+            conn.execute(f"PRAGMA user_version = {version}")
+    return max(0, len(DATA_MIGRATIONS) - done)
+
+def create_task_indexes():
+    with connect() as conn:
+        for name in DROPPED_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for name, cols in TASK_INDEXES:
+            try:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON tasks ({cols})")
+            except Exception as e:
+                print(f"[DB] create_task_indexes error for {name}: {e}")
+
+#  FULL-TEXT SEARCH
+# tasks_fts is an external-content FTS5 index over tasks.title/description;
+# the triggers keep it in sync with every insert/update/delete on tasks.
+FTS_ENABLED = False
+
+TASK_FTS_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+def create_task_search_index():
+    """
+    Create tasks_fts and its sync triggers (indexing existing tasks the
+    first time). If this SQLite build has no FTS5, searches fall back to LIKE.
+    """
+    global FTS_ENABLED
+    try:
+        with connect() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='tasks_fts'"
+            ).fetchone()
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts
+                USING fts5(title, description, content='tasks', content_rowid='id')
+            """)
+            for trigger in TASK_FTS_TRIGGERS:
+                conn.execute(trigger)
+            if not exists:
+                conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+                print("[DB] Migrated: built full-text index for tasks.")
+        FTS_ENABLED = True
+    except sqlite3.OperationalError as e:
+        print(f"[DB] FTS5 unavailable, task search uses LIKE: {e}")
+        FTS_ENABLED = False
+    return FTS_ENABLED
+
+def fts_query(text):
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text or ""))
+
+#  DAILY ROLLUP
+# task_daily_rollup holds task counts and estimated minutes per
+# (user, date field, day, status, category). Every task is counted once
+# under field='start' (its start_date) and once under field='due' (its
+# due_date). Day, status and category are normalized ('' for missing,
+# status lower-cased) so the analytics only read pre-grouped rows.
+ROLLUP_FIELDS = {"start": "start_date", "due": "due_date"}
+
+def _rollup_key_sql(row, field):
+    # key expressions for one side (`new` / `old`) of a trigger
+    return (f"{row}.user_id, '{field}', COALESCE(date({row}.{ROLLUP_FIELDS[field]}), ''), "
+            f"COALESCE(LOWER(TRIM({row}.status)), ''), COALESCE({row}.category, '')")
+
+def _rollup_add_sql(row):
+    return "\n".join(f"""
+        INSERT INTO task_daily_rollup (user_id, field, day, status, category, task_count, est_minutes)
+        SELECT {_rollup_key_sql(row, field)}, 1, COALESCE({row}.estimated_minutes, 0)
+        WHERE {row}.user_id IS NOT NULL
+        ON CONFLICT (user_id, field, day, status, category) DO UPDATE SET
+            task_count = task_count + 1,
+            est_minutes = est_minutes + excluded.est_minutes;""" for field in ROLLUP_FIELDS)
+
+def _rollup_remove_sql(row):
+    return "\n".join(f"""
+        UPDATE task_daily_rollup SET
+            task_count = task_count - 1,
+            est_minutes = est_minutes - COALESCE({row}.estimated_minutes, 0)
+        WHERE (user_id, field, day, status, category) = ({_rollup_key_sql(row, field)});
+        DELETE FROM task_daily_rollup
+        WHERE (user_id, field, day, status, category) = ({_rollup_key_sql(row, field)})
+          AND task_count <= 0;""" for field in ROLLUP_FIELDS)
+
+TASK_ROLLUP_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_ai AFTER INSERT ON tasks BEGIN
+        {_rollup_add_sql("new")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_ad AFTER DELETE ON tasks BEGIN
+        {_rollup_remove_sql("old")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_rollup_au
+        AFTER UPDATE OF user_id, start_date, due_date, status, category, estimated_minutes ON tasks BEGIN
+        {_rollup_remove_sql("old")}
+        {_rollup_add_sql("new")}
+    END""",
+]
+
+def create_task_rollup():
+    """Create task_daily_rollup and its triggers; fills it on first creation."""
+    with connect() as conn:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='task_daily_rollup'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS task_daily_rollup (
+                user_id INTEGER NOT NULL,
+                field TEXT NOT NULL,
+                day TEXT NOT NULL,
+                status TEXT NOT NULL,
+                category TEXT NOT NULL,
+                task_count INTEGER NOT NULL DEFAULT 0,
+                est_minutes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, field, day, status, category)
+            ) WITHOUT ROWID
+        """)
+        for trigger in TASK_ROLLUP_TRIGGERS:
+            conn.execute(trigger)
+    if not exists:
+        rebuild_task_rollup()
+        print("[DB] Migrated: built task_daily_rollup.")
+
+def _rollup_select_sql(where="user_id IS NOT NULL"):
+    return " UNION ALL ".join(f"""
+        SELECT user_id, '{field}', COALESCE(date({col}), ''), COALESCE(LOWER(TRIM(status)), ''),
+               COALESCE(category, ''), COUNT(*), SUM(COALESCE(estimated_minutes, 0))
+        FROM tasks WHERE {where}
+        GROUP BY 1, 2, 3, 4, 5""" for field, col in ROLLUP_FIELDS.items())
+
+def rebuild_task_rollup(user_id=None):
+    """
+    Recompute task_daily_rollup from tasks (all users, or one user) to
+    repair any drift. Returns the number of rollup rows written, or None on error.
+    """
+    where, params = ("user_id IS NOT NULL", ()) if user_id is None else ("user_id = ?", (user_id,) * len(ROLLUP_FIELDS))
+    try:
+        with connect() as conn:
+            if user_id is None:
+                conn.execute("DELETE FROM task_daily_rollup")
+            else:
+                conn.execute("DELETE FROM task_daily_rollup WHERE user_id = ?", (user_id,))
+            cur = conn.execute(
+                "INSERT INTO task_daily_rollup (user_id, field, day, status, category, task_count, est_minutes) "
+                + _rollup_select_sql(where), params
+            )
+            return cur.rowcount
+    except Exception as e:
+        print(f"[DB] rebuild_task_rollup error: {e}")
+        return None
+
+def check_task_rollup():
+    """Number of rollup rows that differ from a fresh recount (0 = no drift)."""
+    cols = "user_id, field, day, status, category, task_count, est_minutes"
+    with connect() as conn:
+        return conn.execute(f"""
+            SELECT COUNT(*) FROM (
+                SELECT {cols} FROM task_daily_rollup EXCEPT SELECT * FROM ({_rollup_select_sql()})
+                UNION ALL
+                SELECT * FROM ({_rollup_select_sql()}) EXCEPT SELECT {cols} FROM task_daily_rollup
+            )
+        """).fetchone()[0]
+
+#  DATA VERSIONS
+# task_data_versions.version goes up on every insert/update/delete of a
+# user's tasks (whoever writes them), so caches of derived results can be
+# keyed on (user_id, version) and never serve stale numbers.
+TASK_VERSION_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS tasks_version_ai AFTER INSERT ON tasks
+        WHEN new.user_id IS NOT NULL BEGIN
+        INSERT INTO task_data_versions (user_id, version) VALUES (new.user_id, 1)
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_version_ad AFTER DELETE ON tasks
+        WHEN old.user_id IS NOT NULL BEGIN
+        INSERT INTO task_data_versions (user_id, version) VALUES (old.user_id, 1)
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_version_au AFTER UPDATE ON tasks BEGIN
+        INSERT INTO task_data_versions (user_id, version)
+        SELECT new.user_id, 1 WHERE new.user_id IS NOT NULL
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+        INSERT INTO task_data_versions (user_id, version)
+        SELECT old.user_id, 1 WHERE old.user_id IS NOT NULL AND old.user_id IS NOT new.user_id
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+    END""",
+]
+
+def create_data_versions():
+    with connect() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS task_data_versions (
+                user_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        for trigger in TASK_VERSION_TRIGGERS:
+            conn.execute(trigger)
+
+def get_data_version(user_id):
+    """Current task data version of a user (0 if their tasks never changed)."""
+    try:
+        with connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM task_data_versions WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            return row[0] if row else 0
+    except Exception as e:
+        print(f"[DB] get_data_version error: {e}")
+        return None
+
+#  FOCUS SESSIONS
+# One row per timer session: wall-clock start/end ("YYYY-MM-DD HH:MM:SS.fff",
+# so day/range filters are prefix compares), seconds measured on the
+# timer's monotonic clock. A running session is written
+# again at every flush (upsert on user_id + start), so it is never lost.
+# focus_data_versions is the focus counterpart of task_data_versions: a
+# flush invalidates focus totals only, never task caches or pages.
+FOCUS_VERSION_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS focus_data_version_ai AFTER INSERT ON focus_sessions BEGIN
+        INSERT INTO focus_data_versions (user_id, version) VALUES (new.user_id, 1)
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS focus_data_version_au AFTER UPDATE ON focus_sessions BEGIN
+        INSERT INTO focus_data_versions (user_id, version) VALUES (new.user_id, 1)
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+    END""",
+]
+
+# superseded: bumped task_data_versions on every focus flush
+DROPPED_TRIGGERS = ["focus_version_ai", "focus_version_au"]
+
+def create_focus_sessions_table():
+    with connect() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS focus_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                task_id INTEGER,
+                start TEXT NOT NULL,
+                end TEXT NOT NULL,
+                seconds INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (user_id, start),
+                FOREIGN KEY(user_id) REFERENCES users(id),
+                FOREIGN KEY(task_id) REFERENCES tasks(id)
+            )
+        """)
+        # covers task_stats.focus_totals: the sums never touch the table rows
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_focus_user_start_seconds "
+                     "ON focus_sessions (user_id, start, seconds)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS focus_data_versions (
+                user_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        for name in DROPPED_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for trigger in FOCUS_VERSION_TRIGGERS:
+            conn.execute(trigger)
+
+def get_focus_version(user_id):
+    """Current focus session version of a user (0 if none were ever stored)."""
+    try:
+        with connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM focus_data_versions WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            return row[0] if row else 0
+    except Exception as e:
+        print(f"[DB] get_focus_version error: {e}")
+        return None
+
+def save_focus_sessions(rows):
+    """
+    Write [(user_id, task_id, start, end, seconds), ...] in one transaction;
+    a row whose (user_id, start) exists replaces its end/seconds/task.
+    Returns the number of rows written, or None on error.
+    """
+    try:
+        with connect() as conn:
+            conn.executemany("""
+                INSERT INTO focus_sessions (user_id, task_id, start, end, seconds)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (user_id, start) DO UPDATE
+                SET task_id = excluded.task_id, end = excluded.end, seconds = excluded.seconds
+            """, rows)
+        return len(rows)
+    except Exception as e:
+        print(f"[DB] save_focus_sessions error: {e}")
+        return None
+
 # USER OPERATIONS 
 
 def insert_user(username, password):
@@ -104,6 +511,25 @@ def get_user(username):
         cur.execute("SELECT * FROM users WHERE username = ?", (username,))
         return cur.fetchone()
 
+def get_user_id(username):
+    """Return the users.id for `username`, or None."""
+    try:
+        with connect() as conn:
+            row = conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+            return row[0] if row else None
+    except Exception as e:
+        print(f"[DB] get_user_id error: {e}")
+        return None
+
+def get_all_users():
+    """Return [(id, username), ...] ordered by username."""
+    try:
+        with connect() as conn:
+            return conn.execute("SELECT id, username FROM users ORDER BY username").fetchall()
+    except Exception as e:
+        print(f"[DB] get_all_users error: {e}")
+        return []
+
 def register_user(username, password):
     if get_user(username):
         print("[DB] register_user: username already exists.")
@@ -159,21 +585,39 @@ def add_task(user_id, username, title, start_date, due_date, status="In Progress
       - category (TEXT)
       - estimated_minutes (INTEGER)
     """
+    return insert_task(user_id, username, title, start_date, due_date, status,
+                       description, priority, category, estimated_minutes) is not None
+
+def insert_task(user_id, username, title, start_date, due_date, status="In Progress",
+                description=None, priority="Medium", category=None, estimated_minutes=0):
+    """Same as add_task but returns the new task id (None on failure)."""
+    if user_id is None:
+        user_id = get_user_id(username)
+    start_date, due_date = normalize_date(start_date), normalize_date(due_date)
     try:
         with connect() as conn:
-            conn.execute("""
+            cur = conn.execute("""
                 INSERT INTO tasks (user_id, username, title, start_date, due_date, status,
                                    description, priority, category, estimated_minutes)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (user_id, username, title, start_date, due_date, status,
                   description, priority, category, estimated_minutes))
         print(f"[DB] Task added for {username}: {title}")
-        return True
+        return cur.lastrowid
     except Exception as e:
         print(f"[DB] add_task error: {e}")
-        return False
+        return None
 
-def get_tasks(username):
+TASK_FULL_COLUMNS = ("id, user_id, username, title, start_date, due_date, status, "
+                     "description, priority, category, estimated_minutes")
+
+# task queries, shared with db_tuning.task_query_plans() (which checks they stay index-backed)
+GET_TASKS_SQL = "SELECT title, start_date, due_date, status FROM tasks WHERE user_id = ? ORDER BY id DESC"
+GET_TASKS_FULL_SQL = f"SELECT {TASK_FULL_COLUMNS} FROM tasks WHERE user_id = ? ORDER BY id DESC"
+TASK_BY_ID_SQL = f"SELECT {TASK_FULL_COLUMNS} FROM tasks WHERE id = ? AND user_id = ?"
+DELETE_TASKS_BY_TITLE_SQL = "DELETE FROM tasks WHERE user_id = ? AND title = ?"
+
+def get_tasks_for_user(user_id):
     """
     Return the standard rows used by the UI table:
     (title, start_date, due_date, status)
@@ -181,16 +625,13 @@ def get_tasks(username):
     try:
         with connect() as conn:
             cur = conn.cursor()
-            cur.execute(
-                "SELECT title, start_date, due_date, status FROM tasks WHERE username = ? ORDER BY id DESC",
-                (username,)
-            )
+            cur.execute(GET_TASKS_SQL, (user_id,))
             return cur.fetchall()
     except Exception as e:
-        print(f"[DB] get_tasks error: {e}")
+        print(f"[DB] get_tasks_for_user error: {e}")
         return []
 
-def get_tasks_full(username):
+def get_tasks_full_for_user(user_id):
     """
     Return full task rows including extended fields:
     (id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes)
@@ -198,43 +639,187 @@ def get_tasks_full(username):
     try:
         with connect() as conn:
             cur = conn.cursor()
-            cur.execute(
-                "SELECT id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes FROM tasks WHERE username = ? ORDER BY id DESC",
-                (username,)
-            )
+            cur.execute(GET_TASKS_FULL_SQL, (user_id,))
             return cur.fetchall()
     except Exception as e:
-        print(f"[DB] get_tasks_full error: {e}")
+        print(f"[DB] get_tasks_full_for_user error: {e}")
         return []
 
-def delete_task(username, title):
+def delete_task_for_user(user_id, title):
     try:
         with connect() as conn:
-            conn.execute(
-                "DELETE FROM tasks WHERE username = ? AND title = ?",
-                (username, title)
-            )
-        print(f"[DB] Task '{title}' deleted for {username}.")
+            conn.execute(DELETE_TASKS_BY_TITLE_SQL, (user_id, title))
+        print(f"[DB] Task '{title}' deleted for user_id={user_id}.")
         return True
     except Exception as e:
-        print(f"[DB] delete_task error: {e}")
+        print(f"[DB] delete_task_for_user error: {e}")
         return False
 
+def get_task_for_user(user_id, task_id):
+    """One full task row by id (primary key lookup), or None if it isn't the user's."""
+    try:
+        with connect() as conn:
+            return conn.execute(TASK_BY_ID_SQL, (task_id, user_id)).fetchone()
+    except Exception as e:
+        print(f"[DB] get_task_for_user error: {e}")
+        return None
+
+# sort key -> column position in a full row
+TASK_SORT_KEYS = {
+    "id": 0, "title": 3, "start_date": 4, "due_date": 5, "status": 6,
+    "priority": 8, "category": 9, "estimated_minutes": 10,
+}
+
+TASK_FILTER_COLUMNS = ("status", "priority", "category")
+TASK_DATE_COLUMNS = ("start_date", "due_date")
+
+def _task_filter_sql(user_id, search=None, filters=None):
+    """
+    FROM clause, WHERE clauses, params and the id expression for a user's tasks.
+    search: free text matched against title/description (FTS5 when available).
+    filters: status / priority / category (a value or a list of values),
+    date_from / date_to (inclusive, 'YYYY-MM-DD') on date_field (default due_date).
+    """
+    filters = filters or {}
+    source, id_col = "tasks", "tasks.id"
+    where = ["tasks.user_id = ?"]
+    params = [user_id]
+
+    query = fts_query(search) if search else ""
+    if query and FTS_ENABLED:
+        # drive the query from the FTS index (CROSS JOIN pins the loop order):
+        # it yields matches in rowid order, so id-sorted pages stop after LIMIT rows
+        source = "tasks_fts CROSS JOIN tasks ON tasks.id = tasks_fts.rowid"
+        id_col = "tasks_fts.rowid"
+        where.insert(0, "tasks_fts MATCH ?")
+        params.insert(0, query)
+    elif search:
+        where.append("(tasks.title LIKE ? OR tasks.description LIKE ?)")
+        params += [f"%{search}%"] * 2
+
+    for col in TASK_FILTER_COLUMNS:
+        value = filters.get(col)
+        if value is None or value == "" or value == []:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            values = list(value)
+            where.append(f"tasks.{col} IN ({', '.join('?' * len(values))})")
+            params += values
+        else:
+            where.append(f"tasks.{col} = ?")
+            params.append(value)
+
+    date_field = filters.get("date_field", "due_date")
+    if date_field not in TASK_DATE_COLUMNS:
+        date_field = "due_date"
+    if filters.get("date_from"):
+        where.append(f"tasks.{date_field} >= ?")
+        params.append(filters["date_from"])
+    if filters.get("date_to"):
+        where.append(f"tasks.{date_field} <= ?")
+        params.append(filters["date_to"])
+    return source, where, params, id_col
+
+def tasks_page_queries(user_id, limit=50, after=None, sort="id", descending=True, search=None, filters=None):
+    """
+    [(sql, params), ...] of one get_tasks_page call, run in order until the
+    page is full; `sort` must be a TASK_SORT_KEYS key. A column sort orders
+    and seeks on the bare column, so the (user_id, column) indexes serve
+    both; its NULLs sort first ascending and last descending, as a segment
+    of their own walked by id.
+    """
+    op, order = ("<", "DESC") if descending else (">", "ASC")
+    source, where, params, id_col = _task_filter_sql(user_id, search, filters)
+    columns = ", ".join(f"tasks.{col.strip()}" for col in TASK_FULL_COLUMNS.split(","))
+
+    def segment(clauses, extra, order_by):
+        return (f"SELECT {columns} FROM {source} WHERE {' AND '.join(where + clauses)} "
+                f"ORDER BY {order_by} LIMIT ?"), params + extra + [limit + 1]
+
+    # id is its own tiebreaker; repeating it would stop FTS5 streaming rowids in order
+    by_id = f"{id_col} {order}"
+    if sort == "id":
+        if after is None:
+            return [segment([], [], by_id)]
+        return [segment([f"{id_col} {op} ?"], [after[1]], by_id)]
+
+    col = f"tasks.{sort}"
+    by_value = f"{col} {order}, {id_col} {order}"
+    if after is None:
+        values = segment([f"{col} IS NOT NULL"], [], by_value)
+        nulls = segment([f"{col} IS NULL"], [], by_id)
+    elif after[0] is None:
+        # inside the NULL segment: descending, the values are already done
+        values = None if descending else segment([f"{col} IS NOT NULL"], [], by_value)
+        nulls = segment([f"{col} IS NULL", f"{id_col} {op} ?"], [after[1]], by_id)
+    else:
+        # ascending, the NULLs came first
+        values = segment([f"({col}, {id_col}) {op} (?, ?)"], list(after), by_value)
+        nulls = segment([f"{col} IS NULL"], [], by_id) if descending else None
+    segments = [values, nulls] if descending else [nulls, values]
+    return [s for s in segments if s is not None]
+
+def get_tasks_page(user_id, limit=50, after=None, sort="id", descending=True, search=None, filters=None):
+    """
+    Keyset-paginated full task rows for one user.
+    `after` is the cursor returned for the previous page (None = first page).
+    Sorting, full-text search and filters (see _task_filter_sql) all happen
+    in SQL; the default id order walks the (user_id, id) index directly.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    if sort not in TASK_SORT_KEYS:
+        sort = "id"
+    rows = []
+    try:
+        with connect() as conn:
+            for sql, params in tasks_page_queries(user_id, limit, after, sort, descending, search, filters):
+                rows += conn.execute(sql, params).fetchall()
+                if len(rows) > limit:
+                    break
+    except Exception as e:
+        print(f"[DB] get_tasks_page error: {e}")
+        return [], None
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, (last[TASK_SORT_KEYS[sort]], last[0])
+
+# username-based shims (kept for older callers)
+
+def get_tasks(username):
+    user_id = get_user_id(username)
+    return get_tasks_for_user(user_id) if user_id is not None else []
+
+def get_tasks_full(username):
+    user_id = get_user_id(username)
+    return get_tasks_full_for_user(user_id) if user_id is not None else []
+
+def delete_task(username, title):
+    user_id = get_user_id(username)
+    if user_id is None:
+        print(f"[DB] delete_task: unknown user '{username}'.")
+        return False
+    return delete_task_for_user(user_id, title)
+
 #  REWARDS / EXP OPERATIONS 
 
+def _ensure_reward_row(cur, user_id):
+    # shared by the rewards helpers so they can reuse one connection
+    cur.execute("SELECT user_id FROM rewards WHERE user_id = ?", (user_id,))
+    if cur.fetchone() is None:
+        cur.execute("INSERT INTO rewards (user_id, exp, level, avatar) VALUES (?, ?, ?, ?)",
+                    (user_id, 0, 1, "female_1.png"))
+        print(f"[DB] Created rewards entry for user_id={user_id}")
+
 def ensure_reward_entry(user_id):
     """
     Ensure a rewards row exists for user_id. Returns True if exists/created.
     """
     try:
         with connect() as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT user_id FROM rewards WHERE user_id = ?", (user_id,))
-            if cur.fetchone() is None:
-                cur.execute("INSERT INTO rewards (user_id, exp, level, avatar) VALUES (?, ?, ?, ?)",
-                            (user_id, 0, 1, "female_1.png"))
-                conn.commit()
-                print(f"[DB] Created rewards entry for user_id={user_id}")
+            _ensure_reward_row(conn.cursor(), user_id)
         return True
     except Exception as e:
         print(f"[DB] ensure_reward_entry error: {e}")
@@ -246,9 +831,9 @@ def get_reward_data(user_id):
     If no row exists, creates one and returns defaults.
     """
     try:
-        ensure_reward_entry(user_id)
         with connect() as conn:
             cur = conn.cursor()
+            _ensure_reward_row(cur, user_id)
             cur.execute("SELECT user_id, exp, level, avatar FROM rewards WHERE user_id = ?", (user_id,))
             row = cur.fetchone()
             if row:
@@ -263,10 +848,9 @@ def set_avatar(user_id, avatar_filename):
     Set the equipped avatar for user.
     """
     try:
-        ensure_reward_entry(user_id)
         with connect() as conn:
+            _ensure_reward_row(conn.cursor(), user_id)
             conn.execute("UPDATE rewards SET avatar = ? WHERE user_id = ?", (avatar_filename, user_id))
-            conn.commit()
         return True
     except Exception as e:
         print(f"[DB] set_avatar error: {e}")
@@ -278,10 +862,9 @@ def set_level(user_id, level):
     """
     try:
         level = max(1, min(30, int(level)))
-        ensure_reward_entry(user_id)
         with connect() as conn:
+            _ensure_reward_row(conn.cursor(), user_id)
             conn.execute("UPDATE rewards SET level = ? WHERE user_id = ?", (level, user_id))
-            conn.commit()
         return True
     except Exception as e:
         print(f"[DB] set_level error: {e}")
@@ -301,9 +884,9 @@ def add_exp(user_id, amount):
         amount = 0
 
     try:
-        ensure_reward_entry(user_id)
         with connect() as conn:
             cur = conn.cursor()
+            _ensure_reward_row(cur, user_id)
             cur.execute("SELECT exp, level FROM rewards WHERE user_id = ?", (user_id,))
             row = cur.fetchone()
             if not row:
@@ -341,14 +924,13 @@ def set_exp(user_id, exp_value):
     except Exception:
         exp_value = 0
     try:
-        ensure_reward_entry(user_id)
         new_level = 1 + (exp_value // 100)
         if new_level > 30:
             new_level = 30
             exp_value = min(exp_value, 30 * 100 - 1)
         with connect() as conn:
+            _ensure_reward_row(conn.cursor(), user_id)
             conn.execute("UPDATE rewards SET exp = ?, level = ? WHERE user_id = ?", (exp_value, new_level, user_id))
-            conn.commit()
         return True
     except Exception as e:
         print(f"[DB] set_exp error: {e}")
@@ -357,5 +939,8 @@ def set_exp(user_id, exp_value):
 #  INIT 
 
 def initialize_database():
+    # local import: db_tuning builds on connect() from this module
+    import db_tuning
+    db_tuning.apply_storage_settings()
     migrate_schema_if_needed()
     print("[DB] Database initialized successfully.")
@@ -0,0 +1,101 @@
+"""
+Runs database work on one dedicated worker thread so the Tk main loop
+never blocks on SQLite (slow disk, busy timeout, large result sets).
+Results come back to Tk through futures polled with widget.after().
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+POLL_MS = 15
+
+
+class DBExecutor:
+    """
+    Single worker thread fed by a request queue.
+    All jobs run in submission order, so a write submitted before a read
+    is always visible to that read. The worker keeps its own pooled
+    connections (see db_pool).
+    """
+
+    def __init__(self, name="db-worker"):
+        self._name = name
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs) on the worker; returns a Future."""
+        self._ensure_started()
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def run_async(self, widget, fn, *args, on_done=None, on_error=None, **kwargs):
+        """
+        Run fn on the worker and deliver the result on the Tk thread:
+        on_done(result) or on_error(exception). Nothing is called if the
+        widget has been destroyed in the meantime. Returns the Future.
+        """
+        future = self.submit(fn, *args, **kwargs)
+
+        def poll():
+            try:
+                if not widget.winfo_exists():
+                    return
+            except Exception:
+                return
+            if not future.done():
+                widget.after(POLL_MS, poll)
+                return
+            error = future.exception()
+            if error is not None:
+                if on_error:
+                    on_error(error)
+                else:
+                    print(f"[DB] async job {getattr(fn, '__name__', fn)} failed: {error}")
+            elif on_done:
+                on_done(future.result())
+
+        widget.after(POLL_MS, poll)
+        return future
+
+    def shutdown(self, wait=False):
+        """Stop the worker after the jobs already queued."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            if wait:
+                thread.join()
+
+
+executor = DBExecutor()
+
+
+def submit(fn, *args, **kwargs):
+    return executor.submit(fn, *args, **kwargs)
+
+
+def run_async(widget, fn, *args, on_done=None, on_error=None, **kwargs):
+    return executor.run_async(widget, fn, *args, on_done=on_done, on_error=on_error, **kwargs)
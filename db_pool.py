@@ -0,0 +1,159 @@
+"""
+Small per-thread pool of long-lived SQLite connections.
+sqlite3 connections may only be used on the thread that created them,
+so every thread keeps its own idle list per database file.
+Each connection remembers the PRAGMA_VERSION it was opened with; after
+set_pragmas() every thread drops its stale idle connections on the next
+acquire/release and opens tuned ones, not only the thread that changed them.
+"""
+import sqlite3
+import threading
+
+#  POOL SETTINGS
+MAX_IDLE_PER_THREAD = 4
+CONNECT_TIMEOUT = 5
+
+# connection-level PRAGMAs, applied once when a connection is opened
+# (replace them with set_pragmas, never in place)
+CONNECTION_PRAGMAS = [
+    ("busy_timeout", CONNECT_TIMEOUT * 1000),
+]
+PRAGMA_VERSION = 0
+
+_pragma_lock = threading.Lock()
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = {"opened": 0, "reused": 0, "closed": 0}
+
+
+def _count(key):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def _idle_lists():
+    pools = getattr(_local, "pools", None)
+    if pools is None:
+        pools = {}
+        _local.pools = pools
+    return pools
+
+
+def _versions():
+    # connection -> PRAGMA_VERSION it was opened with (this thread's connections)
+    versions = getattr(_local, "versions", None)
+    if versions is None:
+        versions = {}
+        _local.versions = versions
+    return versions
+
+
+def set_pragmas(pragmas):
+    """
+    Use `pragmas` for connections opened from now on. Pooled connections
+    opened with an older set are closed and reopened by their own thread.
+    """
+    global CONNECTION_PRAGMAS, PRAGMA_VERSION
+    with _pragma_lock:
+        if list(pragmas) == CONNECTION_PRAGMAS:
+            return PRAGMA_VERSION
+        CONNECTION_PRAGMAS = list(pragmas)
+        PRAGMA_VERSION += 1
+        return PRAGMA_VERSION
+
+
+def _open(path):
+    with _pragma_lock:
+        pragmas, version = CONNECTION_PRAGMAS, PRAGMA_VERSION
+    conn = sqlite3.connect(path, timeout=CONNECT_TIMEOUT)
+    for name, value in pragmas:
+        conn.execute(f"PRAGMA {name} = {value}")
+    _versions()[conn] = version
+    _count("opened")
+    return conn
+
+
+def _close(conn):
+    _versions().pop(conn, None)
+    conn.close()
+    _count("closed")
+
+
+def _stale(conn):
+    return _versions().get(conn) != PRAGMA_VERSION
+
+
+def acquire(path):
+    """Take an idle connection for `path` from this thread's pool, or open one."""
+    idle = _idle_lists().setdefault(path, [])
+    while idle:
+        conn = idle.pop()
+        if not _stale(conn):
+            _count("reused")
+            return conn
+        _close(conn)  # opened before the last set_pragmas
+    return _open(path)
+
+
+def release(path, conn):
+    """Return a connection to this thread's pool (closes it if the pool is full or stale)."""
+    idle = _idle_lists().setdefault(path, [])
+    if len(idle) < MAX_IDLE_PER_THREAD and not _stale(conn):
+        idle.append(conn)
+    else:
+        _close(conn)
+
+
+def close_all():
+    """Close every idle connection owned by the calling thread."""
+    pools = _idle_lists()
+    for idle in pools.values():
+        while idle:
+            _close(idle.pop())
+    pools.clear()
+
+
+def stats():
+    """Return a snapshot of the opened / reused / closed counters."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+class PooledConnection:
+    """
+    Context manager used by db.connect().
+    Behaves like `with sqlite3.connect(...) as conn:` (commit on success,
+    rollback on error) but hands the connection back to the pool afterwards
+    instead of leaking it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+
+    def __enter__(self):
+        self.conn = acquire(self.path)
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        conn, self.conn = self.conn, None
+        try:
+            if exc_type is None:
+                conn.commit()
+            else:
+                conn.rollback()
+        except sqlite3.Error:
+            # a broken connection must not go back to the pool; a failed
+            # commit (busy, deferred constraint) is raised like sqlite3 does
+            _close(conn)
+            if exc_type is None:
+                raise
+            return False
+        release(self.path, conn)
+        return False
@@ -0,0 +1,239 @@
+"""
+Storage tuning for worktracker.db.
+Turns on WAL, registers the per-connection PRAGMAs with the pool,
+runs passive checkpoints from the Tk loop and offers a maintenance pass
+(checkpoint / optimize / VACUUM).
+
+    python db_tuning.py              # check query plans; exit 1 on a full scan
+    python db_tuning.py --maintain   # ... then checkpoint + PRAGMA optimize
+    python db_tuning.py --vacuum     # ... and VACUUM as well
+"""
+import os
+import sqlite3
+import sys
+
+import db
+import db_pool
+import task_stats
+import tasks
+
+#  SETTINGS
+CHECKPOINT_INTERVAL_MS = 60_000
+# plans whose name starts with this must read in index order (no temp B-tree);
+# filtered pages may sort their (index-bounded) match set
+SORTED_PAGE_PREFIX = "get_tasks_page"
+
+# per-connection PRAGMAs (re-applied on every new pooled connection)
+TUNED_PRAGMAS = [
+    ("synchronous", "NORMAL"),   # safe with WAL, one fsync per checkpoint instead of per commit
+    ("cache_size", -16_000),     # negative = KiB, ~16 MB page cache
+    ("mmap_size", 64 * 1024 * 1024),
+    ("temp_store", "MEMORY"),
+]
+
+
+def apply_storage_settings():
+    """
+    Switch the database to WAL and make the pool apply TUNED_PRAGMAS.
+    journal_mode is persistent in the file, the rest is per connection:
+    set_pragmas bumps the pool's pragma version, so connections pooled by
+    any thread before this call are reopened tuned on their next use.
+    Returns the journal mode SQLite reports.
+    """
+    db_pool.set_pragmas(db_pool.CONNECTION_PRAGMAS +
+                        [p for p in TUNED_PRAGMAS if p not in db_pool.CONNECTION_PRAGMAS])
+
+    try:
+        with db.connect() as conn:
+            mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        print(f"[DB] journal_mode={mode}")
+        return mode
+    except Exception as e:
+        print(f"[DB] apply_storage_settings error: {e}")
+        return None
+
+
+def checkpoint(mode="PASSIVE"):
+    """
+    Run a WAL checkpoint. PASSIVE never blocks readers or writers.
+    Returns (busy, wal_pages, checkpointed_pages) or None on error.
+    """
+    try:
+        with db.connect() as conn:
+            return conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+    except Exception as e:
+        print(f"[DB] checkpoint error: {e}")
+        return None
+
+
+def schedule_checkpoints(root, interval_ms=CHECKPOINT_INTERVAL_MS):
+    """
+    Run a passive checkpoint every `interval_ms` from the Tk event loop.
+    Returns a function that stops the schedule.
+    """
+    state = {"after_id": None}
+
+    def tick():
+        checkpoint("PASSIVE")
+        try:
+            state["after_id"] = root.after(interval_ms, tick)
+        except Exception:
+            state["after_id"] = None  # root destroyed
+
+    def cancel():
+        if state["after_id"]:
+            try:
+                root.after_cancel(state["after_id"])
+            except Exception:
+                pass
+            state["after_id"] = None
+
+    state["after_id"] = root.after(interval_ms, tick)
+    return cancel
+
+
+def _file_sizes():
+    sizes = {}
+    for suffix in ("", "-wal", "-shm"):
+        path = db.DB_NAME + suffix
+        sizes[os.path.basename(path)] = os.path.getsize(path) if os.path.exists(path) else 0
+    return sizes
+
+
+def run_maintenance(vacuum=True):
+    """
+    Full maintenance pass: TRUNCATE checkpoint, PRAGMA optimize and
+    (optionally) VACUUM. Returns {"success", "before", "after"} with file
+    sizes in bytes for the database and its WAL/SHM files.
+    """
+    before = _file_sizes()
+    try:
+        checkpoint("TRUNCATE")
+        with db.connect() as conn:
+            conn.execute("PRAGMA optimize")
+        if vacuum:
+            # VACUUM cannot run inside a transaction; the pool commits on release
+            with db.connect() as conn:
+                conn.execute("VACUUM")
+        checkpoint("TRUNCATE")
+    except Exception as e:
+        print(f"[DB] run_maintenance error: {e}")
+        return {"success": False, "before": before, "after": _file_sizes(), "error": str(e)}
+    after = _file_sizes()
+    print(f"[DB] Maintenance done: {sum(before.values())} -> {sum(after.values())} bytes")
+    return {"success": True, "before": before, "after": after}
+
+
+#  QUERY PLAN CHECKS
+def _page_plans(name, **page):
+    # one entry per query of a get_tasks_page call (a column sort has a NULL segment)
+    queries = db.tasks_page_queries(1, **page)
+    if len(queries) == 1:
+        return [(name, *queries[0])]
+    return [(f"{name}_{i}", sql, params) for i, (sql, params) in enumerate(queries, start=1)]
+
+
+def task_query_plans():
+    """
+    (name, sql, params) of the hot queries, built from the same SQL
+    constants / builders db.py, tasks.py and task_stats.py execute, with
+    sample parameters. None of them may fall back to a full scan.
+    Built on call: the search query depends on db.FTS_ENABLED.
+    """
+    range_cols = ["title", "category", "status", "start_date", "due_date"]
+    page_filters = {"status": ["In Progress", "Overdue"], "date_from": "2024-01-01", "date_to": "2024-01-31"}
+    plans = [
+        ("get_tasks", db.GET_TASKS_SQL, (1,)),
+        ("get_tasks_full", db.GET_TASKS_FULL_SQL, (1,)),
+        ("task_by_id", db.TASK_BY_ID_SQL, (1, 1)),
+        ("delete_tasks_by_title", db.DELETE_TASKS_BY_TITLE_SQL, (1, "title")),
+        *_page_plans("get_tasks_page", after=(100, 100)),
+        *_page_plans("get_tasks_page_by_due", after=("2024-01-01", 100), sort="due_date"),
+        *_page_plans("get_tasks_page_by_due_nulls", after=(None, 100), sort="due_date"),
+        *_page_plans("get_tasks_page_by_start_asc", sort="start_date", descending=False),
+        *_page_plans("search_tasks_filters", filters=page_filters),
+        *_page_plans("search_tasks_text", search="report"),
+        ("task_id_by_title_start", tasks.TASK_ID_BY_TITLE_START_SQL, (1, "title", "2024-01-01")),
+        ("task_id_by_title", tasks.TASK_ID_BY_TITLE_SQL, (1, "title")),
+        ("delete_task_by_id", tasks.DELETE_TASK_BY_ID_SQL, (1, 1)),
+        ("auto_delete_overdue", tasks.AUTO_DELETE_OVERDUE_SQL, ("2024-01-01", "2024-01-01")),
+        ("rollup_status", task_stats.SUMMARY_SQL, (1,)),
+        ("rollup_months", task_stats.MONTHLY_COUNTS_SQL, (1, "start")),
+        ("rollup_days", task_stats.DUE_DAY_COUNTS_SQL, (1,)),
+        ("rollup_overdue", task_stats.OVERDUE_COUNT_SQL, (1, "2024-03-31")),
+        ("rollup_range_start", task_stats.RANGE_COUNT_SQL["start"], (1, "2024-03-01")),
+        ("rollup_range_due", task_stats.RANGE_COUNT_SQL["due"], (1, "2024-03-31")),
+        ("open_analytics", *task_stats.tasks_range_sql(1, range_cols)),
+        ("open_analytics_range", *task_stats.tasks_range_sql(1, range_cols, "2024-03-01", "2024-03-31")),
+        ("open_analytics_range_by_start",
+         *task_stats.tasks_range_sql(1, range_cols, "2024-03-01", "2024-03-31", narrower="start")),
+        ("open_analytics_range_by_due",
+         *task_stats.tasks_range_sql(1, range_cols, "2024-03-01", "2024-03-31", narrower="due")),
+        ("focus_totals", task_stats.FOCUS_TOTALS_SQL, ("2024-03-31", "2024-03-25", 1)),
+    ]
+    return plans
+
+
+def explain(sql, params=(), conn=None):
+    """Return the EXPLAIN QUERY PLAN detail lines for `sql`."""
+    if conn is not None:
+        return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    with db.connect() as conn:
+        return explain(sql, params, conn)
+
+
+def _schema_copy():
+    # In-memory copy of the live schema without ANALYZE statistics, so the
+    # plans only depend on which indexes exist and not on the current row counts.
+    with db.connect() as conn:
+        ddl = [row[0] for row in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL "
+            "AND type IN ('table', 'index') AND name NOT LIKE 'sqlite_%' "
+            "AND name NOT LIKE 'tasks_fts_%' "  # FTS5 shadow tables come with tasks_fts
+            "ORDER BY type = 'index'"
+        )]
+    scratch = sqlite3.connect(":memory:")
+    for stmt in ddl:
+        scratch.execute(stmt)
+    return scratch
+
+
+def find_full_scans(queries=None):
+    """
+    Run EXPLAIN QUERY PLAN over `queries` (default task_query_plans()) against
+    the current schema and return {name: plan_lines} for every query that
+    does a full table scan, or, for the unfiltered keyset pages
+    (SORTED_PAGE_PREFIX), sorts in a temp B-tree instead of reading in index
+    order. An empty dict means every query is index-backed.
+    """
+    offenders = {}
+    scratch = _schema_copy()
+    try:
+        for name, sql, params in queries or task_query_plans():
+            plan = explain(sql, params, scratch)
+            # "SCAN tasks" is a full scan; index scans read "... USING INDEX ..."
+            # and FTS5 MATCH lookups "SCAN tasks_fts VIRTUAL TABLE INDEX n:M..."
+            if any(line.startswith("SCAN") and "USING" not in line and ":M" not in line
+                   for line in plan):
+                offenders[name] = plan
+            # a temp B-tree sorts the user's whole match set on every page
+            elif name.startswith(SORTED_PAGE_PREFIX) and any("USE TEMP B-TREE" in line for line in plan):
+                offenders[name] = plan
+    finally:
+        scratch.close()
+    return offenders
+
+
+if __name__ == "__main__":
+    apply_storage_settings()
+    db.migrate_schema_if_needed()
+    scans = find_full_scans()
+    for name, plan in scans.items():
+        print(f"[DB] full table scan in {name}: {plan}")
+    if not scans:
+        print("[DB] all hot queries are index-backed")
+    if "--maintain" in sys.argv or "--vacuum" in sys.argv:
+        result = run_maintenance(vacuum="--vacuum" in sys.argv)
+        for name in result["before"]:
+            print(f"{name}: {result['before'][name]} -> {result['after'][name]} bytes")
+    sys.exit(1 if scans else 0)
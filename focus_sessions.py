@@ -0,0 +1,128 @@
+"""
+Focus sessions from the dashboard timer, stored in db focus_sessions.
+A session opens when the timer starts and closes on pause or reset. Rows
+are buffered in memory (one per session, keyed on user_id + start) and
+written in one transaction per flush on the db_executor thread:
+- when a session closes,
+- every FLUSH_INTERVAL_S while one is running (the open row is upserted,
+  so at most that much focus time is lost if the app dies),
+- on logout and when the main window closes (waits for the write).
+Ticks in between only compare two numbers, so nothing is written per second.
+"""
+import threading
+from datetime import datetime, timedelta
+
+import db
+import db_executor
+
+#  SETTINGS
+FLUSH_INTERVAL_S = 60
+MIN_SESSION_S = 1        # start/pause misclicks are not stored
+FLUSH_TIMEOUT_S = 5      # how long logout / exit wait for the last write
+
+
+def _timestamp(moment):
+    return moment.isoformat(sep=" ", timespec="milliseconds")
+
+
+class FocusRecorder:
+    def __init__(self, save=db.save_focus_sessions, now=datetime.now):
+        self._save = save
+        self._now = now          # wall clock for the stored start/end
+        self._lock = threading.Lock()
+        self.pending = {}        # (user_id, start) -> (user_id, task_id, start, end, seconds)
+        self.user_id = None
+        self.task_id = None
+        self._open = None        # (wall-clock start, timer clock at start)
+        self._last_flush = None  # timer clock of the last flush of the open session
+        self._last_write = None  # future of the latest batch handed to the DB worker
+        self.flushes = 0
+        self.rows_written = 0
+
+    def bind(self, timer, user_id, task_id=None):
+        """Record `timer`'s sessions for `user_id` (call on every dashboard open)."""
+        if self._open is not None and user_id != self.user_id:
+            self._close(timer.clock())
+            self.flush()
+        self.user_id, self.task_id = user_id, task_id
+        timer.listen(self._on_timer)
+        if timer.running and self._open is None:
+            self._begin(timer.clock())
+
+    def close(self, timer):
+        """Close a running session and write everything now (logout / exit)."""
+        if self._open is not None:
+            self._close(timer.clock())
+        return self.flush(wait=True)
+
+    def flush(self, wait=False):
+        """
+        Hand the buffered rows to the DB worker as one batch. With wait,
+        block until it and every earlier batch are written; returns the
+        number of rows written (0 if the write failed or, without wait,
+        is still queued).
+        """
+        with self._lock:
+            rows, self.pending = self.pending, {}
+        if rows:
+            self.flushes += 1
+            self._last_write = db_executor.submit(self._write, rows)
+        if not wait or self._last_write is None:
+            return 0
+        try:
+            # the worker runs jobs in order: the last batch done means all are
+            written = self._last_write.result(timeout=FLUSH_TIMEOUT_S)
+            return written if rows else 0
+        except Exception as e:
+            print(f"[focus_sessions] flush did not finish: {e}")
+            return 0
+
+    #  internals
+    def _on_timer(self, event, timer):
+        now = timer.clock()
+        if event == "start":
+            self._begin(now)
+        elif event == "tick":
+            if self._open is not None and now - self._last_flush >= FLUSH_INTERVAL_S:
+                self._stage(now)
+                self._last_flush = now
+                self.flush()
+        elif self._open is not None:  # pause / reset
+            self._close(now)
+            self.flush()
+
+    def _begin(self, now):
+        if self.user_id is None:
+            return
+        self._open = (self._now(), now)
+        self._last_flush = now
+
+    def _stage(self, now):
+        started, started_at = self._open
+        seconds = int(now - started_at)
+        if seconds < MIN_SESSION_S:
+            return
+        # the end follows the monotonic duration, not the wall clock
+        start = _timestamp(started)
+        row = (self.user_id, self.task_id, start, _timestamp(started + timedelta(seconds=seconds)), seconds)
+        with self._lock:
+            self.pending[(self.user_id, start)] = row
+
+    def _close(self, now):
+        self._stage(now)
+        self._open = None
+
+    def _write(self, rows):
+        written = self._save(list(rows.values()))
+        if written is None:
+            # keep them for the next flush, unless a newer version was staged meanwhile
+            with self._lock:
+                for key, row in rows.items():
+                    self.pending.setdefault(key, row)
+            return 0
+        self.rows_written += written
+        return written
+
+
+# the dashboard timer's recorder
+recorder = FocusRecorder()
@@ -0,0 +1,176 @@
+"""
+Focus timer engine.
+Elapsed time is measured with a monotonic clock (wall-clock changes do not
+move it) as base_seconds + (now - started_at), so a late tick never adds
+up: the label is recomputed from the clock each tick instead of being
+incremented. Ticks are scheduled for the next whole second of elapsed
+time, so the display changes on the second rather than drifting with Tk's
+after() latency. While the window is withdrawn or iconified the label is
+not touched; it is brought up to date when the window is mapped again.
+
+Listeners (see listen) hear "start", "tick", "pause" and "reset"; the
+focus_sessions recorder stores sessions through them.
+
+The clock and the scheduler are injectable, so the engine runs without Tk:
+
+    timer = TimerEngine(clock=fake_clock, schedule=fake_after, cancel=fake_cancel)
+"""
+import time
+
+#  SETTINGS
+TICK_MS = 1000
+
+
+def format_seconds(seconds):
+    sec = int(seconds)
+    return f"{sec // 3600:02}:{(sec % 3600) // 60:02}:{sec % 60:02}"
+
+
+class TimerEngine:
+    def __init__(self, clock=time.monotonic, schedule=None, cancel=None, tick_ms=TICK_MS):
+        self.clock = clock
+        self.tick_ms = tick_ms
+        self._schedule = schedule     # schedule(ms, callback) -> id   (default: root.after)
+        self._cancel = cancel         # cancel(id)                     (default: root.after_cancel)
+        self.root = None
+        self.label = None
+        self.running = False
+        self.base_seconds = 0.0
+        self.started_at = None
+        self._after_id = None
+        self._generation = 0          # bumped on pause/reset: stale ticks do nothing
+        self._shown = None            # text currently on the label
+        self._map_bound = None        # root whose <Map> refreshes the label
+        self.listeners = []
+        self.ticks = 0
+        self.label_updates = 0
+
+    #  state
+    def elapsed(self):
+        """Seconds on the timer right now."""
+        if self.running:
+            return self.base_seconds + max(0.0, self.clock() - self.started_at)
+        return self.base_seconds
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.started_at = self.clock()
+        self._generation += 1
+        self._schedule_tick()
+        self.refresh()
+        self._notify("start")
+
+    def pause(self):
+        was_running = self.running
+        if self.running:
+            self.base_seconds = self.elapsed()
+            self.running = False
+            self.started_at = None
+        self._stop_ticks()
+        self.refresh()
+        if was_running:
+            self._notify("pause")
+
+    def reset(self):
+        self._stop_ticks()
+        self.running = False
+        self.base_seconds = 0.0
+        self.started_at = None
+        self.refresh()
+        self._notify("reset")
+
+    def listen(self, callback):
+        """callback(event, engine) after start/tick/pause/reset."""
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    #  Tk wiring
+    def attach(self, root, label):
+        """Drive `label` from `root`'s event loop (call again after the window is rebuilt)."""
+        self._stop_ticks()
+        self.root, self.label, self._shown = root, label, None
+        if self._map_bound is not root:
+            try:
+                root.bind("<Map>", self._on_map, add="+")
+                self._map_bound = root
+            except Exception:
+                pass
+        self.refresh()
+        if self.running:
+            self._schedule_tick()
+
+    def refresh(self, force=False):
+        """Put the current time on the label, unless it is hidden or already showing it."""
+        if self.label is None or not (force or self._visible()):
+            return
+        text = format_seconds(self.elapsed())
+        if text == self._shown:
+            return
+        try:
+            self.label.config(text=text)
+        except Exception:
+            self.label = None  # widget destroyed (logout / window rebuilt)
+            return
+        self._shown = text
+        self.label_updates += 1
+
+    #  internals
+    def _notify(self, event):
+        for callback in list(self.listeners):
+            try:
+                callback(event, self)
+            except Exception as e:
+                print(f"[focus_timer] {event} listener failed: {e}")
+
+    def _visible(self):
+        try:
+            return bool(self.label.winfo_viewable())
+        except Exception:
+            return False
+
+    def _on_map(self, event=None):
+        if event is None or event.widget is self.root:
+            self.refresh()
+
+    def _next_delay_ms(self):
+        # time left until the next whole second of elapsed time, rounded up
+        # so the tick lands just after the boundary, never just before it
+        tick = self.tick_ms / 1000
+        return int((tick - self.elapsed() % tick) * 1000) + 1
+
+    def _schedule_tick(self):
+        if self._after_id is not None:
+            return
+        schedule = self._schedule or (self.root.after if self.root is not None else None)
+        if schedule is None:
+            return
+        generation = self._generation
+        self._after_id = schedule(self._next_delay_ms(), lambda: self._tick(generation))
+
+    def _stop_ticks(self):
+        self._generation += 1
+        if self._after_id is not None:
+            cancel = self._cancel or (self.root.after_cancel if self.root is not None else None)
+            try:
+                if cancel:
+                    cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+
+    def _tick(self, generation):
+        if generation != self._generation:
+            return  # paused or reset after this tick was scheduled
+        self._after_id = None
+        if not self.running:
+            return
+        self.ticks += 1
+        self.refresh()
+        self._schedule_tick()
+        self._notify("tick")
+
+
+# the dashboard's timer; survives page switches and re-login
+timer = TimerEngine()
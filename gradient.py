@@ -0,0 +1,85 @@
+"""
+Vertical gradient backgrounds drawn as one Canvas image.
+The image is built with PIL: a one-pixel column for the height rounded
+down to GRADIENT_BUCKET is cached and stretched to the exact size, so
+the image always ends on the bottom colour at the canvas edge. It is only
+redrawn once a resize has settled for GRADIENT_DEBOUNCE_MS (through
+ui_scheduler).
+"""
+from PIL import Image, ImageTk
+
+import ui_scheduler
+from lru import LRUCache
+
+#  SETTINGS
+GRADIENT_BUCKET = 64          # px; cached columns are this many px apart in height
+GRADIENT_DEBOUNCE_MS = 120
+GRADIENT_CACHE_SIZE = 8
+
+# (bucketed height, top, bottom) -> 1 px wide PIL column
+images = LRUCache(GRADIENT_CACHE_SIZE)
+
+
+def _bucket(value):
+    # rounded down: the column is stretched to the real size, never cropped
+    value = max(int(value), 1)
+    return value if value < GRADIENT_BUCKET else value // GRADIENT_BUCKET * GRADIENT_BUCKET
+
+
+def gradient_image(width, height, top, bottom):
+    """RGB image `width` x `height` fading from `top` (first row) to `bottom` (last row)."""
+    key = (_bucket(height), tuple(top), tuple(bottom))
+    column = images.get(key)
+    if column is None:
+        rows = key[0]
+        data = bytearray()
+        for i in range(rows):
+            data.extend(round(t + (b - t) * i / max(rows - 1, 1)) for t, b in zip(top, bottom))
+        column = Image.frombytes("RGB", (1, rows), bytes(data))
+        images.put(key, column)
+    return column.resize((width, height), Image.BILINEAR)
+
+
+class GradientBackground:
+    """
+    Keeps one image item on `canvas` showing the gradient.
+    resize(w, h) draws immediately the first time and is debounced after.
+    """
+
+    def __init__(self, canvas, top, bottom, tag="gradient", debounce_ms=GRADIENT_DEBOUNCE_MS):
+        self.canvas = canvas
+        self.top = top
+        self.bottom = bottom
+        self.tag = tag
+        self.debounce_ms = debounce_ms
+        self.size = None          # size of the image on screen
+        self.photo = None         # Tk drops images nobody references
+        self.draws = 0
+        self._key = ("resize", str(canvas))
+
+    def resize(self, width, height):
+        if width <= 0 or height <= 0:
+            return
+        if self.size is None:
+            self.draw(width, height)
+            return
+        ui_scheduler.scheduler_for(self.canvas).request(
+            self._key, self.draw, width, height, priority=ui_scheduler.PRIORITY_LOW,
+            delay_ms=self.debounce_ms, owner=self.canvas)
+
+    def draw(self, width, height):
+        size = (int(width), int(height))
+        if size == self.size:
+            return  # already showing this size
+        photo = ImageTk.PhotoImage(gradient_image(size[0], size[1], self.top, self.bottom),
+                                   master=self.canvas)
+        if self.canvas.find_withtag(self.tag):
+            self.canvas.itemconfigure(self.tag, image=photo)
+        else:
+            self.canvas.create_image(0, 0, image=photo, anchor="nw", tags=self.tag)
+        self.canvas.lower(self.tag)
+        self.photo, self.size = photo, size
+        self.draws += 1
+
+    def cancel(self):
+        ui_scheduler.scheduler_for(self.canvas).cancel(self._key)
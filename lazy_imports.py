@@ -0,0 +1,72 @@
+"""
+Deferred imports for the heavy modules (matplotlib).
+lazy("name") returns a stand-in that imports the real module on first
+attribute access, so the first window does not wait for libraries that
+only the Analytics page needs. warm_up() imports them on a background
+thread once the first window is shown (startup.warm_up_later).
+"""
+import importlib
+import sys
+import threading
+import time
+
+# heavy modules behind the dashboard's lazy import (PIL already comes with ttkbootstrap)
+WARM_UP_MODULES = [
+    "matplotlib.figure",
+    "matplotlib.backends.backend_tkagg",
+    "chart_renderer",
+]
+
+
+class LazyModule:
+    """Module stand-in; the import happens on the first attribute lookup."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    @property
+    def loaded(self):
+        return self._module is not None or self._name in sys.modules
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy(name):
+    """Stand-in for `import name`; already imported modules are returned as is."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def warm_up(modules=None, on_done=None):
+    """
+    Import `modules` (default WARM_UP_MODULES) on a daemon thread.
+    on_done(seconds) is called from that thread when all are loaded; a
+    failing import is logged and skipped. Returns the thread.
+    """
+    names = list(modules or WARM_UP_MODULES)
+
+    def run():
+        start = time.perf_counter()
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"[lazy_imports] warm-up of {name} failed: {e}")
+        elapsed = time.perf_counter() - start
+        print(f"[lazy_imports] warm-up done in {elapsed:.2f}s")
+        if on_done:
+            on_done(elapsed)
+
+    thread = threading.Thread(target=run, name="import-warm-up", daemon=True)
+    thread.start()
+    return thread
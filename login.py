@@ -3,15 +3,18 @@ from ttkbootstrap.constants import *
 from tkinter import messagebox, Canvas, font as tkFont, W, X
 import tkinter as tk
 import auth
+import startup
+from gradient import GradientBackground
 from dashboard import open_dashboard
 
 
 #  SPLASH SCREEN 
 class SplashScreen(ttk.Frame):
-    def __init__(self, master, on_finish):
+    def __init__(self, master, on_finish, orchestrator=None):
         super().__init__(master)
         self.master = master
         self.on_finish = on_finish
+        self.orchestrator = orchestrator or startup.StartupOrchestrator(startup.app_tasks())
         self.master.title("Loading WorkTracker...")
         self.master.geometry("700x400")
         self.master.overrideredirect(True)  # Remove title bar
@@ -51,19 +54,18 @@ class SplashScreen(ttk.Frame):
         self.progress["value"] = 0
 
     def animate_progress(self):
-        """Simulate a loading bar with gradual animation"""
-        value = self.progress["value"]
-        if value < 100:
-            self.progress["value"] = value + 2
-            self.master.after(40, self.animate_progress)
-        else:
-            # When done loading, open login
-            self.master.after(300, self.finish)
+        """Follow the startup tasks; open login as soon as they are done"""
+        self.orchestrator.poll(self, on_progress=self.set_progress,
+                               on_done=lambda _: self.finish())
+
+    def set_progress(self, fraction):
+        self.progress["value"] = fraction * 100
 
     def finish(self):
         for widget in self.master.winfo_children():
             widget.destroy()
         self.on_finish(self.master)
+        startup.warm_up_later(self.master)
 
 
 # LOGIN WINDOW 
@@ -81,6 +83,7 @@ class LoginWindow(ttk.Frame):
 
         self.gradient = Canvas(self.master, highlightthickness=0)
         self.gradient.grid(row=0, column=0, sticky="nsew")
+        self.background = GradientBackground(self.gradient, top=(80, 120, 250), bottom=(165, 95, 200))
 
         self.container = ttk.Frame(self.master)
         self.container.grid(row=0, column=0, sticky="nsew")
@@ -198,17 +201,7 @@ class LoginWindow(ttk.Frame):
 
     # OTHER 
     def draw_gradient(self, w, h):
-        self.gradient.delete("gradient")
-        color_top = (80, 120, 250)
-        color_bot = (165, 95, 200)
-        steps = max(h, 2)
-        for i in range(steps):
-            r = int(color_top[0] + (color_bot[0] - color_top[0]) * (i / steps))
-            g = int(color_top[1] + (color_bot[1] - color_top[1]) * (i / steps))
-            b = int(color_top[2] + (color_bot[2] - color_top[2]) * (i / steps))
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            self.gradient.create_line(0, i, w, i, fill=color, tags="gradient")
-        self.gradient.lower("gradient")
+        self.background.draw(w, h)
 
     def on_resize(self, event):
         w, h = self.master.winfo_width(), self.master.winfo_height()
@@ -216,7 +209,8 @@ class LoginWindow(ttk.Frame):
             return
         if self.gradient.winfo_exists():
             self.gradient.config(width=w, height=h)
-            self.draw_gradient(w, h)
+            # one image, redrawn only once the resize has settled
+            self.background.resize(w, h)
 
     def toggle_mode(self):
         self.is_signup = not self.is_signup
@@ -0,0 +1,73 @@
+"""
+Small thread-safe LRU mapping shared by the in-memory caches
+(analytics_cache, avatar_cache, gradient). No app imports, so the login
+screen can use it without loading the database layer.
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used mapping with a fixed number of entries.
+    on_evict(key, value) is called for every entry pushed out.
+    """
+
+    def __init__(self, maxsize, on_evict=None):
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict(self.maxsize)
+
+    def resize(self, maxsize):
+        """Change the capacity, evicting the oldest entries if needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict(maxsize)
+
+    def _evict(self, maxsize):
+        while len(self._data) > max(maxsize, 0):
+            key, value = self._data.popitem(last=False)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(key, value)
+
+    def discard(self, predicate):
+        """Drop every entry whose key matches predicate(key)."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions}
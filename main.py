@@ -1,16 +1,19 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
-from db import initialize_database
-from auth import load_login_state
+from db_tuning import schedule_checkpoints
+import startup
+import focus_sessions
 from dashboard import open_dashboard
+from focus_timer import timer
 from login import LoginWindow
 
 #  LOADING SCREEN  #
 class LoadingScreen(ttk.Toplevel):
-    def __init__(self, master, on_complete):
+    def __init__(self, master, orchestrator, on_complete):
         super().__init__(master)
         self.master = master
+        self.orchestrator = orchestrator
         self.on_complete = on_complete
 
         self.overrideredirect(True)  # Remove window border
@@ -35,53 +38,63 @@ class LoadingScreen(ttk.Toplevel):
             foreground="#6B728E"
         ).pack(pady=(0, 20))
 
-        # Progress bar
-        self.progress = ttk.Progressbar(self.container, mode="indeterminate", bootstyle="info-striped")
+        # Progress bar (share of finished startup tasks)
+        self.progress = ttk.Progressbar(self.container, mode="determinate", bootstyle="info-striped")
         self.progress.pack(fill="x", pady=(10, 0))
-        self.progress.start(10)
 
         # Fade-in animation
         self.attributes("-alpha", 0.0)
         self.fade_in(0)
 
-        # Automatically close after a delay
-        self.after(2500, self.close)
+        # Close as soon as the startup tasks are done
+        self.orchestrator.poll(self, on_progress=self.set_progress, on_done=lambda _: self.close())
+
+    def set_progress(self, fraction):
+        self.progress["value"] = fraction * 100
 
     def fade_in(self, value):
-        if value <= 1.0:
+        if value <= 1.0 and self.winfo_exists():  # may close before the fade ends
             self.attributes("-alpha", value)
             self.after(40, self.fade_in, value + 0.1)
 
     def close(self):
-        self.progress.stop()
         self.destroy()
         self.on_complete()  # Launch the main UI
+        startup.warm_up_later(self.master)
 
 
 #  MAIN APP  #
 def main():
-    initialize_database()
+    # migration, PRAGMAs, session and avatars run in parallel while the
+    # loading screen is up; the chart imports follow the first window
+    orchestrator = startup.StartupOrchestrator(startup.app_tasks()).start()
 
     # Create hidden root for the loading screen
     root = ttk.Window(title="Work Tracker", themename="flatly")
     root.withdraw()
 
+    # Passive WAL checkpoints from the Tk loop keep the -wal file small
+    schedule_checkpoints(root)
+
     # Define what happens after the loading screen
     def start_app():
         root.deiconify()
         root.geometry("1000x600")
         root.minsize(900, 550)
 
-        saved_user = load_login_state()
+        saved_user = orchestrator.result("session")
         if saved_user:
             open_dashboard(saved_user, root)
         else:
             LoginWindow(root)
 
     # Show loading splash
-    LoadingScreen(root, on_complete=start_app)
+    LoadingScreen(root, orchestrator, on_complete=start_app)
     root.mainloop()
 
+    # window closed: store the focus session still running
+    focus_sessions.recorder.close(timer)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,110 @@
+"""
+Persistent pages for the dashboard content area.
+Each page is built once into its own frame; all pages share one grid
+cell and navigation only swaps which one is shown. When a page is shown
+again its version() is compared with the one it was built/refreshed for:
+unchanged -> nothing is rebuilt; changed -> the page's refresh hook
+(frame.refresh, set by the page builder for its data-bound parts) runs,
+or the page is rebuilt if it has none.
+
+With run_async (db_executor.run_async), version() runs on the DB worker:
+the page is shown as it is right away and refreshed when the key comes
+back changed, so navigation itself never waits on the database.
+"""
+import time
+import ttkbootstrap as ttk
+
+
+class _Page:
+    def __init__(self, name, build, version):
+        self.name = name
+        self.build = build
+        self.version = version
+        self.frame = None
+        self.shown_version = None
+
+
+class PageManager:
+    def __init__(self, container, run_async=None):
+        self.container = container
+        self.run_async = run_async    # run_async(widget, fn, on_done=...) for version()
+        container.rowconfigure(0, weight=1)
+        container.columnconfigure(0, weight=1)
+        self.pages = {}
+        self.current = None
+        self.builds = 0
+        self.refreshes = 0
+        self.last_show_ms = None
+
+    def register(self, name, build, version=None):
+        """
+        build(frame) fills a fresh page frame. version() returns the data
+        key the page depends on (None = unknown, refresh every time); pages
+        registered without version are never refreshed automatically.
+        """
+        self.pages[name] = _Page(name, build, version)
+
+    def show(self, name):
+        """Show page `name`, building or refreshing it only if needed."""
+        page = self.pages[name]
+        start = time.perf_counter()
+        fresh = page.frame is None or not page.frame.winfo_exists()
+        deferred = self.run_async is not None and page.version is not None
+        if deferred:
+            # queued before the page's own loads, so the key is never newer than its data
+            self._check_version(page, refresh=not fresh)
+        else:
+            version = page.version() if page.version else None
+        if fresh:
+            page.frame = ttk.Frame(self.container)
+            page.frame.grid(row=0, column=0, sticky="nsew")
+            page.build(page.frame)
+            self.builds += 1
+        elif not deferred and page.version and (version is None or version != page.shown_version):
+            self._refresh(page)
+        if not deferred:
+            page.shown_version = version
+
+        if self.current is not None and self.current is not page and self.current.frame.winfo_exists():
+            self.current.frame.grid_remove()
+        page.frame.grid()
+        page.frame.tkraise()
+        self.current = page
+        self.last_show_ms = (time.perf_counter() - start) * 1000
+        return page.frame
+
+    def refresh(self, name=None):
+        """Refresh a built page now (default: the one on screen)."""
+        page = self.pages[name] if name else self.current
+        if page is None or page.frame is None or not page.frame.winfo_exists():
+            return
+        if self.run_async is not None and page.version is not None:
+            self._check_version(page, refresh=False)
+            self._refresh(page)
+            return
+        self._refresh(page)
+        page.shown_version = page.version() if page.version else None
+
+    def _check_version(self, page, refresh=True):
+        """Read page.version() on the worker; refresh the page if it changed."""
+        def checked(version):
+            if page.frame is None or not page.frame.winfo_exists():
+                return
+            if refresh and (version is None or version != page.shown_version):
+                self._refresh(page)
+            page.shown_version = version
+
+        self.run_async(self.container, page.version, on_done=checked)
+
+    def _refresh(self, page):
+        self.refreshes += 1
+        refresh = getattr(page.frame, "refresh", None)
+        if callable(refresh):
+            refresh()
+        else:
+            page.build(page.frame)
+            self.builds += 1
+
+    def frame(self, name):
+        page = self.pages.get(name)
+        return page.frame if page else None
@@ -0,0 +1,142 @@
+"""
+Startup work done while the splash screen is up.
+Each StartupTask runs on its own worker thread as soon as the tasks it
+depends on have finished, so the migration, the session check and the
+avatar decoding overlap. The splash polls the orchestrator from the Tk
+loop: the progress bar is the weighted share of finished tasks and the
+splash closes as soon as the last one is done. The chart modules are not
+startup tasks: warm_up_later() imports them once the first window is up.
+"""
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import auth
+import avatar_cache
+import db
+import db_pool
+import db_tuning
+import lazy_imports
+
+POLL_MS = 40
+
+
+class StartupTask:
+    """fn() to run at startup, after the tasks named in `after`; weight counts toward progress."""
+
+    def __init__(self, name, fn, after=(), weight=1):
+        self.name = name
+        self.fn = fn
+        self.after = tuple(after)
+        self.weight = weight
+        self.future = Future()
+        self.seconds = None
+
+
+class StartupOrchestrator:
+    def __init__(self, tasks):
+        self.tasks = {task.name: task for task in tasks}
+        for task in tasks:
+            missing = [name for name in task.after if name not in self.tasks]
+            if missing:
+                raise ValueError(f"startup task {task.name!r} depends on unknown {missing}")
+        self._started = False
+
+    def start(self):
+        """Start one thread per task; dependants wait for their dependencies' futures."""
+        if self._started:
+            return self
+        self._started = True
+        for task in self.tasks.values():
+            threading.Thread(target=self._run, args=(task,), name=f"startup-{task.name}",
+                             daemon=True).start()
+        return self
+
+    def _run(self, task):
+        for name in task.after:
+            self.tasks[name].future.exception()  # wait; a failed dependency does not block
+        if not task.future.set_running_or_notify_cancel():
+            return
+        start = time.perf_counter()
+        try:
+            result = task.fn()
+        except BaseException as e:
+            print(f"[Startup] {task.name} failed: {e}")
+            task.future.set_exception(e)
+        else:
+            task.future.set_result(result)
+        finally:
+            task.seconds = time.perf_counter() - start
+            db_pool.close_all()  # pooled connections of this short-lived thread
+
+    def progress(self):
+        """Finished share of the total weight, 0.0 - 1.0."""
+        total = sum(task.weight for task in self.tasks.values())
+        done = sum(task.weight for task in self.tasks.values() if task.future.done())
+        return done / total if total else 1.0
+
+    def done(self):
+        return all(task.future.done() for task in self.tasks.values())
+
+    def result(self, name, default=None):
+        """Result of a finished task, or `default` if it failed or is not done."""
+        future = self.tasks[name].future
+        if not future.done() or future.exception() is not None:
+            return default
+        return future.result()
+
+    def timings(self):
+        return {name: task.seconds for name, task in self.tasks.items()}
+
+    def poll(self, widget, on_progress=None, on_done=None, interval_ms=POLL_MS):
+        """
+        From the Tk loop: on_progress(fraction) every `interval_ms` and
+        on_done(self) once everything has finished. Stops if `widget` is destroyed.
+        """
+        self.start()
+
+        def tick():
+            try:
+                if not widget.winfo_exists():
+                    return
+            except Exception:
+                return
+            if on_progress:
+                on_progress(self.progress())
+            if self.done():
+                if on_done:
+                    on_done(self)
+            else:
+                widget.after(interval_ms, tick)
+
+        tick()
+
+
+#  APP STARTUP TASKS
+def _preload_avatars():
+    # the saved user's topbar avatar plus the Rewards / Settings grids, so the
+    # dashboard only wraps ready thumbnails in PhotoImages; cut from the atlases
+    avatar_cache.ensure_atlases()
+    user = auth.load_login_state()
+    if user:
+        avatar_cache.preload([db.get_reward_data(user["id"]).get("avatar", "female_1.png")], [(28, 28)])
+    avatars = sorted(f for f in os.listdir(avatar_cache.AVATAR_DIR) if f.lower().endswith(".png"))
+    return (avatar_cache.preload(avatars, [(72, 72), (96, 96)], greyscale=(False, True))
+            + avatar_cache.preload(avatars, [(120, 120)]))
+
+
+def app_tasks():
+    """Everything main.py / login.py need before the first real window."""
+    tasks = [
+        StartupTask("storage", db_tuning.apply_storage_settings),
+        StartupTask("schema", db.migrate_schema_if_needed, after=["storage"], weight=2),
+        StartupTask("session", auth.load_login_state),
+        StartupTask("avatars", _preload_avatars, after=["schema"]),
+    ]
+    return tasks
+
+
+def warm_up_later(root):
+    """Import the chart modules (lazy_imports) in the background once `root` is idle."""
+    root.after_idle(lazy_imports.warm_up)
@@ -0,0 +1,197 @@
+"""
+Task statistics for the Overview and Analytics pages.
+Everything is read from task_daily_rollup (kept current by triggers on
+tasks, see db.create_task_rollup), so a query touches one pre-grouped
+row per day/status/category instead of every task row. Focus totals
+come from focus_sessions through its (user_id, start) index.
+
+    python task_stats.py --rebuild [user_id]   # repair rollup drift
+"""
+import datetime
+import sys
+
+import db
+
+# normalized status -> key in the summary dict
+STATUS_KEYS = {"completed": "completed", "in progress": "in_progress", "overdue": "overdue"}
+
+# queries, shared with db_tuning.task_query_plans() (which checks they stay index-backed)
+# every task appears exactly once among the field='start' rows
+SUMMARY_SQL = ("SELECT status, SUM(task_count), SUM(est_minutes) FROM task_daily_rollup "
+               "WHERE user_id = ? AND field = 'start' GROUP BY status")
+MONTHLY_COUNTS_SQL = ("SELECT substr(day, 1, 7) AS month, SUM(task_count) FROM task_daily_rollup "
+                      "WHERE user_id = ? AND field = ? AND day != '' GROUP BY month ORDER BY month")
+DUE_DAY_COUNTS_SQL = ("SELECT day, SUM(task_count) FROM task_daily_rollup "
+                      "WHERE user_id = ? AND field = 'due' AND day != '' GROUP BY day ORDER BY day")
+OVERDUE_COUNT_SQL = ("SELECT COALESCE(SUM(task_count), 0) FROM task_daily_rollup "
+                     "WHERE user_id = ? AND field = 'due' AND day != '' AND day < ? "
+                     "AND status != 'completed'")
+# rollup field -> count of tasks on the inclusive side of a bound
+RANGE_COUNT_SQL = {
+    "start": ("SELECT COALESCE(SUM(task_count), 0) FROM task_daily_rollup "
+              "WHERE user_id = ? AND field = 'start' AND day != '' AND day >= ?"),
+    "due": ("SELECT COALESCE(SUM(task_count), 0) FROM task_daily_rollup "
+            "WHERE user_id = ? AND field = 'due' AND day != '' AND day <= ?"),
+}
+FOCUS_TOTALS_SQL = ("SELECT COALESCE(SUM(CASE WHEN start >= ? THEN seconds END), 0), "
+                    "COALESCE(SUM(CASE WHEN start >= ? THEN seconds END), 0), "
+                    "COALESCE(SUM(seconds), 0), COUNT(*) FROM focus_sessions WHERE user_id = ?")
+
+
+def _today():
+    return datetime.date.today().isoformat()
+
+
+def task_summary(user_id, today=None):
+    """
+    Counts and estimated-minute totals for one user:
+    {"total", "completed", "in_progress", "overdue", "other", "past_due",
+     "est_minutes", "est_minutes_completed"}
+    past_due counts unfinished tasks whose due date is before `today`.
+    """
+    summary = {"total": 0, "completed": 0, "in_progress": 0, "overdue": 0, "other": 0,
+               "past_due": 0, "est_minutes": 0, "est_minutes_completed": 0}
+    try:
+        with db.connect() as conn:
+            groups = conn.execute(SUMMARY_SQL, (user_id,)).fetchall()
+    except Exception as e:
+        print(f"[DB] task_summary error: {e}")
+        return summary
+
+    for status, count, minutes in groups:
+        key = STATUS_KEYS.get(status, "other")
+        summary[key] += count
+        summary["total"] += count
+        summary["est_minutes"] += minutes
+        if key == "completed":
+            summary["est_minutes_completed"] += minutes
+    summary["past_due"] = overdue_count(user_id, today)
+    return summary
+
+
+def monthly_counts(user_id, field="start_date"):
+    """[(YYYY-MM, count), ...] by month of start_date (or due_date), oldest first."""
+    rollup_field = "due" if field == "due_date" else "start"
+    try:
+        with db.connect() as conn:
+            return conn.execute(MONTHLY_COUNTS_SQL, (user_id, rollup_field)).fetchall()
+    except Exception as e:
+        print(f"[DB] monthly_counts error: {e}")
+        return []
+
+
+def due_date_counts(user_id):
+    """[(YYYY-MM-DD, count), ...] of tasks per due date, oldest first."""
+    try:
+        with db.connect() as conn:
+            return conn.execute(DUE_DAY_COUNTS_SQL, (user_id,)).fetchall()
+    except Exception as e:
+        print(f"[DB] due_date_counts error: {e}")
+        return []
+
+
+def overdue_count(user_id, today=None):
+    """Unfinished tasks whose due date is before `today` (default: today)."""
+    try:
+        with db.connect() as conn:
+            return conn.execute(OVERDUE_COUNT_SQL, (user_id, today or _today())).fetchone()[0]
+    except Exception as e:
+        print(f"[DB] overdue_count error: {e}")
+        return 0
+
+
+def range_counts(user_id, start_from=None, due_until=None):
+    """
+    (tasks starting on/after start_from, tasks due on/before due_until) from
+    the rollup, None for a missing bound. Lets range queries pick the more
+    selective date index.
+    """
+    counts = []
+    try:
+        with db.connect() as conn:
+            for field, bound in (("start", start_from), ("due", due_until)):
+                if bound is None:
+                    counts.append(None)
+                    continue
+                counts.append(conn.execute(RANGE_COUNT_SQL[field], (user_id, bound)).fetchone()[0])
+    except Exception as e:
+        print(f"[DB] range_counts error: {e}")
+        return None, None
+    return tuple(counts)
+
+
+def focus_totals(user_id, today=None):
+    """Stored focus seconds: {"today", "week" (last 7 days incl. today), "total", "sessions"}."""
+    today = today or _today()
+    week_start = (datetime.date.fromisoformat(today) - datetime.timedelta(days=6)).isoformat()
+    try:
+        with db.connect() as conn:
+            row = conn.execute(FOCUS_TOTALS_SQL, (today, week_start, user_id)).fetchone()
+    except Exception as e:
+        print(f"[DB] focus_totals error: {e}")
+        return {"today": 0, "week": 0, "total": 0, "sessions": 0}
+    return {"today": row[0], "week": row[1], "total": row[2], "sessions": row[3]}
+
+
+def overview_stats(user_id, today=None):
+    """What the Overview cards show: task_summary plus focus_totals under "focus"."""
+    stats = task_summary(user_id, today)
+    stats["focus"] = focus_totals(user_id, today)
+    return stats
+
+
+def narrower_bound(user_id, start_from, due_until):
+    """
+    "start" or "due": which bound of a both-sided range selects fewer tasks
+    (per the rollup), None if only one bound is set or the counts failed.
+    SQLite cannot tell which (user_id, date) index is narrower on its own.
+    """
+    if not (start_from and due_until):
+        return None
+    n_start, n_due = range_counts(user_id, start_from, due_until)
+    if n_start is None:
+        return None
+    return "start" if n_start <= n_due else "due"
+
+
+def tasks_range_sql(user_id, columns, start_from=None, due_until=None, narrower=None):
+    """
+    (sql, params) reading `columns` (SQL names) of one user's tasks starting
+    on/after start_from and due on/before due_until (ISO, inclusive).
+    narrower (see narrower_bound) disables the other bound's index with a unary "+".
+    """
+    start_col = "+" if narrower == "due" else ""
+    due_col = "+" if narrower == "start" else ""
+    where, params = ["user_id = ?"], [user_id]
+    if start_from:
+        # upper bound keeps unparsable text ('n/a' > '2024-...') out, like NaT before
+        where.append(f"{start_col}start_date BETWEEN ? AND '9999-12-31'")
+        params.append(start_from)
+    if due_until:
+        # '' (no due date) sorts before every date; the old filter dropped those rows too
+        where.append(f"{due_col}due_date <= ? AND due_date != ''")
+        params.append(due_until)
+    # with a range, let SQLite seek the (user_id, start_date|due_date) index;
+    # for the whole history ORDER BY id walks (user_id, id) and reads the table
+    # pages in rowid order instead of seeking randomly through a date index
+    order = "" if start_from or due_until else " ORDER BY id"
+    return f"SELECT {', '.join(columns)} FROM tasks WHERE {' AND '.join(where)}{order}", params
+
+
+def analytics_stats(user_id, today=None):
+    """Everything the Analytics page draws: task_summary plus the chart series."""
+    stats = task_summary(user_id, today)
+    stats["monthly_counts"] = monthly_counts(user_id)
+    stats["due_counts"] = due_date_counts(user_id)
+    return stats
+
+
+if __name__ == "__main__":
+    if "--rebuild" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--rebuild"]
+        db.migrate_schema_if_needed()
+        print(f"[DB] rollup rows differing from tasks: {db.check_task_rollup()}")
+        written = db.rebuild_task_rollup(int(args[0]) if args else None)
+        print(f"[DB] task_daily_rollup rebuilt: {written} row(s)")
+    else:
+        print(__doc__)
@@ -0,0 +1,339 @@
+"""
+Persistent task Tableview with row-level updates.
+The table is built once per page/filter; afterwards add/edit/delete only
+touch the affected row instead of rebuilding the whole widget.
+PagedTaskView shows one SQL page of tasks at a time (keyset pagination),
+so the widget only ever holds `page_size` rows however many tasks exist.
+"""
+import tkinter as tk
+import ttkbootstrap as ttk
+from ttkbootstrap.tableview import Tableview
+
+import db
+import db_executor
+import tasks
+import ui_scheduler
+
+# Task tables carry the task id in a hidden first column
+TASK_COLUMNS = ["ID", "Title", "Category", "Est. Time (min)", "Start Date", "Due Date", "Status"]
+
+# Treeview column name -> db.get_tasks_page sort key
+COLUMN_SORT_KEYS = {
+    "0": "id", "1": "title", "2": "category", "3": "estimated_minutes",
+    "4": "start_date", "5": "due_date", "6": "status",
+}
+
+PAGE_SIZE = 50
+
+# filter comboboxes of PagedTaskView ("All" = no filter)
+FILTER_CHOICES = {
+    "status": ["All", "In Progress", "Completed", "Overdue"],
+    "priority": ["All", "Low", "Medium", "High"],
+    "category": ["All", "Work", "Study", "Personal", "Other"],
+}
+
+
+def task_row_values(r):
+    # r: (id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes)
+    return [r[0], r[3], r[9], r[10], r[4], r[5], r[6]]
+
+
+def row_task_id(view, iid):
+    """Task id stored in the hidden ID column of a Treeview item, or None."""
+    values = view.item(iid)["values"]
+    try:
+        return int(values[0])
+    except (IndexError, TypeError, ValueError):
+        return None
+
+
+def _hashable(value):
+    """Filter value usable in a prefetch key: lists become tuples, sets sorted tuples."""
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class TaskTable:
+    """
+    Wraps a Tableview of full task rows (newest first) and keeps a
+    task id -> TableRow map so single rows can be inserted, updated or
+    removed in place.
+    """
+
+    def __init__(self, master, rows_full=(), **kwargs):
+        rows_full = list(rows_full)
+        kwargs.setdefault("paginated", False)
+        kwargs.setdefault("searchable", True)
+        self.table = Tableview(master=master, coldata=TASK_COLUMNS,
+                               rowdata=[task_row_values(r) for r in rows_full], **kwargs)
+        # hide the ID column; Tableview names its Treeview columns 0..n-1
+        self.view.configure(displaycolumns=list(self.view["columns"])[1:])
+        # Tableview keeps rowdata order, so rows line up with rows_full
+        self._rows = {r[0]: record for r, record in zip(rows_full, self.table.tablerows)}
+
+    @property
+    def view(self):
+        return self.table.view
+
+    def pack(self, **kwargs):
+        self.table.pack(**kwargs)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, task_id):
+        return task_id in self._rows
+
+    def load(self, rows_full):
+        """Replace every row with `rows_full` (used when paging)."""
+        table = self.table
+        for record in table.tablerows:
+            if self.view.exists(record.iid):
+                self.view.delete(record.iid)
+        table.tablerows.clear()
+        table.tablerows_filtered.clear()
+        table.tablerows_visible.clear()
+        table.iidmap.clear()
+        self._rows = {}
+        for r in rows_full:
+            self._rows[r[0]] = table.insert_row("end", task_row_values(r))
+        table.load_table_data()
+
+    def selected_task_id(self):
+        selected = self.view.selection()
+        return row_task_id(self.view, selected[0]) if selected else None
+
+    def insert(self, row_full):
+        """Add a new task row at the top."""
+        table = self.table
+        record = table.insert_row(0, task_row_values(row_full))
+        self._rows[row_full[0]] = record
+        if table.is_filtered:
+            # let the active search decide whether the row is visible
+            table.load_table_data()
+            return
+        record.build()
+        self.view.move(record.iid, "", 0)
+        table.tablerows_visible.insert(0, record)
+
+    def update(self, row_full):
+        """Replace the values of an existing task row (inserts if unknown)."""
+        record = self._rows.get(row_full[0])
+        if record is None:
+            self.insert(row_full)
+            return
+        # the setter refreshes the Treeview item in place
+        record.values = task_row_values(row_full)
+
+    def remove(self, task_id):
+        """Remove one task row without reloading the rest of the table."""
+        record = self._rows.pop(task_id, None)
+        if record is None:
+            return
+        table = self.table
+        for rows in (table.tablerows, table.tablerows_visible, table.tablerows_filtered):
+            if record in rows:
+                rows.remove(record)
+        if self.view.exists(record.iid):
+            table.iidmap.pop(record.iid, None)
+            self.view.delete(record.iid)
+
+
+class PagedTaskView(ttk.Frame):
+    """
+    One page of a user's tasks at a time, fetched with tasks.search_tasks
+    on the DB worker. Full-text search, the status / priority / category
+    filters and header sorting all run in SQL; Prev/Next walk
+    keyset cursors and the next page is prefetched while the current one
+    is shown. Exposes the same view / selected_task_id / update / remove
+    interface as TaskTable so the dashboard can patch single rows.
+    """
+
+    def __init__(self, master, user_id, page_size=PAGE_SIZE, **table_kwargs):
+        super().__init__(master)
+        self.user_id = user_id
+        self.page_size = page_size
+        self.sort = "id"
+        self.descending = True
+        self.search = ""
+        self.filters = {}
+        self._cursors = [None]      # cursor of every page up to the current one
+        self._next_cursor = None
+        self._prefetched = {}       # (cursor, sort, descending, search) -> Future
+        self._request = 0           # drops replies of superseded requests
+
+        bar = ttk.Frame(self)
+        bar.pack(fill="x", pady=(0, 6))
+        self.search_var = tk.StringVar()
+        entry = ttk.Entry(bar, textvariable=self.search_var, width=30)
+        entry.pack(side="left")
+        entry.bind("<Return>", lambda e: self.set_search(self.search_var.get()))
+        ttk.Button(bar, text="Search", bootstyle="secondary-outline",
+                   command=lambda: self.set_search(self.search_var.get())).pack(side="left", padx=(4, 0))
+
+        self.filter_vars = {}
+        for name, choices in FILTER_CHOICES.items():
+            var = tk.StringVar(value=choices[0])
+            combo = ttk.Combobox(bar, values=choices, textvariable=var, state="readonly", width=11)
+            combo.pack(side="left", padx=(6, 0))
+            combo.bind("<<ComboboxSelected>>", lambda e: self._filters_changed())
+            self.filter_vars[name] = var
+
+        self.next_btn = ttk.Button(bar, text="Next ▶", command=self.next_page, state="disabled")
+        self.next_btn.pack(side="right")
+        self.page_label = ttk.Label(bar, text="Page 1")
+        self.page_label.pack(side="right", padx=8)
+        self.prev_btn = ttk.Button(bar, text="◀ Prev", command=self.prev_page, state="disabled")
+        self.prev_btn.pack(side="right")
+
+        table_kwargs.setdefault("searchable", False)
+        self.table = TaskTable(self, (), **table_kwargs)
+        self.table.pack(fill="both", expand=True)
+        # replace Tableview's in-memory header sort with a SQL sort
+        self.view.bind("<Button-1>", self._header_click)
+
+        self._load()
+
+    @property
+    def view(self):
+        return self.table.view
+
+    @property
+    def page(self):
+        return len(self._cursors)
+
+    def selected_task_id(self):
+        return self.table.selected_task_id()
+
+    #  loading
+    def _key(self, cursor):
+        return (cursor, self.sort, self.descending, self.search, tuple(sorted(self.filters.items())))
+
+    def _fetch(self, cursor):
+        future = self._prefetched.pop(self._key(cursor), None)
+        if future is not None and not future.cancelled():
+            return future
+        return db_executor.submit(tasks.search_tasks, self.user_id, self.search or None,
+                                  limit=self.page_size, after=cursor, sort=self.sort,
+                                  descending=self.descending, **self.filters)
+
+    def _load(self):
+        self._request += 1
+        request = self._request
+        future = self._fetch(self._cursors[-1])
+        self.prev_btn.configure(state="disabled")
+        self.next_btn.configure(state="disabled")
+
+        def poll():
+            if not self.winfo_exists() or request != self._request:
+                return
+            if not future.done():
+                self.after(db_executor.POLL_MS, poll)
+                return
+            if future.exception() is not None:
+                print(f"[tasks.py] page load failed: {future.exception()}")
+                return
+            self._show(*future.result())
+
+        poll()
+
+    def _show(self, rows, next_cursor):
+        self.table.load(rows)
+        self._next_cursor = next_cursor
+        self.page_label.configure(text=f"Page {self.page}")
+        self.prev_btn.configure(state="normal" if self.page > 1 else "disabled")
+        self.next_btn.configure(state="normal" if next_cursor is not None else "disabled")
+        if next_cursor is not None and self._key(next_cursor) not in self._prefetched:
+            self._prefetched[self._key(next_cursor)] = self._fetch(next_cursor)
+
+    def reload(self, first_page=False):
+        """
+        Re-query the current page (or page 1), dropping prefetched pages.
+        Reloads requested in a burst (rapid edits, filter changes) share one query.
+        """
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        if first_page:
+            self._cursors = [None]
+        ui_scheduler.scheduler_for(self).request(("refresh-tasks", str(self)), self._load, owner=self)
+
+    def next_page(self):
+        if self._next_cursor is None:
+            return
+        self._cursors.append(self._next_cursor)
+        self._load()
+
+    def prev_page(self):
+        if len(self._cursors) > 1:
+            self._cursors.pop()
+            self._load()
+
+    def set_search(self, text):
+        self.search = text.strip()
+        self.reload(first_page=True)
+
+    def set_filters(self, **filters):
+        """Replace the structured filters (see tasks.search_tasks)."""
+        self.filters = {k: _hashable(v) for k, v in filters.items() if v not in (None, "")}
+        self.reload(first_page=True)
+
+    def _filters_changed(self):
+        self.set_filters(**{name: var.get() for name, var in self.filter_vars.items() if var.get() != "All"})
+
+    @property
+    def is_filtered(self):
+        return bool(self.search or self.filters)
+
+    def set_sort(self, key, descending=None):
+        if key not in db.TASK_SORT_KEYS:
+            return
+        if descending is None:
+            # clicking the active column flips the order
+            descending = not self.descending if key == self.sort else key == "id"
+        self.sort, self.descending = key, descending
+        self.reload(first_page=True)
+
+    def _header_click(self, event):
+        if self.view.identify_region(event.x, event.y) != "heading":
+            return
+        display_index = self.view.identify_column(event.x)  # "#1" = first displayed column
+        try:
+            cid = self.view["displaycolumns"][int(display_index[1:]) - 1]
+        except (ValueError, IndexError):
+            return
+        key = COLUMN_SORT_KEYS.get(str(cid))
+        if key:
+            self.set_sort(key)
+        return "break"
+
+    #  single-row changes
+    def update(self, row_full):
+        """
+        Apply an added/edited task. Rows on the current page are patched in
+        place; a new task goes on top of the default first page. Anything
+        else changes page boundaries, so the page is re-queried.
+        """
+        task_id = row_full[0]
+        default_view = self.page == 1 and self.sort == "id" and self.descending and not self.is_filtered
+        if task_id in self.table and self.sort == "id" and not self.is_filtered:
+            self.table.update(row_full)
+        elif task_id not in self.table and default_view:
+            self.table.insert(row_full)
+            if len(self.table) > self.page_size:
+                self.reload()
+                return
+        else:
+            self.reload()
+            return
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+
+    def remove(self, task_id):
+        """Drop a deleted task; re-queries so the page refills from the next one."""
+        self.table.remove(task_id)
+        self.reload()
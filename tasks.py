@@ -1,24 +1,67 @@
 """
 Wrapper around db task operations used by the UI.
+All queries go through db.connect(), which hands out pooled connections.
 Keeps backward-compatible function signatures.
 Adds safe delete and auto-cleanup helpers.
+Single tasks are read by id and never load a list; the Tasks page pages
+in SQL (search_tasks).
 """
 import db
 import datetime
 import sqlite3
 
-def get_tasks_rows(username):
+# shared with db_tuning.task_query_plans(), which checks they stay index-backed
+TASK_ID_BY_TITLE_START_SQL = ("SELECT id FROM tasks WHERE user_id = ? AND title = ? AND start_date = ? "
+                              "ORDER BY id DESC LIMIT 1")
+TASK_ID_BY_TITLE_SQL = "SELECT id FROM tasks WHERE user_id = ? AND title = ? ORDER BY id DESC LIMIT 1"
+DELETE_TASK_BY_ID_SQL = "DELETE FROM tasks WHERE id = ? AND user_id = ?"
+# the plain `due_date < ?` range lets SQLite use idx_tasks_due_status;
+# date(due_date) still rejects values that are not ISO dates
+AUTO_DELETE_OVERDUE_SQL = ("DELETE FROM tasks WHERE due_date < ? AND date(due_date) < date(?) "
+                           "AND (status IS NULL OR LOWER(status) != 'completed')")
+
+def get_tasks_rows_for_user(user_id):
     """
     Returns rows in the UI-friendly format.
     Legacy: [(title, start_date, due_date, status), ...]
     """
-    return db.get_tasks(username) or []
+    return db.get_tasks_for_user(user_id) or []
 
-def get_tasks_full_rows(username):
+def get_tasks_full_rows_for_user(user_id):
     """
     Return full rows with extended fields:
     [(id, user_id, username, title, start_date, due_date, status, description, priority, category, estimated_minutes), ...]
     """
+    return db.get_tasks_full_for_user(user_id) or []
+
+def get_task(user_id, task_id):
+    """Return one full row for the user's task id (by primary key), or None."""
+    return db.get_task_for_user(user_id, task_id)
+
+def search_tasks(user_id, text=None, status=None, priority=None, category=None,
+                 date_from=None, date_to=None, date_field="due_date",
+                 limit=50, after=None, sort="id", descending=True):
+    """
+    Search one user's tasks in SQL.
+    text is matched against title and description (full-text, word prefixes);
+    status / priority / category take a value or a list of values;
+    date_from / date_to ('YYYY-MM-DD', inclusive) apply to date_field.
+    Returns (full_rows, next_cursor) - pass next_cursor back as `after`
+    for the next page.
+    """
+    filters = {
+        "status": status, "priority": priority, "category": category,
+        "date_from": date_from, "date_to": date_to, "date_field": date_field,
+    }
+    return db.get_tasks_page(user_id, limit=limit, after=after, sort=sort,
+                             descending=descending, search=text, filters=filters)
+
+def get_tasks_rows(username):
+    """Username-based shim for get_tasks_rows_for_user."""
+    return db.get_tasks(username) or []
+
+def get_tasks_full_rows(username):
+    """Username-based shim for get_tasks_full_rows_for_user."""
     return db.get_tasks_full(username) or []
 
 def add_new_task(user_id, username, title, start_date, due_date, status="In Progress",
@@ -27,23 +70,36 @@ def add_new_task(user_id, username, title, start_date, due_date, status="In Prog
     Adds a new task. Accepts both the older signature (without extra fields)
     and the new one with description/priority/category/estimated_minutes.
     """
+    return create_task(user_id, username, title, start_date, due_date, status,
+                       description, priority, category, estimated_minutes) is not None
+
+def create_task(user_id, username, title, start_date, due_date, status="In Progress",
+                description=None, priority="Medium", category=None, estimated_minutes=0):
+    """Same as add_new_task but returns the new full row (None on failure)."""
     if not title:
-        return False
+        return None
 
     try:
-        return db.add_task(user_id, username, title, start_date, due_date, status,
-                           description, priority, category, estimated_minutes)
+        if user_id is None:
+            user_id = db.get_user_id(username)
+        start_date, due_date = db.normalize_date(start_date), db.normalize_date(due_date)
+        task_id = db.insert_task(user_id, username, title, start_date, due_date, status,
+                                 description, priority, category, estimated_minutes)
+        if task_id is None:
+            return None
+        return (task_id, user_id, username, title, start_date, due_date, status,
+                description, priority, category, estimated_minutes)
     except Exception as e:
         print(f"[tasks.py] add_new_task error: {e}")
-        return False
+        return None
 
 
 
 # Deletion helpers
 
-def get_task_id_by_username_title(username, title, start_date=None):
+def get_task_id_by_user_title(user_id, title, start_date=None):
     """
-    Find the most relevant task id for the given username + title.
+    Find the most relevant task id for the given user_id + title.
     If start_date is provided, prefer exact match on start_date.
     Returns task id int or None.
     """
@@ -51,27 +107,26 @@ def get_task_id_by_username_title(username, title, start_date=None):
         with db.connect() as conn:
             cur = conn.cursor()
             if start_date:
-                cur.execute("""
-                    SELECT id FROM tasks
-                    WHERE username = ? AND title = ? AND start_date = ?
-                    ORDER BY id DESC LIMIT 1
-                """, (username, title, start_date))
+                cur.execute(TASK_ID_BY_TITLE_START_SQL, (user_id, title, start_date))
                 r = cur.fetchone()
                 if r:
                     return r[0]
-            # fallback: match by username + title only
-            cur.execute("""
-                SELECT id FROM tasks
-                WHERE username = ? AND title = ?
-                ORDER BY id DESC LIMIT 1
-            """, (username, title))
+            # fallback: match by user_id + title only
+            cur.execute(TASK_ID_BY_TITLE_SQL, (user_id, title))
             r = cur.fetchone()
             if r:
                 return r[0]
     except Exception as e:
-        print(f"[tasks.py] get_task_id_by_username_title error: {e}")
+        print(f"[tasks.py] get_task_id_by_user_title error: {e}")
     return None
 
+def get_task_id_by_username_title(username, title, start_date=None):
+    """Username-based shim for get_task_id_by_user_title."""
+    user_id = db.get_user_id(username)
+    if user_id is None:
+        return None
+    return get_task_id_by_user_title(user_id, title, start_date)
+
 def delete_task_by_title(username, title):
     """
     Backwards-compatible delete by username+title.
@@ -91,54 +146,63 @@ def delete_task_by_title(username, title):
             # db.delete_task not present
             pass
 
-        tid = get_task_id_by_username_title(username, title)
-        if tid is None:
-            print(f"[tasks.py] delete_task_by_title: no task found for user={username}, title={title}")
-            return False
-        return delete_task_by_id(tid, username=username)
+        return safe_delete_task(username, title)
     except Exception as e:
         print(f"[tasks.py] delete_task_by_title error: {e}")
         return False
 
-def delete_task_by_id(task_id, username=None):
+def delete_task_by_id(task_id, username=None, user_id=None):
     """
     Delete a task by its id.
-    If username is provided, ensure the task belongs to that user.
+    If user_id (or, for older callers, username) is provided, ensure the task
+    belongs to that user.
     Returns True on success, False otherwise.
     """
     try:
+        if user_id is None and username:
+            user_id = db.get_user_id(username)
+            if user_id is None:
+                print(f"[tasks.py] delete_task_by_id: unknown user={username}")
+                return False
         with db.connect() as conn:
             cur = conn.cursor()
-            if username:
-                cur.execute("DELETE FROM tasks WHERE id = ? AND username = ?", (task_id, username))
+            if user_id is not None:
+                cur.execute(DELETE_TASK_BY_ID_SQL, (task_id, user_id))
             else:
                 cur.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            conn.commit()
             if cur.rowcount > 0:
-                print(f"[tasks.py] Deleted task id={task_id} (user={username})")
+                print(f"[tasks.py] Deleted task id={task_id} (user_id={user_id})")
                 return True
             else:
-                print(f"[tasks.py] delete_task_by_id: no rows deleted for id={task_id} (user={username})")
+                print(f"[tasks.py] delete_task_by_id: no rows deleted for id={task_id} (user_id={user_id})")
                 return False
     except Exception as e:
         print(f"[tasks.py] delete_task_by_id error: {e}")
         return False
 
-def safe_delete_task(username, title):
+def safe_delete_user_task(user_id, title, start_date=None):
     """
     Safe deletion wrapper used by UI code: finds the most relevant task for the user/title
     and deletes it. Returns True/False.
     This function does not prompt the user; the UI module should prompt before calling.
     """
     try:
-        tid = get_task_id_by_username_title(username, title)
+        tid = get_task_id_by_user_title(user_id, title, start_date)
         if not tid:
-            print(f"[tasks.py] safe_delete_task: could not find task for user={username}, title={title}")
+            print(f"[tasks.py] safe_delete_user_task: could not find task for user_id={user_id}, title={title}")
             return False
-        return delete_task_by_id(tid, username=username)
+        return delete_task_by_id(tid, user_id=user_id)
     except Exception as e:
-        print(f"[tasks.py] safe_delete_task error: {e}")
+        print(f"[tasks.py] safe_delete_user_task error: {e}")
+        return False
+
+def safe_delete_task(username, title):
+    """Username-based shim for safe_delete_user_task."""
+    user_id = db.get_user_id(username)
+    if user_id is None:
+        print(f"[tasks.py] safe_delete_task: unknown user={username}")
         return False
+    return safe_delete_user_task(user_id, title)
 
 def auto_delete_overdue(days=30):
     """
@@ -153,13 +217,8 @@ def auto_delete_overdue(days=30):
         with db.connect() as conn:
             cur = conn.cursor()
             # Only delete tasks that have a non-empty due_date and where due_date < cutoff
-            # and status is not 'Completed'
-            cur.execute("""
-                DELETE FROM tasks
-                WHERE due_date IS NOT NULL AND due_date != ''
-                  AND date(due_date) < date(?)
-                  AND (status IS NULL OR LOWER(status) != 'completed')
-            """, (cutoff,))
+            # and status is not 'Completed'.
+            cur.execute(AUTO_DELETE_OVERDUE_SQL, (cutoff, cutoff))
             deleted = cur.rowcount
             conn.commit()
         print(f"[tasks.py] auto_delete_overdue: deleted {deleted} tasks older than {cutoff}")
@@ -210,9 +269,10 @@ def update_task(*args, **kwargs):
             username_arg = args[1] if len(args) > 1 else None
             try:
                 tid = int(possible_id)
+                owner_id = db.get_user_id(username_arg)
                 with db.connect() as conn:
                     cur = conn.cursor()
-                    cur.execute("SELECT id FROM tasks WHERE id = ? AND username = ?", (tid, username_arg))
+                    cur.execute("SELECT id FROM tasks WHERE id = ? AND user_id = ?", (tid, owner_id))
                     found = cur.fetchone()
                     if found:
                         # Extract fields from positional args or kwargs
@@ -234,8 +294,8 @@ def update_task(*args, **kwargs):
 
                         # Safety defaults
                         title = title or ""
-                        start_date = start_date or ""
-                        due_date = due_date or ""
+                        start_date = db.normalize_date(start_date or "")
+                        due_date = db.normalize_date(due_date or "")
                         status = status or "In Progress"
                         estimated_minutes = int(estimated_minutes or 0)
 
@@ -243,8 +303,8 @@ def update_task(*args, **kwargs):
                             UPDATE tasks
                             SET title = ?, start_date = ?, due_date = ?, status = ?, 
                                 description = ?, priority = ?, category = ?, estimated_minutes = ?
-                            WHERE id = ? AND username = ?
-                        """, (title, start_date, due_date, status, description, priority, category, estimated_minutes, tid, username_arg))
+                            WHERE id = ? AND user_id = ?
+                        """, (title, start_date, due_date, status, description, priority, category, estimated_minutes, tid, owner_id))
                         conn.commit()
                         if cur.rowcount > 0:
                             print(f"[tasks.py] Updated task id={tid} for user={username_arg}")
@@ -283,19 +343,11 @@ def update_task(*args, **kwargs):
             with db.connect() as conn:
                 cur = conn.cursor()
                 # First try exact match with start_date
-                cur.execute("""
-                    SELECT id FROM tasks
-                    WHERE username = ? AND title = ? AND start_date = ?
-                    ORDER BY id DESC LIMIT 1
-                """, (username, title_old, new_start))
+                cur.execute(TASK_ID_BY_TITLE_START_SQL, (user_id, title_old, new_start))
                 row = cur.fetchone()
                 if not row:
-                    # fallback: match by username + title only
-                    cur.execute("""
-                        SELECT id FROM tasks
-                        WHERE username = ? AND title = ?
-                        ORDER BY id DESC LIMIT 1
-                    """, (username, title_old))
+                    # fallback: match by user_id + title only
+                    cur.execute(TASK_ID_BY_TITLE_SQL, (user_id, title_old))
                     row = cur.fetchone()
                 if not row:
                     print(f"[tasks.py] Could not find task to update for user={username}, title_old={title_old}")
@@ -305,8 +357,8 @@ def update_task(*args, **kwargs):
 
                 # final safety defaults
                 new_title = new_title or title_old
-                new_start = new_start or ""
-                new_due = new_due or ""
+                new_start = db.normalize_date(new_start or "")
+                new_due = db.normalize_date(new_due or "")
                 new_status = new_status or "In Progress"
                 estimated_minutes = int(estimated_minutes or 0)
 
@@ -314,8 +366,8 @@ def update_task(*args, **kwargs):
                     UPDATE tasks
                     SET title = ?, start_date = ?, due_date = ?, status = ?, 
                         description = ?, priority = ?, category = ?, estimated_minutes = ?
-                    WHERE id = ? AND username = ?
-                """, (new_title, new_start, new_due, new_status, description, priority, category, estimated_minutes, task_id, username))
+                    WHERE id = ? AND user_id = ?
+                """, (new_title, new_start, new_due, new_status, description, priority, category, estimated_minutes, task_id, user_id))
                 conn.commit()
                 if cur.rowcount > 0:
                     print(f"[tasks.py] ✅ Task (id={task_id}) updated for user={username}")
@@ -331,3 +383,37 @@ def update_task(*args, **kwargs):
     except Exception as e:
         print(f"[tasks.py] update_task error: {e}")
         return False
+
+def update_task_by_id(task_id, user_id, title, start_date, due_date, status="In Progress",
+                      description=None, priority=None, category=None, estimated_minutes=0):
+    """
+    Update one task by id, checking it belongs to user_id.
+    Used by the UI, which knows the task id from the table row.
+    Returns True/False.
+    """
+    try:
+        try:
+            estimated_minutes = int(estimated_minutes or 0)
+        except Exception:
+            estimated_minutes = 0
+        title = title or ""
+        start_date = db.normalize_date(start_date or "")
+        due_date = db.normalize_date(due_date or "")
+        status = status or "In Progress"
+
+        with db.connect() as conn:
+            cur = conn.execute("""
+                UPDATE tasks
+                SET title = ?, start_date = ?, due_date = ?, status = ?,
+                    description = ?, priority = ?, category = ?, estimated_minutes = ?
+                WHERE id = ? AND user_id = ?
+            """, (title, start_date, due_date, status, description, priority, category,
+                  estimated_minutes, task_id, user_id))
+        if cur.rowcount == 0:
+            print(f"[tasks.py] update_task_by_id: no task id={task_id} for user_id={user_id}")
+            return False
+        print(f"[tasks.py] Updated task id={task_id} for user_id={user_id}")
+        return True
+    except Exception as e:
+        print(f"[tasks.py] update_task_by_id error: {e}")
+        return False
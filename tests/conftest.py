@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db  # noqa: E402
+import db_pool  # noqa: E402
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """A migrated, empty worktracker database in tmp_path (db.DB_NAME points at it)."""
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "worktracker.db"))
+    db.migrate_schema_if_needed()
+    yield db.DB_NAME
+    db_pool.close_all()
@@ -0,0 +1,26 @@
+import db
+
+
+def test_focus_flush_moves_only_the_focus_version(temp_db):
+    with db.connect() as conn:
+        conn.execute("INSERT INTO users (id, username, password) VALUES (1, 'u', 'x')")
+    tasks_before = db.get_data_version(1)
+    assert db.get_focus_version(1) == 0
+
+    row = (1, None, "2024-01-01 09:00:00.000", "2024-01-01 09:01:00.000", 60)
+    db.save_focus_sessions([row])
+    db.save_focus_sessions([row[:3] + ("2024-01-01 09:02:00.000", 120)])  # upsert of the open session
+    assert db.get_focus_version(1) == 2
+    assert db.get_data_version(1) == tasks_before
+
+
+def test_old_focus_triggers_are_dropped(temp_db):
+    with db.connect() as conn:
+        conn.execute("""CREATE TRIGGER focus_version_ai AFTER INSERT ON focus_sessions BEGIN
+            INSERT INTO task_data_versions (user_id, version) VALUES (new.user_id, 1)
+            ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+        END""")
+    db.migrate_schema_if_needed()
+    with db.connect() as conn:
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert "focus_version_ai" not in names and "focus_data_version_ai" in names
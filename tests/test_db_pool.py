@@ -0,0 +1,56 @@
+import sqlite3
+import threading
+
+import pytest
+
+import db
+import db_pool
+import db_tuning
+
+
+def test_storage_settings_reach_connections_pooled_by_other_threads(temp_db, monkeypatch):
+    monkeypatch.setattr(db_pool, "CONNECTION_PRAGMAS", list(db_pool.CONNECTION_PRAGMAS))
+    monkeypatch.setattr(db_pool, "PRAGMA_VERSION", db_pool.PRAGMA_VERSION)
+    monkeypatch.setattr(db_tuning, "TUNED_PRAGMAS", [("cache_size", -12_345)])
+    pooled, applied, result = threading.Event(), threading.Event(), []
+
+    def worker():
+        # a long-lived thread (like the DB worker) that pooled a connection early
+        with db.connect() as early:
+            pass
+        pooled.set()
+        applied.wait()
+        with db.connect() as conn:
+            result.append((conn is early, conn.execute("PRAGMA cache_size").fetchone()[0]))
+        db_pool.close_all()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    pooled.wait()
+    db_tuning.apply_storage_settings()
+    applied.set()
+    thread.join()
+    assert result == [(False, -12_345)]
+
+    # applying the same set again keeps the pooled connections
+    version = db_pool.PRAGMA_VERSION
+    db_tuning.apply_storage_settings()
+    assert db_pool.PRAGMA_VERSION == version
+
+
+def test_failed_commit_is_raised_and_not_pooled(temp_db):
+    db_pool.close_all()
+    with db.connect() as conn:
+        conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.execute("CREATE TABLE child (parent_id INTEGER REFERENCES parent (id) "
+                     "DEFERRABLE INITIALLY DEFERRED)")
+    db_pool.close_all()
+    opened = db_pool.stats()["opened"]
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.connect() as conn:
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("INSERT INTO child (parent_id) VALUES (42)")  # checked at COMMIT
+    assert db_pool._idle_lists().get(temp_db) == []
+    with db.connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM child").fetchone()[0] == 0
+    assert db_pool.stats()["opened"] == opened + 2
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import analytics_cache
+import db
+import focus_sessions
+import task_stats
+from focus_timer import TimerEngine
+
+TODAY = "2024-03-31"
+
+
+def make_recorder():
+    clock = [0.0]
+    timer = TimerEngine(clock=lambda: clock[0], schedule=lambda ms, cb: 1, cancel=lambda i: None)
+    recorder = focus_sessions.FocusRecorder(
+        now=lambda: datetime(2024, 3, 31, 9) + timedelta(seconds=clock[0]))
+    recorder.bind(timer, 1)
+    return timer, clock, recorder
+
+
+def focus_today():
+    computed = []
+
+    def compute():
+        computed.append(1)
+        return task_stats.focus_totals(1, TODAY)
+
+    totals = analytics_cache.cached("focus_totals", 1, analytics_cache.focus_version(1), compute, TODAY)
+    return totals["today"], bool(computed)
+
+
+def test_recorded_session_moves_only_the_focus_version(temp_db):
+    with db.connect() as conn:
+        conn.execute("INSERT INTO users (id, username, password) VALUES (1, 'u', 'x')")
+    tasks_before = db.get_data_version(1)
+    timer, clock, recorder = make_recorder()
+
+    timer.start()
+    clock[0] += 90
+    timer.pause()            # closes the session and hands it to the DB worker
+    recorder.flush(wait=True)
+    assert recorder.rows_written == 1
+    assert db.get_focus_version(1) == 1
+    assert db.get_data_version(1) == tasks_before
+
+
+def test_focus_totals_follow_the_focus_version(temp_db):
+    with db.connect() as conn:
+        conn.execute("INSERT INTO users (id, username, password) VALUES (1, 'u', 'x')")
+    analytics_cache.forget_user(1)
+    timer, clock, recorder = make_recorder()
+    assert focus_today() == (0, True)
+    assert focus_today() == (0, False)   # unchanged version: served from memory
+
+    # a running session is upserted every FLUSH_INTERVAL_S
+    timer.start()
+    clock[0] += focus_sessions.FLUSH_INTERVAL_S
+    timer._tick(timer._generation)
+    recorder.flush(wait=True)
+    assert focus_today() == (focus_sessions.FLUSH_INTERVAL_S, True)
+
+    clock[0] += 30
+    recorder.close(timer)
+    assert focus_today() == (focus_sessions.FLUSH_INTERVAL_S + 30, True)
+    assert focus_today() == (focus_sessions.FLUSH_INTERVAL_S + 30, False)
+    analytics_cache.forget_user(1)
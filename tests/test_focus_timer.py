@@ -0,0 +1,112 @@
+from focus_timer import TimerEngine
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeAfter:
+    """after()/after_cancel() stand-in: callbacks run only when fire() is called."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.delays = []
+        self.next_id = 0
+
+    def schedule(self, ms, callback):
+        self.next_id += 1
+        self.jobs[self.next_id] = callback
+        self.delays.append(ms)
+        return self.next_id
+
+    def cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def fire(self):
+        jobs, self.jobs = self.jobs, {}
+        for callback in jobs.values():
+            callback()
+
+
+class FakeLabel:
+    def __init__(self):
+        self.viewable = True
+        self.texts = []
+
+    def config(self, text):
+        self.texts.append(text)
+
+    def winfo_viewable(self):
+        return self.viewable
+
+
+def make_timer():
+    clock, after, label = FakeClock(), FakeAfter(), FakeLabel()
+    timer = TimerEngine(clock=clock, schedule=after.schedule, cancel=after.cancel)
+    timer.label = label
+    return timer, clock, after, label
+
+
+def test_ticks_land_on_whole_seconds():
+    timer, clock, after, _ = make_timer()
+    timer.start()
+    assert after.delays[-1] == 1001
+    for late in (0.015, 0.2, 0.999):
+        # the tick fires late; the next one is aimed at the following boundary
+        clock.now += after.delays[-1] / 1000 + late
+        after.fire()
+        next_boundary = int(timer.elapsed()) + 1
+        assert timer.elapsed() + after.delays[-1] / 1000 >= next_boundary
+        assert timer.elapsed() + after.delays[-1] / 1000 < next_boundary + 0.002
+
+
+def test_stale_tick_is_ignored_after_pause_and_reset():
+    timer, clock, after, label = make_timer()
+    timer.start()
+    stale = list(after.jobs.values())
+    clock.now += 1.5
+    timer.pause()
+    assert after.jobs == {}
+    updates = len(label.texts)
+    stale[0]()
+    assert timer.ticks == 0 and len(label.texts) == updates and after.jobs == {}
+
+    timer.start()
+    stale = list(after.jobs.values())
+    timer.reset()
+    stale[0]()
+    assert timer.ticks == 0 and after.jobs == {}
+    assert timer.elapsed() == 0
+
+
+def test_label_untouched_while_not_viewable():
+    timer, clock, after, label = make_timer()
+    timer.start()
+    label.viewable = False
+    updates = len(label.texts)
+    for _ in range(5):
+        clock.now += 1.0
+        after.fire()
+    assert timer.ticks == 5
+    assert len(label.texts) == updates
+
+    label.viewable = True
+    timer._on_map()
+    assert label.texts[-1] == "00:00:05"
+
+
+def test_wall_clock_step_does_not_change_elapsed(monkeypatch):
+    import time
+    assert TimerEngine().clock is time.monotonic
+    timer, clock, after, _ = make_timer()
+    timer.start()
+    clock.now += 90
+    monkeypatch.setattr(time, "time", lambda: 0.0)  # wall clock set back to 1970
+    assert timer.elapsed() == 90
+    timer.pause()
+    monkeypatch.setattr(time, "time", lambda: 4e9)
+    assert timer.elapsed() == 90
@@ -0,0 +1,18 @@
+import gradient
+
+TOP, BOTTOM = (75, 110, 245), (10, 20, 30)
+
+
+def test_image_has_the_exact_size_and_ends_on_the_bottom_colour():
+    for width, height in [(700, 401), (1000, 600), (30, 10)]:
+        img = gradient.gradient_image(width, height, TOP, BOTTOM)
+        assert img.size == (width, height)
+        assert img.getpixel((0, 0)) == TOP
+        assert img.getpixel((width - 1, height - 1)) == BOTTOM
+
+
+def test_nearby_heights_share_one_cached_column():
+    gradient.images.clear()
+    gradient.gradient_image(700, 401, TOP, BOTTOM)
+    gradient.gradient_image(640, 440, TOP, BOTTOM)
+    assert len(gradient.images) == 1
@@ -0,0 +1,24 @@
+import db
+
+
+def test_data_migrations_run_once_per_database(temp_db, monkeypatch):
+    with db.connect() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(db.DATA_MIGRATIONS)
+
+    ran = []
+    monkeypatch.setattr(db, "DATA_MIGRATIONS", db.DATA_MIGRATIONS + [lambda: ran.append(1)])
+    db.migrate_schema_if_needed()
+    db.migrate_schema_if_needed()
+    assert ran == [1]
+
+
+def test_old_rows_are_fixed_on_first_migration(temp_db):
+    with db.connect() as conn:
+        conn.execute("INSERT INTO users (id, username, password) VALUES (7, 'old', 'x')")
+        conn.execute("INSERT INTO tasks (username, title, start_date, due_date) "
+                     "VALUES ('old', 't', '03/01/2024', '2024/03/05')")
+        conn.execute("PRAGMA user_version = 0")
+    db.migrate_schema_if_needed()
+    with db.connect() as conn:
+        row = conn.execute("SELECT user_id, start_date, due_date FROM tasks").fetchone()
+    assert row == (7, "2024-03-01", "2024-03-05")
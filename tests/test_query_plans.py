@@ -0,0 +1,25 @@
+import db_tuning
+
+
+def test_plan_list_covers_the_shared_queries(temp_db):
+    names = [name for name, _, _ in db_tuning.task_query_plans()]
+    assert len(names) == len(set(names))
+    assert {"get_tasks_page", "search_tasks_text", "open_analytics_range", "focus_totals"} <= set(names)
+
+
+def test_no_hot_query_does_a_full_scan(temp_db):
+    assert db_tuning.find_full_scans() == {}
+
+
+def test_full_scan_is_reported(temp_db):
+    offenders = db_tuning.find_full_scans([("by_description", "SELECT id FROM tasks WHERE description = ?", ("x",))])
+    assert list(offenders) == ["by_description"]
+
+
+def test_keyset_pages_read_in_index_order(temp_db):
+    names = [name for name, _, _ in db_tuning.task_query_plans()
+             if name.startswith(db_tuning.SORTED_PAGE_PREFIX)]
+    assert "get_tasks_page_by_due_1" in names
+    sorted_page = ("get_tasks_page_by_title",
+                   "SELECT id FROM tasks WHERE user_id = ? ORDER BY COALESCE(title, ''), id LIMIT 51", (1,))
+    assert list(db_tuning.find_full_scans([sorted_page])) == ["get_tasks_page_by_title"]
@@ -0,0 +1,26 @@
+import db
+
+
+def _walk(sort, descending):
+    ids, after = [], None
+    while True:
+        rows, after = db.get_tasks_page(1, limit=3, after=after, sort=sort, descending=descending)
+        ids += [r[0] for r in rows]
+        if after is None:
+            return ids
+
+
+def test_pages_walk_every_task_once_with_nulls_at_the_ends(temp_db):
+    with db.connect() as conn:
+        conn.execute("INSERT INTO users (id, username, password) VALUES (1, 'u', 'x')")
+        dues = ["2024-01-03", None, "2024-01-01", "2024-01-03", None, "", "2024-01-02", None, "2024-01-01"]
+        conn.executemany("INSERT INTO tasks (user_id, username, title, due_date) VALUES (1, 'u', 't', ?)",
+                         [(d,) for d in dues])
+        tasks = conn.execute("SELECT id, due_date FROM tasks").fetchall()
+
+    values = sorted((t for t in tasks if t[1] is not None), key=lambda t: (t[1], t[0]))
+    nulls = sorted(t for t in tasks if t[1] is None)
+    ascending = [t[0] for t in nulls + values]
+    assert _walk("due_date", descending=False) == ascending
+    assert _walk("due_date", descending=True) == ascending[::-1]
+    assert _walk("id", descending=True) == sorted((t[0] for t in tasks), reverse=True)
@@ -0,0 +1,12 @@
+from task_table import PagedTaskView
+
+
+def test_list_and_set_filters_give_a_hashable_page_key():
+    view = PagedTaskView.__new__(PagedTaskView)  # no Tk needed for the key
+    view.sort, view.descending, view.search = "id", True, ""
+    view.reload = lambda first_page=False: None
+    view.set_filters(status=["Pending", "Completed"], priority={"Low", "High"}, category="Work")
+    assert view.filters == {"status": ("Pending", "Completed"), "priority": ("High", "Low"),
+                            "category": "Work"}
+    prefetched = {view._key(None): "page"}
+    assert prefetched[view._key(None)] == "page"
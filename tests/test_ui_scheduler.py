@@ -0,0 +1,102 @@
+import pytest
+
+import ui_scheduler
+from ui_scheduler import UIScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWidget:
+    """after()/after_cancel() stand-in; advance(ms) fires what is due."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.alive = True
+        self.jobs = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.jobs[self.next_id] = (self.clock.now + ms / 1000, callback)
+        return self.next_id
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def winfo_exists(self):
+        return self.alive
+
+    def advance(self, ms):
+        self.clock.now += ms / 1000
+        for job_id, (due, callback) in sorted(self.jobs.items(), key=lambda j: j[1][0]):
+            if due <= self.clock.now + 1e-9 and self.jobs.pop(job_id, None):
+                callback()
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ui_scheduler.time, "monotonic", clock)
+    widget = FakeWidget(clock)
+    return UIScheduler(widget), widget
+
+
+def test_burst_of_requests_runs_once_with_the_latest_arguments(scheduler):
+    sched, widget = scheduler
+    calls = []
+    for page in range(5):
+        sched.request("navigate", calls.append, page)
+    assert len(widget.jobs) == 1
+    widget.advance(20)
+    assert calls == [4]
+    assert (sched.runs, sched.coalesced) == (1, 4)
+    assert not sched.pending("navigate")
+
+
+def test_destroyed_owner_is_skipped(scheduler):
+    sched, widget = scheduler
+    calls = []
+    owner = FakeWidget(widget.clock)
+    sched.request(("refresh-tasks", "view"), calls.append, "stale", owner=owner)
+    owner.alive = False
+    widget.advance(20)
+    assert calls == [] and sched.runs == 0
+
+
+def test_debounce_waits_for_the_burst_to_settle(scheduler):
+    sched, widget = scheduler
+    calls = []
+    for size in range(3):
+        sched.request("resize", calls.append, size, delay_ms=100)
+        widget.advance(50)
+    assert calls == []
+    widget.advance(60)
+    assert calls == [2]
+
+
+def test_due_jobs_run_in_one_tick_by_priority(scheduler):
+    sched, widget = scheduler
+    calls = []
+    sched.request("background", calls.append, "low", priority=ui_scheduler.PRIORITY_LOW)
+    sched.request("refresh", calls.append, "normal")
+    sched.request("navigate", calls.append, "high", priority=ui_scheduler.PRIORITY_HIGH)
+    widget.advance(20)
+    assert calls == ["high", "normal", "low"]
+
+
+def test_throttle_drops_a_repeated_click_and_cancel_drops_pending(scheduler):
+    sched, widget = scheduler
+    calls = []
+    assert sched.request("navigate", calls.append, "tasks", throttle_ms=400)
+    widget.advance(20)
+    assert not sched.request("navigate", calls.append, "tasks", throttle_ms=400)
+    assert sched.request("navigate", calls.append, "overview", throttle_ms=400)
+    assert sched.cancel("navigate")
+    widget.advance(500)
+    assert calls == ["tasks"] and sched.dropped == 1
@@ -0,0 +1,160 @@
+"""
+Coalescing scheduler on top of Tk after().
+Work is requested under a key ("navigate", ("refresh-tasks", view), ...).
+A key has at most one pending callback: asking again replaces the
+callback and its arguments, so a burst of requests runs once with the
+latest state. All due callbacks run together in one after() tick, at
+most one tick per frame, highest priority first.
+
+    scheduler_for(widget).request("navigate", show_tasks, uid, name, frame,
+                                  priority=PRIORITY_HIGH)
+"""
+import itertools
+import time
+
+#  SETTINGS
+FRAME_MS = 16
+
+# priorities: higher runs first within a tick
+PRIORITY_HIGH = 10      # page switches the user is waiting for
+PRIORITY_NORMAL = 0     # data refreshes
+PRIORITY_LOW = -10      # cosmetic redraws (backgrounds)
+
+
+class _Job:
+    __slots__ = ("key", "callback", "args", "priority", "due", "seq", "owner", "throttle")
+
+    def __init__(self, key, callback, args, priority, due, seq, owner, throttle):
+        self.key = key
+        self.callback = callback
+        self.args = args
+        self.priority = priority
+        self.due = due
+        self.seq = seq
+        self.owner = owner
+        self.throttle = throttle
+
+
+def _exists(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
+
+
+class UIScheduler:
+    def __init__(self, widget, frame_ms=FRAME_MS):
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self._jobs = {}
+        self._last_run = {}     # throttled key -> (monotonic time, callback, args)
+        self._seq = itertools.count()
+        self._after_id = None
+        self._tick_due = None
+        self._last_tick = 0.0
+        self.runs = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def request(self, key, callback, *args, priority=PRIORITY_NORMAL, delay_ms=0,
+                throttle_ms=0, owner=None):
+        """
+        Run callback(*args) on a coming tick, replacing whatever is pending
+        under `key`.
+        delay_ms     debounce: run only once no new request came for this long
+        throttle_ms  drop the request if the same callback/args ran under
+                     `key` less than this long ago (double clicks)
+        owner        widget; the callback is skipped if it has been destroyed
+        Returns False if the request was dropped.
+        """
+        now = time.monotonic()
+        if throttle_ms and key not in self._jobs:
+            last = self._last_run.get(key)
+            if last and now - last[0] < throttle_ms / 1000 and last[1:] == (callback, args):
+                self.dropped += 1
+                return False
+        due = now + delay_ms / 1000
+        previous = self._jobs.get(key)
+        if previous is not None:
+            self.coalesced += 1
+            if not delay_ms:
+                due = min(due, previous.due)  # no debounce: keep the earlier slot
+        self._jobs[key] = _Job(key, callback, args, priority, due, next(self._seq), owner,
+                               bool(throttle_ms))
+        self._arm()
+        return True
+
+    def cancel(self, key):
+        """Drop the pending request under `key`; True if there was one."""
+        job = self._jobs.pop(key, None)
+        self._arm()
+        return job is not None
+
+    def cancel_all(self):
+        self._jobs.clear()
+        self._arm()
+
+    def pending(self, key):
+        return key in self._jobs
+
+    def flush(self):
+        """Run everything pending now, regardless of delays."""
+        self._run(list(self._jobs.values()))
+        self._arm()
+
+    #  internals
+    def _arm(self):
+        if not self._jobs:
+            self._cancel_tick()
+            return
+        now = time.monotonic()
+        # never more than one tick per frame
+        at = max(min(job.due for job in self._jobs.values()), self._last_tick + self.frame_ms / 1000)
+        if self._after_id is not None and self._tick_due <= at:
+            return
+        self._cancel_tick()
+        if not _exists(self.widget):
+            self._jobs.clear()
+            return
+        self._tick_due = at
+        self._after_id = self.widget.after(max(1, int((at - now) * 1000 + 0.999)), self._tick)
+
+    def _cancel_tick(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._tick_due = None
+
+    def _tick(self):
+        self._after_id = None
+        self._tick_due = None
+        now = time.monotonic()
+        self._last_tick = now
+        self._run([job for job in self._jobs.values() if job.due <= now + 0.001])
+        self._arm()
+
+    def _run(self, jobs):
+        for job in jobs:
+            self._jobs.pop(job.key, None)
+        for job in sorted(jobs, key=lambda j: (-j.priority, j.seq)):
+            if job.owner is not None and not _exists(job.owner):
+                continue
+            if job.throttle:
+                self._last_run[job.key] = (time.monotonic(), job.callback, job.args)
+            self.runs += 1
+            try:
+                job.callback(*job.args)
+            except Exception as e:
+                print(f"[ui_scheduler] {job.key} failed: {e}")
+
+
+def scheduler_for(widget):
+    """The scheduler of `widget`'s toplevel window (created on first use)."""
+    top = widget.winfo_toplevel()
+    scheduler = getattr(top, "ui_scheduler", None)
+    if scheduler is None:
+        scheduler = top.ui_scheduler = UIScheduler(top)
+    return scheduler